@@ -30,7 +30,10 @@ sudo PIP_BREAK_SYSTEM_PACKAGES=1 python3 -m pip install -e /opt/mathworks/mwplat
 # Install cluster_management package
 echo "Installing cluster_management package"
 sudo cp -R /tmp/runtime/cluster_management/ /opt/mathworks/
+sudo rm -rf /opt/mathworks/cluster_management/tests
 sudo chmod +x /opt/mathworks/cluster_management/cluster_management.py
+sudo chmod +x /opt/mathworks/cluster_management/reservations.py
+sudo chmod +x /opt/mathworks/cluster_management/control_socket.py
 sudo chmod +x /opt/mathworks/cluster_management/terminationpolicies/mjs_status_scripts/busy
 sudo chmod +x /opt/mathworks/cluster_management/terminationpolicies/mjs_status_scripts/idle
 
@@ -39,10 +42,17 @@ echo "Installing spotinstances package"
 sudo cp -R /tmp/runtime/spotinstances/ /opt/mathworks/
 sudo chmod +x /opt/mathworks/spotinstances/handle_instance_interruption.py
 
+# Install workerstatus package
+echo "Installing workerstatus package"
+sudo cp -R /tmp/runtime/workerstatus/ /opt/mathworks/
+sudo chmod +x /opt/mathworks/workerstatus/worker_status_agent.py
+sudo chmod +x /opt/mathworks/workerstatus/worker_status_listener.py
+
 # Configure the service and timer.
 echo "Configuring the service and timer"
-sudo cp /var/tmp/config/cluster_management/clustermanagement.{service,timer} /etc/systemd/system/
+sudo cp /var/tmp/config/cluster_management/clustermanagement{.service,.timer,-daemon.service} /etc/systemd/system/
 sudo cp /var/tmp/config/spotinstances/spotinstances.{service,timer} /etc/systemd/system/
+sudo cp /var/tmp/config/workerstatus/workerstatus{agent,listener}.service /etc/systemd/system/
 
 # Install NFS scripts
 echo "Installing NFS scripts"
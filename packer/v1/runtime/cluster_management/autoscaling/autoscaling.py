@@ -1,29 +1,47 @@
 #!/usr/bin/env python3
 
-# Copyright 2022-2025 The MathWorks, Inc.
+# Copyright 2022-2026 The MathWorks, Inc.
+
+from typing import Callable
 
 from mwplatforminterfaces import CloudInterface
 from mwplatforminterfaces import OSInterface
 
-from autoscaling import capacity_control
-from autoscaling import health_check
-from autoscaling import scale_in_protection
+from autoscaling import reconciler
+from autoscaling import shadow
+from cluster_management_interface import ClusterManagementProgramInterface
+from constants import SHADOW_POLICIES, SHADOW_EVALUATION
 
 import logging
 
 logger = logging.getLogger("cluster_management.autoscaling")
 
 
-def main(cloud_interface: CloudInterface, os_interface: OSInterface) -> int:
+def main(
+    cloud_interface: CloudInterface,
+    os_interface: OSInterface,
+    cluster_management_interface: ClusterManagementProgramInterface,
+    on_plan: Callable = None,
+) -> int:
     """Execute autoscaling routine.
 
-    The routine has three stages:
-        1. Capacity control: Update the cloud platform's desired capacity and
-           MJS max capacity.
-        2. Health check: Identifies nodes in an unhealthy state and requests
-           their termination.
-        3. Scale-in protection: Ensures that we do not terminate nodes with
-           ongoing work.
+    The routine reconciles the cluster with its target state in three stages:
+        1. Observe: Read the cloud platform and job managers state once and
+           join it into a single view.
+        2. Plan: Compute the target capacities and the target state of each
+           node. The capacities follow the job managers' demand, unhealthy
+           nodes are recovered in place or replaced, and idle nodes above the
+           desired capacity are drained. Nodes with ongoing work are kept.
+        3. Apply: Issue the minimal set of batched operations reaching the
+           target state.
+
+    Candidate scaling policies configured in shadow_policies are planned on
+    the same view between the Plan and Apply stages. Their decisions are only
+    logged and projected, never applied.
+
+    Args:
+        on_plan (Callable): Called with the view and the plan once the plan
+        is computed.
 
     Returns:
         status (int): Status code of program.
@@ -32,16 +50,56 @@ def main(cloud_interface: CloudInterface, os_interface: OSInterface) -> int:
                         2: Faced an issue with cluster
                         3: Faced an issue with both
     """
-    logger.info("# Starting capacity control")
-    status_cc = capacity_control.main(cloud_interface, os_interface)
-    logger.info("# Finished capacity control: %s", status_cc)
+    logger.info("# Reading cluster state")
+    view, status = reconciler.build_view(
+        cloud_interface, os_interface, cluster_management_interface
+    )
+    if view is None:
+        return status
+
+    logger.info("# Planning target state")
+    plan = reconciler.plan(view)
+    logger.info(
+        "Plan: maximum workers %s, desired nodes %s, %s",
+        plan.maximum_workers,
+        plan.desired_nodes,
+        {
+            action: len(plan.nodes_with_action(action))
+            for action in (
+                reconciler.NODE_KEEP,
+                reconciler.NODE_DRAIN,
+                reconciler.NODE_RECOVER,
+                reconciler.NODE_REPLACE,
+            )
+        },
+    )
+
+    if on_plan is not None:
+        on_plan(view, plan)
 
-    logger.info("# Starting health check")
-    status_hc = health_check.main(cloud_interface, os_interface)
-    logger.info("# Finished health check: %s", status_hc)
+    shadow_policies = cluster_management_interface.cluster_management_config[
+        SHADOW_POLICIES
+    ]
+    if shadow_policies:
+        logger.info("# Evaluating shadow policies")
+        cluster_management_interface.update_state(
+            {
+                SHADOW_EVALUATION: shadow.evaluate(
+                    view,
+                    plan,
+                    shadow_policies,
+                    cluster_management_interface.cluster_management_config,
+                    cluster_management_interface.cluster_management_state[
+                        SHADOW_EVALUATION
+                    ],
+                )
+            }
+        )
 
-    logger.info("# Starting scale-in protection")
-    status_sp = scale_in_protection.main(cloud_interface, os_interface)
-    logger.info("# Finished scale-in protection: %s", status_sp)
+    logger.info("# Applying plan")
+    status = reconciler.apply(
+        plan, view, cloud_interface, os_interface, cluster_management_interface
+    )
+    logger.info("# Finished applying plan: %s", status)
 
-    return max(status_cc, status_hc, status_sp)
+    return status
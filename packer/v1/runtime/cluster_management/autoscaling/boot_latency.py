@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+import logging
+from math import ceil
+from typing import Dict
+
+from mwplatforminterfaces import ClusterModel
+
+logger = logging.getLogger("cluster_management.autoscaling.boot_latency")
+
+# Boot latency used until a node boot has been measured
+DEFAULT_BOOT_LATENCY_SECONDS = 300
+
+# Number of boot latency samples kept
+BOOT_LATENCY_SAMPLES = 50
+
+# Nodes that have not registered this long after their launch are no longer
+# followed
+BOOT_LATENCY_MAX_SECONDS = 3600
+
+
+def update_boot_latency(boot_latency: Dict, nodes: ClusterModel, now: float) -> Dict:
+    """Measure the time nodes take from their launch until their workers
+    register with a job manager.
+
+    Nodes seen unregistered are followed until they register, at which point
+    the time since their launch is recorded as a sample. The sample is precise
+    to the interval between two runs. Only the first registration of a node
+    is a boot: nodes already registered when first seen, and nodes that
+    register again after a recovery, are not sampled.
+
+    Args:
+        boot_latency (Dict): Boot latency state, with the launch time of the
+        followed nodes ("pending"), the ids of the nodes that already
+        registered ("registered") and the latest samples ("samples").
+        nodes (ClusterModel): Worker nodes records.
+        now (float): Current time in seconds since the epoch.
+
+    Returns:
+        boot_latency (Dict): Updated boot latency state.
+    """
+    pending = dict(boot_latency.get("pending", {}))
+    registered = set(boot_latency.get("registered", []))
+    samples = list(boot_latency.get("samples", []))
+
+    for record in nodes:
+        if record.instance_id is None or record.launch_time is None:
+            continue
+
+        launched_at = record.launch_time.timestamp()
+        if not record.registered:
+            if (
+                record.instance_id not in registered
+                and now - launched_at < BOOT_LATENCY_MAX_SECONDS
+            ):
+                pending.setdefault(record.instance_id, launched_at)
+            continue
+
+        if record.instance_id in pending:
+            sample = now - pending.pop(record.instance_id)
+            logger.debug("Node %s registered %ds after launch", record.hostname, sample)
+            samples.append(round(sample))
+        registered.add(record.instance_id)
+
+    # Forget nodes that were terminated or never registered
+    pending = {
+        instance_id: launched_at
+        for instance_id, launched_at in pending.items()
+        if nodes.by_id(instance_id) is not None
+        and now - launched_at < BOOT_LATENCY_MAX_SECONDS
+    }
+
+    return {
+        "pending": pending,
+        "registered": sorted(
+            instance_id for instance_id in registered if nodes.by_id(instance_id) is not None
+        ),
+        "samples": samples[-BOOT_LATENCY_SAMPLES:],
+    }
+
+
+def get_boot_latency_seconds(boot_latency: Dict, percentile: float = 50) -> int:
+    """Get a percentile of the measured boot latencies.
+
+    Args:
+        boot_latency (Dict): Boot latency state.
+        percentile (float): Percentile between 0 and 100.
+
+    Returns:
+        seconds (int): Boot latency, DEFAULT_BOOT_LATENCY_SECONDS if no boot
+        was measured yet.
+    """
+    samples = sorted(boot_latency.get("samples", []))
+    if not samples:
+        return DEFAULT_BOOT_LATENCY_SECONDS
+
+    # Nearest-rank percentile
+    rank = max(ceil(percentile / 100 * len(samples)), 1)
+    return samples[min(rank, len(samples)) - 1]
@@ -1,115 +1,246 @@
 #!/usr/bin/env python3
 
-# Copyright 2021-2025 The MathWorks, Inc.
+# Copyright 2021-2026 The MathWorks, Inc.
 from math import ceil
 import logging
+from typing import Dict, Tuple
 
-from mwplatforminterfaces import CloudInterface
-from mwplatforminterfaces import OSInterface
-
-from constants import (
-    STATUS_SUCCESS,
-    STATUS_CLOUD_ISSUE,
-    STATUS_CLUSTER_ISSUE,
-    STATUS_CLOUD_AND_CLUSTER_ISSUE,
-)
+from mwplatforminterfaces.cloud_interface import CloudCapacity
+from mwplatforminterfaces.os_interface import ClusterCapacity
 
 logger = logging.getLogger("cluster_management.autoscaling.capacity_control")
 
 
-def main(cloud_interface: CloudInterface, os_interface: OSInterface) -> int:
-    """Execute capacity control routine.
-
-    The routine adjusts the capacities so that they match:
-        - The cluster's maximum number of workers changes depending on
-          the cloud-computing platform's maximum number of nodes.
-        - The cloud's desired number of nodes changes depending on the
-          cluster's desired number of workers.
+def get_capacity_targets(
+    pools_capacity: Dict[str, CloudCapacity],
+    cluster_capacity: ClusterCapacity,
+    pools_desired_workers: Dict[str, int],
+) -> Tuple[int, Dict[str, int]]:
+    """Compute the capacities the cloud platform and the job managers should
+    be set to so that they match:
+        - The maximum number of workers of each job manager changes
+          depending on the maximum number of nodes of the worker pools.
+        - The desired number of nodes of each worker pool changes depending
+          on the share of the job managers' desired workers it was given.
 
     Args:
-        cloud_interface (CloudInterface): Cloud provider specific
-        implementation of AbstractCloudInterface.
-        os_interface (OSInterface): Operating system specific implementation
-        of AbstractOSInterface.
+        pools_capacity (Dict[str, CloudCapacity]): Cloud-computing platform
+        capacity info keyed by pool name.
+        cluster_capacity (ClusterCapacity): Job managers' worker limits.
+        pools_desired_workers (Dict[str, int]): Desired number of workers
+        keyed by pool name.
 
     Returns:
-        status (int): Status code of program.
-                        0: Successful
-                        1: Faced an issue with cloud provider
-                        2: Faced an issue with cluster
-                        3: Faced an issue with both
+        maximum_workers (int): Maximum number of workers of each job manager,
+        or None if it is already set.
+        desired_nodes (Dict[str, int]): Desired number of nodes of the pools
+        that do not match it yet, keyed by pool name.
     """
-    # Retrieving capacity information
-    cloud_capacity = cloud_interface.get_cloud_capacity()
-    if cloud_capacity is None:
-        logger.error("There was an issue retrieving cloud capacities, exiting.")
-        return STATUS_CLOUD_ISSUE
-
-    logger.debug("Current cloud capacities: %s", cloud_capacity)
-
-    cluster_capacity = os_interface.get_cluster_capacity()
-    if cluster_capacity is None:
-        logger.error("There was an issue retrieving cluster capacities, exiting.")
-        return STATUS_CLUSTER_ISSUE
-
-    logger.debug("Current cluster capacities: %s", cluster_capacity)
-
-    # Setting capacity information
-
-    # Updating the jobmanager's maximum possible number of workers
-    maximum_workers_requested = get_worker_count_from_nodes(
-        cloud_capacity.maximum_nodes, cloud_capacity.workers_per_node
+    maximum_workers_requested = sum(
+        get_worker_count_from_nodes(capacity.maximum_nodes, capacity.workers_per_node)
+        for capacity in pools_capacity.values()
     )
     logger.debug(
         "Maximum: %s nodes -> %s workers",
-        cloud_capacity.maximum_nodes,
+        sum(capacity.maximum_nodes for capacity in pools_capacity.values()),
         maximum_workers_requested
     )
-    cluster_issue = False
-    if maximum_workers_requested != cluster_capacity.maximum_workers:
-        cluster_capacity_was_set = os_interface.set_cluster_capacity(
-            maximum_workers_requested
+    if maximum_workers_requested == cluster_capacity.maximum_workers:
+        maximum_workers_requested = None
+
+    desired_nodes_requested = {}
+    for pool, capacity in pools_capacity.items():
+        desired_nodes = get_node_count_from_workers(
+            pools_desired_workers.get(pool, 0),
+            capacity.workers_per_node,
+            capacity.minimum_nodes,
+            capacity.maximum_nodes,
         )
-        if cluster_capacity_was_set:
-            logger.info("Updated the cluster's maximum capacity")
-        else:
-            logger.info("Failed to update the cluster's maximum capacity")
-            cluster_issue = True
-
-    # Updating the cloud computing platform's desired number of nodes
-    desired_nodes_requested = get_node_count_from_workers(
-        cluster_capacity.desired_workers,
-        cloud_capacity.workers_per_node,
-        cloud_capacity.minimum_nodes,
-        cloud_capacity.maximum_nodes,
-    )
-    logger.debug(
-        "Desired: %s workers -> %s nodes",
-        cluster_capacity.desired_workers,
-        desired_nodes_requested
+        logger.debug(
+            "Desired (%s): %s workers -> %s nodes",
+            pool,
+            pools_desired_workers.get(pool, 0),
+            desired_nodes
+        )
+        if not (
+            desired_nodes == capacity.desired_nodes and
+            desired_nodes == capacity.current_nodes
+        ):
+            desired_nodes_requested[pool] = desired_nodes
+
+    return maximum_workers_requested, desired_nodes_requested
+
+
+def is_scaling_in_flight(
+    scaling_request: Dict, cloud_capacity: CloudCapacity, desired_nodes: int, now: float
+) -> bool:
+    """Check whether the cloud platform is still converging towards a desired
+    capacity that was already requested, so that the request is not issued
+    again. A request that is not reached by its expected arrival time is
+    considered stalled and must be issued again.
+
+    Args:
+        scaling_request (Dict): In-flight scaling request, see
+        track_scaling_request.
+        cloud_capacity (CloudCapacity): Cloud-computing platform capacity info.
+        desired_nodes (int): Desired number of nodes to request.
+        now (float): Current time in seconds since the epoch.
+
+    Returns:
+        in_flight (bool): True if the request is in flight and not stalled.
+    """
+    if (
+        desired_nodes != cloud_capacity.desired_nodes
+        or scaling_request.get("target") != desired_nodes
+    ):
+        return False
+
+    if now < scaling_request["expected_by"]:
+        logger.info(
+            "Converging towards %s nodes (%s current, %s launching, %s draining), "
+            "expected within %ds",
+            desired_nodes,
+            cloud_capacity.current_nodes,
+            cloud_capacity.launching_nodes,
+            cloud_capacity.draining_nodes,
+            scaling_request["expected_by"] - now,
+        )
+        return True
+
+    logger.warning(
+        "Scaling to %s nodes requested %ds ago has stalled at %s nodes, "
+        "requesting it again (attempt %s)",
+        desired_nodes,
+        now - scaling_request["requested_at"],
+        cloud_capacity.current_nodes,
+        scaling_request["attempts"] + 1,
     )
-    cloud_issue = False
+    return False
+
+
+def track_scaling_request(
+    scaling_request: Dict,
+    cloud_capacity: CloudCapacity,
+    desired_nodes_set: int,
+    now: float,
+    timeout_seconds: int,
+) -> Dict:
+    """Update the in-flight scaling request after a run.
+
+    Args:
+        scaling_request (Dict): In-flight scaling request with the requested
+        target, the time it was first requested at, its expected arrival time
+        and the number of attempts. Empty when no request is in flight.
+        cloud_capacity (CloudCapacity): Cloud-computing platform capacity info
+        read before the run.
+        desired_nodes_set (int): Desired number of nodes set during the run,
+        or None.
+        now (float): Current time in seconds since the epoch.
+        timeout_seconds (int): Seconds given to the cloud platform to reach
+        the target.
+
+    Returns:
+        scaling_request (Dict): Updated in-flight scaling request.
+    """
+    if desired_nodes_set is not None:
+        if scaling_request.get("target") == desired_nodes_set:
+            # Stalled request issued again
+            return {
+                **scaling_request,
+                "expected_by": now + timeout_seconds,
+                "attempts": scaling_request["attempts"] + 1,
+            }
+
+        return {
+            "target": desired_nodes_set,
+            "requested_at": now,
+            "expected_by": now + timeout_seconds,
+            "attempts": 1,
+        }
+
     if (
-        desired_nodes_requested != cloud_capacity.desired_nodes or
-        desired_nodes_requested != cloud_capacity.current_nodes
+        scaling_request
+        and cloud_capacity.desired_nodes == cloud_capacity.current_nodes
+    ):
+        logger.info(
+            "Reached %s nodes in %ds",
+            cloud_capacity.current_nodes,
+            now - scaling_request["requested_at"],
+        )
+        return {}
+
+    return scaling_request
+
+
+def limit_surge(
+    cloud_capacity: CloudCapacity,
+    desired_nodes: int,
+    max_surge_nodes: int,
+    max_surge_percent: float,
+    ready_nodes: int,
+) -> int:
+    """Limit the number of nodes launched at once so that large scale-outs
+    are issued in stages. A single large request can exhaust the addresses
+    of a subnet or the Spot capacity of an availability zone and fail as a
+    whole, while stages let the cloud platform spread the launches.
+
+    A stage launches the larger of max_surge_nodes and max_surge_percent of
+    the ready nodes, so the stages grow with the cluster. The next stage is
+    only requested once the nodes of the previous one are running and
+    registered with a job manager, as nodes that are still booting may not
+    come up at all. A limit of 0 disables it.
+
+    Args:
+        cloud_capacity (CloudCapacity): Cloud-computing platform capacity info.
+        desired_nodes (int): Desired number of nodes to request.
+        max_surge_nodes (int): Number of nodes to launch at once.
+        max_surge_percent (float): Percentage of the ready nodes to launch at
+        once.
+        ready_nodes (int): Number of nodes running and registered with a job
+        manager.
+
+    Returns:
+        desired_nodes (int): Desired number of nodes of the current stage.
+    """
+    if desired_nodes <= cloud_capacity.desired_nodes or (
+        max_surge_nodes <= 0 and max_surge_percent <= 0
     ):
-        cloud_capacity_was_set = cloud_interface.set_cloud_capacity(
-            desired_nodes_requested
+        return desired_nodes
+
+    surge_nodes = max(max_surge_nodes, ceil(ready_nodes * max_surge_percent / 100), 1)
+    stage_nodes = min(
+        desired_nodes, max(cloud_capacity.desired_nodes, ready_nodes + surge_nodes)
+    )
+    if stage_nodes < desired_nodes:
+        logger.info(
+            "Scaling out to %s nodes in stages of %s nodes, next stage: %s nodes",
+            desired_nodes,
+            surge_nodes,
+            stage_nodes,
         )
-        if cloud_capacity_was_set:
-            logger.info("Updated the cloud platform's desired capacity")
-        else:
-            logger.info("Failed to update the cloud platform's desired capacity")
-            cloud_issue = True
-
-    if cloud_issue and cluster_issue:
-        return STATUS_CLOUD_AND_CLUSTER_ISSUE
-    elif cloud_issue:
-        return STATUS_CLOUD_ISSUE
-    elif cluster_issue:
-        return STATUS_CLUSTER_ISSUE
-    else:
-        return STATUS_SUCCESS
+
+    return stage_nodes
+
+
+def add_headroom(
+    desired_workers: int, headroom_workers: int, headroom_percent: float
+) -> int:
+    """Add spare workers to the demand so that small bursts of work start
+    without waiting for nodes to boot. The spare workers are the larger of a
+    fixed number of workers and a percentage of the demand.
+
+    Args:
+        desired_workers (int): Desired number of workers of the job managers.
+        headroom_workers (int): Number of idle workers to keep available.
+        headroom_percent (float): Percentage of the demand to keep available.
+
+    Returns:
+        desired_workers (int): Demand including the spare workers.
+    """
+    spare_workers = max(
+        headroom_workers, ceil(desired_workers * headroom_percent / 100)
+    )
+    return desired_workers + spare_workers
 
 
 def get_worker_count_from_nodes(nodes: int, workers_per_node: int) -> int:
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+import logging
+from typing import Dict, NamedTuple, Set
+
+from mwplatforminterfaces import ClusterModel
+
+logger = logging.getLogger("cluster_management.autoscaling.drain_journal")
+
+# Result of the last drain attempt of a node
+DRAIN_UNPROTECTED = "unprotected"
+DRAIN_STOPPING = "stopping"
+DRAIN_UNPROTECT_FAILED = "unprotect_failed"
+
+# Time given to an attempt to settle before the next one, doubled after each
+# attempt
+DRAIN_RETRY_BASE_SECONDS = 60
+DRAIN_RETRY_MAX_SECONDS = 600
+
+# A drain still unfinished after this many attempts or this long is stuck
+MAX_DRAIN_ATTEMPTS = 4
+DRAIN_STUCK_SECONDS = 1800
+
+
+class DrainDecisions(NamedTuple):
+    """Class defining what to do with the nodes of the drain journal."""
+
+    # Journal without the entries of the nodes that are gone
+    journal: Dict[str, Dict]
+    # Nodes with a drain attempt still settling
+    in_flight: Set[str]
+    # Nodes whose drain is to be attempted again
+    retry: Set[str]
+    # Nodes to replace as their drain is stuck
+    stuck: Set[str]
+
+
+def get_retry_delay_seconds(attempts: int) -> int:
+    """Get the time to wait after a number of drain attempts before the next
+    one."""
+    return min(DRAIN_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), DRAIN_RETRY_MAX_SECONDS)
+
+
+def get_drain_decisions(
+    journal: Dict[str, Dict], nodes: ClusterModel, now: float
+) -> DrainDecisions:
+    """Decide what to do with the nodes being drained.
+
+    A drain settles in two steps: the workers stop once idle, then the
+    unprotected node is terminated by the cloud platform. Until an attempt
+    had the time to settle, the node is left alone. After that, the drain of
+    a node still protected is attempted again, and the drain of a node that
+    was unprotected but is still running, or that ran out of attempts, is
+    stuck.
+
+    Args:
+        journal (Dict[str, Dict]): Drain journal, keyed by hostname.
+        nodes (ClusterModel): Records of the nodes.
+        now (float): Current time in seconds since the epoch.
+
+    Returns:
+        decisions (DrainDecisions): Nodes in flight, to retry and stuck.
+    """
+    decisions = DrainDecisions({}, set(), set(), set())
+    for host, entry in journal.items():
+        record = nodes.by_host(host)
+        # The node was terminated, or replaced by another instance
+        if record is None or record.instance_id != entry["instance_id"]:
+            logger.debug("Drain of node %s completed", host)
+            continue
+
+        decisions.journal[host] = entry
+        settled = now - entry["last_attempt_at"] >= get_retry_delay_seconds(
+            entry["attempts"]
+        )
+        if not settled:
+            decisions.in_flight.add(host)
+        elif (
+            entry["last_result"] == DRAIN_UNPROTECTED
+            and now - entry["started_at"] < DRAIN_STUCK_SECONDS
+        ):
+            # Terminations are not retried, only given up on
+            decisions.in_flight.add(host)
+        elif (
+            entry["last_result"] != DRAIN_UNPROTECTED
+            and entry["attempts"] < MAX_DRAIN_ATTEMPTS
+        ):
+            decisions.retry.add(host)
+        else:
+            decisions.stuck.add(host)
+
+    return decisions
+
+
+def record_drain_attempts(
+    journal: Dict[str, Dict],
+    nodes: ClusterModel,
+    nodes_drained: Set[str],
+    nodes_stopped: Set[str],
+    nodes_unprotected: Set[str],
+    now: float,
+) -> Dict[str, Dict]:
+    """Record the result of the drain attempts of a run.
+
+    Args:
+        journal (Dict[str, Dict]): Drain journal, keyed by hostname.
+        nodes (ClusterModel): Records of the nodes.
+        nodes_drained (Set[str]): Nodes whose drain was attempted.
+        nodes_stopped (Set[str]): Nodes whose workers were confirmed stopped.
+        nodes_unprotected (Set[str]): Nodes that were unprotected.
+        now (float): Current time in seconds since the epoch.
+
+    Returns:
+        journal (Dict[str, Dict]): Updated drain journal.
+    """
+    journal = dict(journal)
+    for host in nodes_drained:
+        record = nodes.by_host(host)
+        # Nodes unknown to the cloud platform cannot be followed
+        if record is None or record.instance_id is None:
+            continue
+
+        entry = journal.get(host) or {
+            "instance_id": record.instance_id,
+            "started_at": now,
+            "attempts": 0,
+        }
+        if host in nodes_unprotected:
+            last_result = DRAIN_UNPROTECTED
+        elif host in nodes_stopped:
+            last_result = DRAIN_UNPROTECT_FAILED
+        else:
+            last_result = DRAIN_STOPPING
+        journal[host] = dict(
+            entry,
+            attempts=entry["attempts"] + 1,
+            last_attempt_at=now,
+            last_result=last_result,
+        )
+
+    return journal
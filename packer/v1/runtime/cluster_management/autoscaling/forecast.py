@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+import logging
+from math import floor
+from typing import Dict, Mapping, NamedTuple
+
+from constants import (
+    FORECAST_ENABLED,
+    FORECAST_BUCKET_SECONDS,
+    FORECAST_SEASON_BUCKETS,
+)
+
+logger = logging.getLogger("cluster_management.autoscaling.forecast")
+
+# Holt-Winters smoothing factors of the level, trend and seasonal components
+LEVEL_SMOOTHING = 0.5
+TREND_SMOOTHING = 0.05
+SEASONAL_SMOOTHING = 0.3
+
+# Smoothing factor of the mean absolute forecast error
+ERROR_SMOOTHING = 0.2
+
+# Number of seasons to observe before forecasting
+WARMUP_SEASONS = 2
+
+
+class ForecastSettings(NamedTuple):
+    """Class defining the demand forecasting parameters."""
+
+    enabled: bool
+    # Duration over which the peak demand is aggregated
+    bucket_seconds: int
+    # Number of buckets in a season, e.g. 96 buckets of 900s for a day
+    season_buckets: int
+
+
+def get_settings(config: Mapping) -> ForecastSettings:
+    """Read the demand forecasting parameters from the cluster management
+    config.
+
+    Args:
+        config (Mapping): Cluster management program config.
+
+    Returns:
+        settings (ForecastSettings): Demand forecasting parameters.
+    """
+    return ForecastSettings(
+        enabled=bool(config[FORECAST_ENABLED]),
+        bucket_seconds=int(config[FORECAST_BUCKET_SECONDS]),
+        season_buckets=int(config[FORECAST_SEASON_BUCKETS]),
+    )
+
+
+def update_model(
+    model: Dict, now: float, desired_workers: int, bucket_seconds: int, season_buckets: int
+) -> Dict:
+    """Add the current demand to the demand forecasting model.
+
+    The demand is aggregated into buckets of bucket_seconds, keeping the peak
+    demand of each bucket. When a bucket is complete, its peak updates an
+    additive Holt-Winters model (level, trend and one seasonal component per
+    bucket of the season) as well as the mean absolute error of the model.
+
+    Args:
+        model (Dict): Model state, empty to start a new model.
+        now (float): Current time in seconds since the epoch.
+        desired_workers (int): Current desired number of workers.
+        bucket_seconds (int): Duration of a bucket.
+        season_buckets (int): Number of buckets in a season.
+
+    Returns:
+        model (Dict): Updated model state.
+    """
+    bucket = floor(now / bucket_seconds)
+    if (
+        not model
+        or model["bucket_seconds"] != bucket_seconds
+        or len(model["seasonals"]) != season_buckets
+        or bucket - model["bucket"] > season_buckets
+    ):
+        # New model, changed settings or gap of more than a season
+        return {
+            "bucket_seconds": bucket_seconds,
+            "bucket": bucket,
+            "peak": desired_workers,
+            "level": None,
+            "trend": 0.0,
+            "seasonals": [0.0] * season_buckets,
+            "fitted_buckets": 0,
+            "error": 0.0,
+        }
+
+    model = dict(model, seasonals=list(model["seasonals"]))
+    if bucket == model["bucket"]:
+        model["peak"] = max(model["peak"], desired_workers)
+        return model
+
+    # Fit the completed bucket, and the missed ones with the same peak
+    for missed_bucket in range(model["bucket"], bucket):
+        _fit_bucket(model, missed_bucket, model["peak"])
+
+    model["bucket"] = bucket
+    model["peak"] = desired_workers
+    return model
+
+
+def _fit_bucket(model: Dict, bucket: int, peak: float) -> None:
+    """Update the Holt-Winters components with the peak demand of a bucket."""
+    seasonals = model["seasonals"]
+    season_index = bucket % len(seasonals)
+
+    if model["level"] is None:
+        model["level"] = float(peak)
+
+    elif model["fitted_buckets"] < len(seasonals):
+        # First season: the seasonal components are the deviations from the
+        # level of the first bucket
+        seasonals[season_index] = peak - model["level"]
+
+    else:
+        predicted = model["level"] + model["trend"] + seasonals[season_index]
+        model["error"] += ERROR_SMOOTHING * (abs(peak - predicted) - model["error"])
+
+        previous_level = model["level"]
+        model["level"] = LEVEL_SMOOTHING * (peak - seasonals[season_index]) + (
+            1 - LEVEL_SMOOTHING
+        ) * (previous_level + model["trend"])
+        model["trend"] = TREND_SMOOTHING * (model["level"] - previous_level) + (
+            1 - TREND_SMOOTHING
+        ) * model["trend"]
+        seasonals[season_index] = SEASONAL_SMOOTHING * (
+            peak - model["level"]
+        ) + (1 - SEASONAL_SMOOTHING) * seasonals[season_index]
+
+    model["fitted_buckets"] += 1
+
+
+def get_forecast(model: Dict, at: float) -> int:
+    """Forecast the desired number of workers at a given time.
+
+    The forecast is the lower bound of the model's confidence interval: the
+    predicted demand minus the mean absolute error of past predictions. A
+    model that has not yet observed WARMUP_SEASONS seasons does not forecast.
+
+    Args:
+        model (Dict): Model state.
+        at (float): Time to forecast the demand at, in seconds since the epoch.
+
+    Returns:
+        desired_workers (int): Forecast number of workers, or None.
+    """
+    if not model or model["level"] is None:
+        return None
+
+    season_buckets = len(model["seasonals"])
+    if model["fitted_buckets"] < WARMUP_SEASONS * season_buckets:
+        return None
+
+    bucket = floor(at / model["bucket_seconds"])
+    # The last fitted bucket is the one before the current bucket
+    horizon = bucket - model["bucket"] + 1
+    predicted = (
+        model["level"]
+        + horizon * model["trend"]
+        + model["seasonals"][bucket % season_buckets]
+    )
+    return max(0, round(predicted - model["error"]))
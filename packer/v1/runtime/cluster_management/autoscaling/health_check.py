@@ -2,86 +2,100 @@
 
 # Copyright 2022-2026 The MathWorks, Inc.
 import logging
+from typing import Dict, Set
 
-from mwplatforminterfaces import CloudInterface
-from mwplatforminterfaces import OSInterface
-
-from constants import (
-    STATUS_SUCCESS,
-    STATUS_CLOUD_ISSUE,
-)
+from autoscaling import boot_latency
 
 logger = logging.getLogger("cluster_management.autoscaling.health_check")
 
-def main(cloud_interface: CloudInterface, os_interface: OSInterface) -> int:
-    """Evaluate orphaned nodes in the cluster.
+# Number of boots to measure before deriving the grace period from them
+MIN_GRACE_PERIOD_SAMPLES = 10
+
+# Added to the measured boot latency, which is precise to the interval between
+# two runs
+GRACE_PERIOD_MARGIN_SECONDS = 60
 
-    This routine looks for nodes that have been running for atleast 
-    idle_timeout_seconds and are not registered with MJS or are in a suspended state. 
-    These could be unhealthy nodes that are orphaned from MJS due to unexpected 
-    reasons (user data execution failure, etc.).
 
-    The routine will try to set their health status as Unhealthy. The cloud platform will
-    then automatically replace the nodes with new ones to match the desired capacity.
+def get_grace_period_seconds(
+    boot_latency_state: Dict, percentile: float, idle_timeout_seconds: int
+) -> int:
+    """Get the time a node is given to register its workers before it is
+    checked for health: a high percentile of the measured times from node
+    launch to worker registration.
 
     Args:
-        cloud_interface (CloudInterface): Cloud provider specific
-        implementation of AbstractCloudInterface.
-        os_interface (OSInterface): Operating system specific implementation
-        of AbstractOSInterface.
+        boot_latency_state (Dict): Boot latency state.
+        percentile (float): Percentile of the boot latencies, 0 to always use
+        the idle timeout.
+        idle_timeout_seconds (int): Idle timeout, used until
+        MIN_GRACE_PERIOD_SAMPLES boots were measured.
 
     Returns:
-        status (int): Status code of program.
-                        0: Successful
-                        1: Faced an issue with cloud provider
+        seconds (int): Grace period.
     """
-    # The idle timeout for workers is defined by the mwWorkerIdleTimeoutMinutes
-    # tag defined in the cluster auto-scaling group resource
-    idle_timeout_seconds = cloud_interface.get_idle_timeout_seconds()
-    logger.debug("Idle timeout is %ss", idle_timeout_seconds)
-
-    # Retrieve current nodes in the cluster that are running for
-    # at least idle_timeout_seconds
-    current_nodes = cloud_interface.get_worker_nodes(
-        grace_period_seconds = idle_timeout_seconds
+    if (
+        not percentile
+        or len(boot_latency_state.get("samples", [])) < MIN_GRACE_PERIOD_SAMPLES
+    ):
+        return idle_timeout_seconds
+
+    return (
+        boot_latency.get_boot_latency_seconds(boot_latency_state, percentile)
+        + GRACE_PERIOD_MARGIN_SECONDS
     )
 
-    if not current_nodes:
-        logger.info("There are no worker nodes running for more than %s seconds.",
-                    idle_timeout_seconds)
-        return STATUS_SUCCESS
 
-    logger.debug("%d nodes running for more than %s seconds: %s",
-                 len(current_nodes), idle_timeout_seconds, current_nodes)
+def get_unhealthy_nodes(
+    current_nodes: Set[str], suspended_nodes: Set[str], registered_nodes: Set[str]
+) -> Set[str]:
+    """Evaluate orphaned nodes in the cluster.
 
-    # Worker nodes where MATLAB workers have been suspended or stopped
-    suspended_nodes = os_interface.get_suspended_nodes(current_nodes)
+    Nodes running for at least the grace period that are not registered with
+    MJS or are in a suspended state could be unhealthy nodes that are orphaned
+    from MJS due to unexpected reasons (user data execution failure, etc.).
 
-    logger.debug("%d suspended nodes: %s", len(suspended_nodes), suspended_nodes)
+    Args:
+        current_nodes (Set[str]): Nodes running for at least the grace period.
+        suspended_nodes (Set[str]): Nodes where MATLAB workers have been
+        suspended or stopped.
+        registered_nodes (Set[str]): Nodes registered with any job manager.
 
-    # Retrieve nodes that are registered with MJS
-    registered_worker_nodes = os_interface.get_worker_nodes()
+    Returns:
+        unhealthy_nodes (Set[str]): Suspended and unregistered nodes.
+    """
+    logger.debug("%d suspended nodes: %s", len(suspended_nodes), suspended_nodes)
 
     # We target nodes that are not registered with MJS
-    current_unregistered_nodes = current_nodes - registered_worker_nodes
+    current_unregistered_nodes = current_nodes - registered_nodes
 
     logger.debug("%d unregistered nodes: %s",
                  len(current_unregistered_nodes),
                  current_unregistered_nodes
                 )
 
-    nodes_to_mark_unhealthy = suspended_nodes.union(current_unregistered_nodes)
+    return suspended_nodes.union(current_unregistered_nodes)
 
-    if not nodes_to_mark_unhealthy:
-        logger.info("All nodes are healthy")
-        return STATUS_SUCCESS
 
-    logger.info("Marking suspended and unregistered nodes as unhealthy: %s",
-                nodes_to_mark_unhealthy)
-    nodes_were_marked = cloud_interface.set_nodes_unhealthy(nodes_to_mark_unhealthy)
+def get_interrupted_nodes(
+    unhealthy_nodes: Set[str], heartbeats: Dict[str, Dict]
+) -> Set[str]:
+    """Get the unhealthy nodes that are Spot Instances marked for removal.
+    These nodes are replaced right away rather than recovered in place.
 
-    if not nodes_were_marked:
-        logger.error("Failed to mark nodes as unhealthy")
-        return STATUS_CLOUD_ISSUE
+    Args:
+        unhealthy_nodes (Set[str]): Suspended and unregistered nodes.
+        heartbeats (Dict[str, Dict]): Latest heartbeat of each node.
 
-    return STATUS_SUCCESS
+    Returns:
+        interrupted_nodes (Set[str]): Nodes marked for Spot interruption.
+    """
+    interrupted_nodes = {
+        host
+        for host in unhealthy_nodes
+        if heartbeats.get(host, {}).get("spot_interruption")
+    }
+    if interrupted_nodes:
+        logger.debug("%d nodes marked for Spot interruption: %s",
+                     len(interrupted_nodes), interrupted_nodes)
+
+    return interrupted_nodes
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+import logging
+from typing import Dict
+
+logger = logging.getLogger("cluster_management.autoscaling.idle_timeout")
+
+# Number of idle gap samples kept
+IDLE_GAP_SAMPLES = 200
+
+# Number of idle gaps to observe before adapting the idle timeout
+MIN_IDLE_GAP_SAMPLES = 20
+
+# Lowest adaptive idle timeout
+MIN_IDLE_TIMEOUT_SECONDS = 60
+
+
+def update_idle_gaps(idle_gaps: Dict, nodes_seconds_idle: Dict[str, int]) -> Dict:
+    """Measure the idle gaps of the nodes: the time a node stays idle between
+    two jobs.
+
+    Nodes seen idle are followed until their idle duration drops, i.e. a job
+    arrived, at which point the last idle duration seen is recorded as a
+    complete gap. Nodes that leave the cluster while idle, e.g. drained after
+    the idle timeout, record a censored gap: the node was idle for at least
+    that long. The samples are precise to the interval between two runs.
+
+    Args:
+        idle_gaps (Dict): Idle gaps state, with the idle duration of the
+        followed nodes ("idle") and the latest [seconds, complete] samples
+        ("samples").
+        nodes_seconds_idle (Dict[str, int]): Number of seconds each registered
+        node has been idle for.
+
+    Returns:
+        idle_gaps (Dict): Updated idle gaps state.
+    """
+    idle = idle_gaps.get("idle", {})
+    samples = list(idle_gaps.get("samples", []))
+
+    for node, previous_seconds_idle in idle.items():
+        seconds_idle = nodes_seconds_idle.get(node)
+        if seconds_idle is None:
+            samples.append([previous_seconds_idle, False])
+        elif seconds_idle < previous_seconds_idle:
+            logger.debug("Node %s was idle for %ss between jobs", node, previous_seconds_idle)
+            samples.append([previous_seconds_idle, True])
+
+    return {
+        "idle": {
+            node: seconds_idle
+            for node, seconds_idle in nodes_seconds_idle.items()
+            if seconds_idle > 0
+        },
+        "samples": samples[-IDLE_GAP_SAMPLES:],
+    }
+
+
+def get_adaptive_idle_timeout(
+    idle_gaps: Dict,
+    max_idle_timeout_seconds: int,
+    boot_latency_seconds: int,
+    boot_delay_weight: float,
+) -> int:
+    """Pick the idle timeout that minimizes the expected cost of an idle gap.
+
+    For an idle timeout T, a gap g costs min(g, T) seconds of idle node. A gap
+    longer than T also costs a relaunch: the boot latency of the replacement
+    node, counted once as billed boot time and boot_delay_weight times as the
+    delay of the job waiting for it. A censored gap lasted longer than its
+    observed duration: it costs a relaunch under the timeouts below that
+    duration, and only the timeout under the others, as whether a job would
+    have arrived before them is unknown. The expected cost is minimal at one
+    of the observed gaps, which are therefore the candidates.
+
+    Args:
+        idle_gaps (Dict): Idle gaps state.
+        max_idle_timeout_seconds (int): Highest idle timeout, the configured
+        one.
+        boot_latency_seconds (int): Time from node launch to worker
+        registration.
+        boot_delay_weight (float): Cost of a second of job delay relative to a
+        second of idle node.
+
+    Returns:
+        seconds (int): Idle timeout, max_idle_timeout_seconds until
+        MIN_IDLE_GAP_SAMPLES gaps were observed.
+    """
+    samples = idle_gaps.get("samples", [])
+    if len(samples) < MIN_IDLE_GAP_SAMPLES:
+        return max_idle_timeout_seconds
+
+    min_idle_timeout_seconds = min(MIN_IDLE_TIMEOUT_SECONDS, max_idle_timeout_seconds)
+    relaunch_cost = boot_latency_seconds * (1 + boot_delay_weight)
+
+    def expected_cost(timeout: int) -> float:
+        cost = 0
+        for seconds, complete in samples:
+            if complete and seconds <= timeout:
+                cost += seconds
+            elif not complete and seconds <= timeout:
+                # Nodes drained after a shorter timeout do not tell whether
+                # this one would have relaunched
+                cost += timeout
+            else:
+                cost += timeout + relaunch_cost
+        return cost / len(samples)
+
+    candidates = {min_idle_timeout_seconds, max_idle_timeout_seconds} | {
+        seconds
+        for seconds, complete in samples
+        if complete and min_idle_timeout_seconds < seconds < max_idle_timeout_seconds
+    }
+    # Ties are broken in favour of the longest timeout, which relaunches less
+    return min(candidates, key=lambda timeout: (expected_cost(timeout), -timeout))
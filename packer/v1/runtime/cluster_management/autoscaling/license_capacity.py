@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+import json
+import logging
+from pathlib import Path
+import re
+import subprocess
+from typing import Callable, Dict, Mapping, NamedTuple, Set
+
+from mwplatforminterfaces.constants import MATLAB_ROOT
+
+from constants import (
+    LICENSE_SOURCE,
+    LICENSE_SERVER,
+    LICENSE_FEATURE,
+    LICENSE_CAPACITY_FILE,
+)
+
+logger = logging.getLogger("cluster_management.autoscaling.license_capacity")
+
+# Seconds given to the license manager to answer
+LMSTAT_TIMEOUT_SECONDS = 30
+
+LMUTIL_PATH = Path(MATLAB_ROOT) / "etc" / "glnxa64" / "lmutil"
+
+
+class LicenseUsage(NamedTuple):
+    """Class defining the usage of the license feature the workers check
+    out."""
+
+    issued: int
+    in_use: int
+    # Number of licenses checked out by each host
+    hosts_in_use: Dict[str, int]
+
+
+# A license source returns the license usage, or None if it is unknown
+LicenseSource = Callable[[], LicenseUsage]
+
+
+def lmstat_source(config: Mapping) -> LicenseSource:
+    """Query a network license manager with lmutil lmstat."""
+    server, feature = config[LICENSE_SERVER], config[LICENSE_FEATURE]
+
+    def query() -> LicenseUsage:
+        try:
+            result = subprocess.run(
+                [LMUTIL_PATH, "lmstat", "-c", server, "-f", feature],
+                capture_output=True,
+                text=True,
+                timeout=LMSTAT_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error("Failed to query the license manager %s: %s", server, e)
+            return None
+
+        return parse_lmstat(result.stdout, feature)
+
+    return query
+
+
+def file_source(config: Mapping) -> LicenseSource:
+    """Read the license usage from a JSON file such as
+        {"issued": 64, "in_use": 10, "hosts_in_use": {"worker-1": 4}}
+    Used as a stand-in for a license manager."""
+    path = config[LICENSE_CAPACITY_FILE]
+
+    def query() -> LicenseUsage:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return LicenseUsage(
+                issued=int(data["issued"]),
+                in_use=int(data.get("in_use", 0)),
+                hosts_in_use=dict(data.get("hosts_in_use", {})),
+            )
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error("Failed to read the license usage from %s: %s", path, e)
+            return None
+
+    return query
+
+
+LICENSE_SOURCES: Dict[str, Callable[[Mapping], LicenseSource]] = {
+    "lmstat": lmstat_source,
+    "file": file_source,
+}
+
+
+def get_license_source(config: Mapping) -> LicenseSource:
+    """Get the license source selected in the cluster management config.
+
+    Args:
+        config (Mapping): Cluster management program config.
+
+    Returns:
+        source (LicenseSource): License source, or None if the cluster is not
+        license-capped.
+    """
+    name = config[LICENSE_SOURCE]
+    if not name:
+        return None
+
+    if name not in LICENSE_SOURCES:
+        logger.error("Unknown license source: %s", name)
+        return None
+
+    return LICENSE_SOURCES[name](config)
+
+
+def parse_lmstat(output: str, feature: str) -> LicenseUsage:
+    """Extract the usage of a feature from the lmstat output.
+
+    Args:
+        output (str): Output of lmutil lmstat -f feature.
+        feature (str): Name of the license feature.
+
+    Returns:
+        usage (LicenseUsage): License usage, or None if the feature was not
+        found.
+    """
+    totals = re.search(
+        rf"Users of {re.escape(feature)}:\s*\(Total of (\d+) licenses? issued;"
+        r"\s*Total of (\d+) licenses? in use\)",
+        output,
+    )
+    if totals is None:
+        logger.error("License feature %s not found in the lmstat output", feature)
+        return None
+
+    # Checkouts are listed as "user host display (version) (server/port handle), start ..."
+    hosts_in_use = {}
+    for line in output[totals.end():].splitlines():
+        if line.startswith("Users of "):
+            break
+        match = re.match(r"\s+\S+\s+(\S+)\s+.*\(v[^)]*\)", line)
+        if match:
+            host = match.group(1)
+            licenses = re.search(r"(\d+) licenses", line)
+            hosts_in_use[host] = hosts_in_use.get(host, 0) + (
+                int(licenses.group(1)) if licenses else 1
+            )
+
+    return LicenseUsage(
+        issued=int(totals.group(1)), in_use=int(totals.group(2)), hosts_in_use=hosts_in_use
+    )
+
+
+def get_license_cap_workers(usage: LicenseUsage, hosts: Set[str]) -> int:
+    """Get the number of workers the licenses can run in the cluster: the
+    licenses the cluster's hosts hold plus the free licenses.
+
+    Args:
+        usage (LicenseUsage): License usage.
+        hosts (Set[str]): Hostnames of the cluster's nodes.
+
+    Returns:
+        workers (int): Maximum number of workers.
+    """
+    # License managers may report short or fully qualified hostnames
+    short_hosts = {host.split(".")[0] for host in hosts}
+    cluster_in_use = sum(
+        licenses
+        for host, licenses in usage.hosts_in_use.items()
+        if host.split(".")[0] in short_hosts
+    )
+    return cluster_in_use + max(usage.issued - usage.in_use, 0)
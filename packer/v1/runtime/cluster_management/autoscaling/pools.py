@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+from math import ceil
+import logging
+from typing import Dict, List
+
+from mwplatforminterfaces.cloud_interface import CloudCapacity, WorkerPool
+
+logger = logging.getLogger("cluster_management.autoscaling.pools")
+
+SPLIT_PRIORITY = "priority"
+SPLIT_PROPORTIONAL = "proportional"
+
+
+def get_desired_workers(pools_capacity: Dict[str, CloudCapacity]) -> int:
+    """Get the number of workers the desired capacities of the worker pools
+    provide.
+
+    Args:
+        pools_capacity (Dict[str, CloudCapacity]): Capacity info keyed by pool
+        name.
+
+    Returns:
+        workers (int): Number of workers.
+    """
+    return sum(
+        capacity.desired_nodes * capacity.workers_per_node
+        for capacity in pools_capacity.values()
+    )
+
+
+def split_demand(
+    desired_workers: int,
+    pools: List[WorkerPool],
+    pools_capacity: Dict[str, CloudCapacity],
+    policy: str,
+) -> Dict[str, int]:
+    """Split the desired number of workers between the worker pools.
+
+    The workers of the minimum number of nodes of each pool are counted
+    first. The rest of the demand is then split according to the policy:
+        - "priority": pools are filled up to their maximum in priority order.
+        - "proportional": the demand is split in proportion to the number of
+          workers each pool can add above its minimum.
+
+    Args:
+        desired_workers (int): Desired number of workers of the job managers.
+        pools (List[WorkerPool]): Worker pools, highest priority first.
+        pools_capacity (Dict[str, CloudCapacity]): Capacity info keyed by pool
+        name.
+        policy (str): Name of the split policy.
+
+    Returns:
+        pools_workers (Dict[str, int]): Desired number of workers keyed by
+        pool name.
+    """
+    pools = [pool for pool in pools if pool.name in pools_capacity]
+    minimum_workers = {
+        pool.name: pools_capacity[pool.name].minimum_nodes * pool.workers_per_node
+        for pool in pools
+    }
+    spare_workers = {
+        pool.name: max(
+            pools_capacity[pool.name].maximum_nodes * pool.workers_per_node
+            - minimum_workers[pool.name],
+            0,
+        )
+        for pool in pools
+    }
+    remaining_workers = max(desired_workers - sum(minimum_workers.values()), 0)
+
+    if policy not in (SPLIT_PRIORITY, SPLIT_PROPORTIONAL):
+        logger.error("Unknown pool split policy: %s", policy)
+        policy = SPLIT_PRIORITY
+
+    pools_workers = dict(minimum_workers)
+    total_spare_workers = sum(spare_workers.values())
+    if policy == SPLIT_PROPORTIONAL and total_spare_workers:
+        for pool in pools:
+            pools_workers[pool.name] += min(
+                ceil(remaining_workers * spare_workers[pool.name] / total_spare_workers),
+                spare_workers[pool.name],
+            )
+
+    else:
+        for pool in pools:
+            added_workers = min(remaining_workers, spare_workers[pool.name])
+            pools_workers[pool.name] += added_workers
+            remaining_workers -= added_workers
+
+    if len(pools) > 1:
+        logger.debug("Demand of %s workers split between pools: %s", desired_workers, pools_workers)
+
+    return pools_workers
@@ -0,0 +1,893 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+from collections import Counter
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Dict, List, Mapping, NamedTuple, Set, Tuple
+
+from mwplatforminterfaces import CloudInterface
+from mwplatforminterfaces import ClusterModel
+from mwplatforminterfaces import OSInterface
+from mwplatforminterfaces.cloud_interface import (
+    CloudCapacity,
+    WorkerPool,
+    combine_capacities,
+)
+from mwplatforminterfaces.os_interface import ClusterCapacity
+
+from autoscaling import boot_latency
+from autoscaling import capacity_control
+from autoscaling import drain_journal
+from autoscaling import forecast
+from autoscaling import health_check
+from autoscaling import idle_timeout
+from autoscaling import license_capacity
+from autoscaling import pools
+from autoscaling import scale_in_protection
+from autoscaling import schedules
+from autoscaling import stabilization
+from autoscaling.forecast import ForecastSettings
+from autoscaling.license_capacity import LicenseUsage
+from autoscaling.stabilization import StabilizationSettings
+from cluster_management_interface import ClusterManagementProgramInterface
+import reservations
+
+from utils.fetch import fetch_concurrently
+
+from constants import (
+    STATUS_SUCCESS,
+    STATUS_CLOUD_ISSUE,
+    STATUS_CLUSTER_ISSUE,
+    STATUS_CLOUD_AND_CLUSTER_ISSUE,
+    SCALING_REQUEST,
+    SCALING_CONVERGENCE_TIMEOUT_SECONDS,
+    DEMAND_HISTORY,
+    SCALE_IN_CRITERIA,
+    HEADROOM_WORKERS,
+    HEADROOM_PERCENT,
+    CAPACITY_SCHEDULES,
+    DEMAND_FORECAST,
+    BOOT_LATENCY,
+    IDLE_GAPS,
+    DRAIN_JOURNAL,
+    ADAPTIVE_IDLE_TIMEOUT_ENABLED,
+    IDLE_TIMEOUT_BOOT_DELAY_WEIGHT,
+    MAX_SURGE_NODES,
+    MAX_SURGE_PERCENT,
+    POOL_SPLIT_POLICY,
+    HEALTH_CHECK_GRACE_PERCENTILE,
+    SCALE_IN_ENABLED,
+)
+
+logger = logging.getLogger("cluster_management.autoscaling.reconciler")
+
+# Target state of a node
+NODE_KEEP = "keep"
+NODE_DRAIN = "drain"
+NODE_RECOVER = "recover"
+NODE_REPLACE = "replace"
+
+
+class ClusterView(NamedTuple):
+    """Class joining the cloud platform and job managers state read at the
+    start of a run."""
+
+    # Capacities of all the worker pools combined, and of each pool
+    cloud_capacity: CloudCapacity
+    pools_capacity: Dict[str, CloudCapacity]
+    # Worker pools, highest priority first, and how the demand is split
+    # between them
+    pools: List[WorkerPool]
+    pool_split_policy: str
+    # Capacities of all the job managers combined, and of each job manager
+    cluster_capacity: ClusterCapacity
+    job_managers_capacity: Dict[str, ClusterCapacity]
+    idle_timeout_seconds: int
+    # Time nodes are given to register their workers before their health is
+    # checked
+    grace_period_seconds: int
+    # Measured idle gaps of the nodes, and whether the idle timeout adapts to
+    # them, the configured idle timeout being an upper bound
+    idle_gaps: Dict
+    adaptive_idle_timeout: bool
+    idle_timeout_boot_delay_weight: float
+    # Records of the nodes known to the cloud platform or the job managers
+    nodes: ClusterModel
+    # Cloud state of the nodes running for at least the grace period
+    nodes_state: Dict[str, str]
+    suspended_nodes: Set[str]
+    # Idle duration of the nodes registered with any job manager
+    nodes_seconds_idle: Dict[str, int]
+    heartbeats: Dict[str, Dict]
+    # Drains started in previous runs, keyed by hostname
+    drain_journal: Dict[str, Dict]
+    # Desired capacity of each pool requested in a previous run and not
+    # reached yet, keyed by pool name
+    scaling_request: Dict
+    # [time, desired workers] samples of the previous runs
+    demand_history: List[List]
+    stabilization: StabilizationSettings
+    # Names of the criteria ranking the idle nodes to scale in
+    scale_in_criteria: List[str]
+    # Demand forecasting model state and parameters
+    demand_forecast: Dict
+    forecast: ForecastSettings
+    # Measured times from node launch to worker registration
+    boot_latency: Dict
+    # Idle workers to keep available: a number and a percentage of the demand
+    headroom_workers: int
+    headroom_percent: float
+    # Time windows with a minimum number of nodes
+    capacity_schedules: List[Dict]
+    # Nodes launched at once when scaling out: a number and a percentage of
+    # the nodes running and registered with a job manager
+    max_surge_nodes: int
+    max_surge_percent: float
+    # False while the desired capacity must not decrease and no node is
+    # drained
+    scale_in_enabled: bool
+    # Usage of the worker license feature, or None if the cluster is not
+    # license-capped
+    license_usage: LicenseUsage
+    # Time-boxed reservations of workers that have not expired
+    reservations: List[Dict]
+    # Time the view was read at, in seconds since the epoch
+    read_at: float
+
+
+class ReconcilePlan(NamedTuple):
+    """Class defining the operations that bring the cluster to its target
+    state."""
+
+    # None when the current value already matches the target
+    maximum_workers: int
+    # Desired number of nodes of the pools that do not match it yet, keyed by
+    # pool name
+    desired_nodes: Dict[str, int]
+    nodes_actions: Dict[str, str]
+    # Demand history, forecasting model, boot latencies and idle gaps
+    # including the observations of this run
+    demand_history: List[List]
+    demand_forecast: Dict
+    boot_latency: Dict
+    idle_gaps: Dict
+    # Drain journal without the drains that completed
+    drain_journal: Dict[str, Dict]
+
+    def nodes_with_action(self, action: str) -> Set[str]:
+        """Return the nodes whose target state is action."""
+        return {node for node, a in self.nodes_actions.items() if a == action}
+
+
+def build_view(
+    cloud_interface: CloudInterface,
+    os_interface: OSInterface,
+    cluster_management_interface: ClusterManagementProgramInterface,
+) -> Tuple[ClusterView, int]:
+    """Read the state of the cloud platform and of the job managers once.
+
+    Args:
+        cloud_interface (CloudInterface): Cloud provider specific
+        implementation of AbstractCloudInterface.
+        os_interface (OSInterface): Operating system specific implementation
+        of AbstractOSInterface.
+        cluster_management_interface (ClusterManagementProgramInterface): Class
+        to read and update the state and config of the program.
+
+    Returns:
+        view (ClusterView): Joined state, or None if it could not be read.
+        status (int): Status code of the read.
+    """
+    read_at = time.time()
+
+    license_source = license_capacity.get_license_source(
+        cluster_management_interface.cluster_management_config
+    )
+
+    # The cloud platform and the job managers are read at the same time. The
+    # license manager is read with the cloud platform.
+    def read_cloud():
+        return (
+            cloud_interface.get_pools_capacity(),
+            cloud_interface.get_cluster_model(),
+            cloud_interface.get_idle_timeout_seconds(),
+            license_source() if license_source else None,
+        )
+
+    (
+        (pools_capacity, nodes, idle_timeout_seconds, license_usage),
+        cluster_state,
+    ) = fetch_concurrently(read_cloud, os_interface.get_cluster_state_async)
+
+    if pools_capacity is None:
+        logger.error("There was an issue retrieving cloud capacities, exiting.")
+        return None, STATUS_CLOUD_ISSUE
+
+    cloud_capacity = combine_capacities(pools_capacity)
+    logger.debug("Current cloud capacities: %s", cloud_capacity)
+    if len(pools_capacity) > 1:
+        logger.debug("Current worker pools capacities: %s", pools_capacity)
+
+    if nodes is None:
+        logger.error("There was an issue retrieving the worker nodes, exiting.")
+        return None, STATUS_CLOUD_ISSUE
+
+    # The capacities and the registered nodes come from the same resize status
+    # call. Without them, every node would look unregistered.
+    if cluster_state is None:
+        logger.error("There was an issue retrieving cluster capacities, exiting.")
+        return None, STATUS_CLUSTER_ISSUE
+
+    logger.debug("Current cluster capacities: %s", cluster_state.capacity)
+    nodes.record_workers(cluster_state.nodes_workers, cluster_state.nodes_seconds_idle)
+
+    # The idle timeout for workers is defined by the mwWorkerIdleTimeoutMinutes
+    # tag defined in the cluster auto-scaling group resource
+    logger.debug("Idle timeout is %ss", idle_timeout_seconds)
+
+    # Nodes are given the time most nodes take to register their workers
+    grace_period_seconds = health_check.get_grace_period_seconds(
+        cluster_management_interface.cluster_management_state[BOOT_LATENCY],
+        float(
+            cluster_management_interface.cluster_management_config[
+                HEALTH_CHECK_GRACE_PERCENTILE
+            ]
+        ),
+        idle_timeout_seconds,
+    )
+    logger.debug("Health check grace period is %ss", grace_period_seconds)
+
+    # Retrieve current nodes in the cluster that are running for
+    # at least grace_period_seconds, along with their cloud state
+    nodes_state = cloud_interface.get_worker_nodes_state(
+        grace_period_seconds = grace_period_seconds, cluster_model = nodes
+    )
+    logger.debug("%d nodes running for more than %s seconds: %s",
+                 len(nodes_state), grace_period_seconds, set(nodes_state))
+
+    # Worker nodes where MATLAB workers have been suspended or stopped
+    # Cached statuses are reused for nodes whose cloud state did not change
+    suspended_nodes = set()
+    if nodes_state:
+        suspended_nodes = os_interface.get_suspended_nodes(
+            set(nodes_state), nodes_state, set(cluster_state.nodes_workers)
+        )
+
+    view = ClusterView(
+        cloud_capacity=cloud_capacity,
+        pools_capacity=pools_capacity,
+        pools=cloud_interface.get_worker_pools(),
+        cluster_capacity=cluster_state.capacity,
+        job_managers_capacity=cluster_state.job_managers_capacity,
+        idle_timeout_seconds=idle_timeout_seconds,
+        grace_period_seconds=grace_period_seconds,
+        idle_gaps=cluster_management_interface.cluster_management_state[IDLE_GAPS],
+        nodes=nodes,
+        nodes_state=nodes_state,
+        suspended_nodes=suspended_nodes,
+        nodes_seconds_idle=nodes.registered_nodes(),
+        heartbeats=os_interface.get_worker_heartbeats(),
+        drain_journal=cluster_management_interface.cluster_management_state[
+            DRAIN_JOURNAL
+        ],
+        scaling_request=cluster_management_interface.cluster_management_state[
+            SCALING_REQUEST
+        ],
+        demand_history=cluster_management_interface.cluster_management_state[
+            DEMAND_HISTORY
+        ],
+        demand_forecast=cluster_management_interface.cluster_management_state[
+            DEMAND_FORECAST
+        ],
+        boot_latency=cluster_management_interface.cluster_management_state[
+            BOOT_LATENCY
+        ],
+        license_usage=license_usage,
+        reservations=reservations.get_active_reservations(read_at),
+        read_at=read_at,
+        **get_policy_settings(cluster_management_interface.cluster_management_config),
+    )
+    return view, STATUS_SUCCESS
+
+
+def get_policy_settings(config: Mapping) -> Dict:
+    """Read the settings of the scaling policy from the cluster management
+    config.
+
+    Args:
+        config (Mapping): Cluster management program config.
+
+    Returns:
+        settings (Dict): ClusterView fields holding the policy settings.
+    """
+    return dict(
+        pool_split_policy=config[POOL_SPLIT_POLICY],
+        adaptive_idle_timeout=bool(config[ADAPTIVE_IDLE_TIMEOUT_ENABLED]),
+        idle_timeout_boot_delay_weight=float(config[IDLE_TIMEOUT_BOOT_DELAY_WEIGHT]),
+        stabilization=stabilization.get_settings(config),
+        scale_in_criteria=list(config[SCALE_IN_CRITERIA]),
+        forecast=forecast.get_settings(config),
+        headroom_workers=int(config[HEADROOM_WORKERS]),
+        headroom_percent=float(config[HEADROOM_PERCENT]),
+        capacity_schedules=list(config[CAPACITY_SCHEDULES]),
+        max_surge_nodes=int(config[MAX_SURGE_NODES]),
+        max_surge_percent=float(config[MAX_SURGE_PERCENT]),
+        scale_in_enabled=bool(config[SCALE_IN_ENABLED]),
+    )
+
+
+def plan(view: ClusterView) -> ReconcilePlan:
+    """Compute the target capacities and the target state of each node.
+
+    The decisions are the ones of the capacity control, health check and
+    scale-in protection routines:
+        - The job managers' maximum number of workers and the desired number
+          of nodes of each worker pool follow the capacity control rules,
+          applied to the demand plus the headroom of spare workers,
+          stabilized over the scale-out and scale-in windows, and raised to
+          the demand forecast and to the capacity schedules one boot latency
+          ahead, and to the active reservations. The spare, scheduled and
+          reserved nodes are therefore never drained. Scale-out stops at the
+          number of workers the licenses can run. The demand is split
+          between the worker pools by the pool split policy. Large
+          scale-outs are issued in stages limited by the maximum surge. A
+          desired capacity that is already in flight is not requested again
+          unless the cloud platform stalled before reaching it.
+        - Suspended and unregistered nodes are recovered in place, or
+          replaced right away if they are marked for Spot interruption. Nodes
+          are only checked once they ran for longer than a high percentile of
+          the measured boot latencies.
+        - Nodes idle for longer than the idle timeout above the desired
+          capacity of their pool are drained, ranked by the scale-in criteria. The idle
+          timeout adapts to the measured idle gaps between jobs, up to the
+          configured one. Nodes being recovered or replaced, nodes
+          younger than the minimum node lifetime and nodes pinned by a
+          reservation are never drained.
+        - Drains started in previous runs are left to settle, then retried
+          with backoff, and the nodes whose drain is stuck are replaced.
+        - While scale-in is disabled, the desired capacities are never
+          lowered and no idle node is drained.
+
+    Args:
+        view (ClusterView): Joined state of the cluster.
+
+    Returns:
+        plan (ReconcilePlan): Operations to issue.
+    """
+    # Spare workers are part of the demand so that they are stabilized and
+    # kept like any other worker
+    wanted_workers = capacity_control.add_headroom(
+        view.cluster_capacity.desired_workers,
+        view.headroom_workers,
+        view.headroom_percent,
+    )
+    if wanted_workers != view.cluster_capacity.desired_workers:
+        logger.info(
+            "Demand of %s workers with headroom: %s workers",
+            view.cluster_capacity.desired_workers,
+            wanted_workers,
+        )
+
+    settings = view.stabilization
+    demand_history = stabilization.record_demand(
+        view.demand_history,
+        view.read_at,
+        wanted_workers,
+        max(settings.scale_out_window_seconds, settings.scale_in_window_seconds),
+    )
+    desired_workers = stabilization.get_stabilized_demand(
+        demand_history,
+        view.read_at,
+        settings,
+        pools.get_desired_workers(view.pools_capacity),
+    )
+
+    boot_latency_state = boot_latency.update_boot_latency(
+        view.boot_latency, view.nodes, view.read_at
+    )
+    lead_seconds = boot_latency.get_boot_latency_seconds(boot_latency_state)
+
+    idle_gaps = idle_timeout.update_idle_gaps(view.idle_gaps, view.nodes_seconds_idle)
+    idle_timeout_seconds = view.idle_timeout_seconds
+    if view.adaptive_idle_timeout:
+        idle_timeout_seconds = idle_timeout.get_adaptive_idle_timeout(
+            idle_gaps,
+            view.idle_timeout_seconds,
+            lead_seconds,
+            view.idle_timeout_boot_delay_weight,
+        )
+    logger.info(
+        "Idle timeout is %ss (configured %ss, %d idle gaps measured)",
+        idle_timeout_seconds,
+        view.idle_timeout_seconds,
+        len(idle_gaps["samples"]),
+    )
+
+    demand_forecast = view.demand_forecast
+    if view.forecast.enabled:
+        demand_forecast = forecast.update_model(
+            view.demand_forecast,
+            view.read_at,
+            view.cluster_capacity.desired_workers,
+            view.forecast.bucket_seconds,
+            view.forecast.season_buckets,
+        )
+        forecast_workers = forecast.get_forecast(
+            demand_forecast, view.read_at + lead_seconds
+        )
+        logger.debug("Forecast demand in %ss: %s workers", lead_seconds, forecast_workers)
+        if forecast_workers is not None:
+            forecast_workers = capacity_control.add_headroom(
+                forecast_workers, view.headroom_workers, view.headroom_percent
+            )
+        if forecast_workers is not None and forecast_workers > desired_workers:
+            logger.info(
+                "Pre-launching capacity for a forecast demand of %s workers in %ss",
+                forecast_workers,
+                lead_seconds,
+            )
+            desired_workers = forecast_workers
+
+    # Scheduled windows are pre-launched so that workers are registered when
+    # they open
+    scheduled_nodes = max(
+        schedules.get_scheduled_floor(
+            view.capacity_schedules, datetime.fromtimestamp(at, timezone.utc)
+        )
+        for at in (view.read_at, view.read_at + lead_seconds)
+    )
+    scheduled_workers = capacity_control.get_worker_count_from_nodes(
+        scheduled_nodes, view.cloud_capacity.workers_per_node
+    )
+    if scheduled_workers > desired_workers:
+        logger.info(
+            "Capacity schedules require at least %s nodes within %ss",
+            scheduled_nodes,
+            lead_seconds,
+        )
+        desired_workers = scheduled_workers
+
+    reserved_workers = sum(r["workers"] for r in view.reservations)
+    if reserved_workers > desired_workers:
+        logger.info(
+            "%d reservations require at least %s workers",
+            len(view.reservations),
+            reserved_workers,
+        )
+        desired_workers = reserved_workers
+
+    # Workers without a license cannot run, so no nodes are launched for them.
+    # Running nodes are never released because of the licenses.
+    if view.license_usage is not None:
+        license_cap_workers = license_capacity.get_license_cap_workers(
+            view.license_usage, {record.hostname for record in view.nodes}
+        )
+        capped_workers = max(
+            min(desired_workers, license_cap_workers),
+            min(desired_workers, pools.get_desired_workers(view.pools_capacity)),
+        )
+        logger.debug(
+            "Licenses: %s issued, %s in use, %s workers can run",
+            view.license_usage.issued,
+            view.license_usage.in_use,
+            license_cap_workers,
+        )
+        if capped_workers < desired_workers:
+            logger.warning(
+                "Licenses can only run %s workers, capping the demand of %s workers to %s",
+                license_cap_workers,
+                desired_workers,
+                capped_workers,
+            )
+            desired_workers = capped_workers
+
+    pools_desired_workers = pools.split_demand(
+        desired_workers, view.pools, view.pools_capacity, view.pool_split_policy
+    )
+    # While scale-in is disabled, the desired capacity of the pools only grows
+    if not view.scale_in_enabled:
+        pools_desired_workers = {
+            pool: max(
+                workers,
+                view.pools_capacity[pool].desired_nodes
+                * view.pools_capacity[pool].workers_per_node,
+            )
+            for pool, workers in pools_desired_workers.items()
+        }
+    maximum_workers, desired_nodes = capacity_control.get_capacity_targets(
+        view.pools_capacity, view.cluster_capacity, pools_desired_workers
+    )
+    for pool, pool_desired_nodes in list(desired_nodes.items()):
+        pool_capacity = view.pools_capacity[pool]
+        # Stages are counted from the nodes that came up, not the ones
+        # still booting
+        ready_nodes = sum(
+            1
+            for record in view.nodes.in_pool(pool)
+            if record.lifecycle_state == "InService" and record.registered
+        )
+        pool_desired_nodes = capacity_control.limit_surge(
+            pool_capacity,
+            pool_desired_nodes,
+            view.max_surge_nodes,
+            view.max_surge_percent,
+            ready_nodes,
+        )
+        if pool_desired_nodes > pool_capacity.desired_nodes:
+            logger.debug(
+                "Nodes of pool %s per availability zone: %s",
+                pool,
+                dict(
+                    Counter(
+                        record.availability_zone for record in view.nodes.in_pool(pool)
+                    )
+                ),
+            )
+
+        if capacity_control.is_scaling_in_flight(
+            view.scaling_request.get(pool, {}),
+            pool_capacity,
+            pool_desired_nodes,
+            view.read_at,
+        ):
+            del desired_nodes[pool]
+        else:
+            desired_nodes[pool] = pool_desired_nodes
+
+    nodes_actions = {record.hostname: NODE_KEEP for record in view.nodes}
+
+    # Nodes being drained look unhealthy once their workers stopped, and must
+    # not be picked again while their drain settles
+    drains = drain_journal.get_drain_decisions(
+        view.drain_journal, view.nodes, view.read_at
+    )
+    if drains.journal:
+        logger.debug(
+            "%d drains in flight, %d to retry: %s",
+            len(drains.in_flight),
+            len(drains.retry),
+            set(drains.journal),
+        )
+    for node in drains.retry:
+        nodes_actions[node] = NODE_DRAIN
+    for node in drains.stuck:
+        logger.error(
+            "Drain of node %s is stuck after %s attempts, replacing it",
+            node,
+            drains.journal[node]["attempts"],
+        )
+        nodes_actions[node] = NODE_REPLACE
+
+    unhealthy_nodes = health_check.get_unhealthy_nodes(
+        set(view.nodes_state) - set(drains.journal),
+        view.suspended_nodes,
+        set(view.nodes_seconds_idle),
+    )
+    interrupted_nodes = health_check.get_interrupted_nodes(
+        unhealthy_nodes, view.heartbeats
+    )
+    for node in unhealthy_nodes:
+        nodes_actions[node] = (
+            NODE_REPLACE if node in interrupted_nodes else NODE_RECOVER
+        )
+
+    # Nodes above the desired capacity of each pool, not counting the nodes
+    # already being drained
+    draining_nodes = Counter(
+        record.pool
+        for record in map(view.nodes.by_host, drains.journal)
+        if record.lifecycle_state in ("Pending", "InService")
+        and record.health_status == "Healthy"
+    )
+    pools_node_difference = {
+        pool: capacity.current_nodes
+        - draining_nodes[pool]
+        - desired_nodes.get(pool, capacity.desired_nodes)
+        for pool, capacity in view.pools_capacity.items()
+    }
+    node_difference = sum(pools_node_difference.values())
+
+    if node_difference > 0:
+        logger.info(
+            "(<) The desired capacity is lower than the current capacity by "
+            "%s nodes",
+            node_difference
+        )
+    elif node_difference < 0:
+        logger.info("(>) The desired capacity is higher than the current capacity")
+    else:
+        logger.info("(=) The desired capacity matches the current capacity")
+
+    young_nodes = {
+        node
+        for node in view.nodes_seconds_idle
+        if view.nodes.by_host(node).uptime_seconds() < settings.min_node_lifetime_seconds
+    }
+    if node_difference > 0 and young_nodes:
+        logger.debug(
+            "%d nodes younger than %ss are kept: %s",
+            len(young_nodes),
+            settings.min_node_lifetime_seconds,
+            young_nodes,
+        )
+
+    reserved_nodes = {
+        host for r in view.reservations for host in r["hosts"]
+    } & set(view.nodes_seconds_idle)
+    if node_difference > 0 and reserved_nodes:
+        logger.debug("%d reserved nodes are kept: %s", len(reserved_nodes), reserved_nodes)
+
+    # Drains started before scale-in was disabled are still completed
+    if not view.scale_in_enabled:
+        logger.info("Scale-in is disabled, idle nodes are kept")
+        pools_node_difference = {}
+
+    for pool, pool_node_difference in pools_node_difference.items():
+        pool_nodes = view.nodes.in_pool(pool)
+        nodes_to_stop = scale_in_protection.get_nodes_to_stop(
+            {
+                node: seconds_idle
+                for node, seconds_idle in view.nodes_seconds_idle.items()
+                if node in pool_nodes
+                and nodes_actions[node] == NODE_KEEP
+                and node not in drains.journal
+                and node not in young_nodes
+                and node not in reserved_nodes
+            },
+            idle_timeout_seconds,
+            pool_node_difference,
+            pool_nodes,
+            view.scale_in_criteria,
+        )
+        for node in nodes_to_stop:
+            nodes_actions[node] = NODE_DRAIN
+
+    return ReconcilePlan(
+        maximum_workers=maximum_workers,
+        desired_nodes=desired_nodes,
+        nodes_actions=nodes_actions,
+        demand_history=demand_history,
+        demand_forecast=demand_forecast,
+        boot_latency=boot_latency_state,
+        idle_gaps=idle_gaps,
+        drain_journal=drains.journal,
+    )
+
+
+def apply(
+    plan: ReconcilePlan,
+    view: ClusterView,
+    cloud_interface: CloudInterface,
+    os_interface: OSInterface,
+    cluster_management_interface: ClusterManagementProgramInterface,
+) -> int:
+    """Issue the operations of the plan, batching the node operations.
+
+    Args:
+        plan (ReconcilePlan): Operations to issue.
+        view (ClusterView): Joined state the plan was computed from.
+        cloud_interface (CloudInterface): Cloud provider specific
+        implementation of AbstractCloudInterface.
+        os_interface (OSInterface): Operating system specific implementation
+        of AbstractOSInterface.
+        cluster_management_interface (ClusterManagementProgramInterface): Class
+        to read and update the state and config of the program.
+
+    Returns:
+        status (int): Status code of program.
+                        0: Successful
+                        1: Faced an issue with cloud provider
+                        2: Faced an issue with cluster
+                        3: Faced an issue with both
+    """
+    cluster_issue, cloud_issue = False, False
+
+    # Updating the jobmanager's maximum possible number of workers
+    if plan.maximum_workers is not None:
+        if os_interface.set_cluster_capacity(
+            plan.maximum_workers, view.job_managers_capacity
+        ):
+            logger.info("Updated the cluster's maximum capacity")
+        else:
+            logger.info("Failed to update the cluster's maximum capacity")
+            cluster_issue = True
+
+    # Updating the desired number of nodes of the worker pools at once
+    pools_set = set()
+    if plan.desired_nodes:
+        pools_set = cloud_interface.set_pools_capacity(plan.desired_nodes)
+        if pools_set:
+            logger.info("Updated the cloud platform's desired capacity")
+        if pools_set != set(plan.desired_nodes):
+            logger.info(
+                "Failed to update the cloud platform's desired capacity of pools: %s",
+                set(plan.desired_nodes) - pools_set,
+            )
+            cloud_issue = True
+
+    now = time.time()
+    timeout_seconds = int(
+        cluster_management_interface.cluster_management_config[
+            SCALING_CONVERGENCE_TIMEOUT_SECONDS
+        ]
+    )
+    scaling_request = {}
+    for pool, pool_capacity in view.pools_capacity.items():
+        pool_scaling_request = capacity_control.track_scaling_request(
+            view.scaling_request.get(pool, {}),
+            pool_capacity,
+            plan.desired_nodes[pool] if pool in pools_set else None,
+            now,
+            timeout_seconds,
+        )
+        if pool_scaling_request:
+            scaling_request[pool] = pool_scaling_request
+    if scaling_request != view.scaling_request:
+        cluster_management_interface.update_state({SCALING_REQUEST: scaling_request})
+    cluster_management_interface.update_state(
+        {
+            DEMAND_HISTORY: plan.demand_history,
+            DEMAND_FORECAST: plan.demand_forecast,
+            BOOT_LATENCY: plan.boot_latency,
+            IDLE_GAPS: plan.idle_gaps,
+        }
+    )
+
+    # Record nodes previously recovered in place that registered again
+    if view.nodes_state:
+        os_interface.track_worker_recoveries(set(view.nodes_seconds_idle))
+
+    if not _apply_health(plan, view, cloud_interface, os_interface):
+        cloud_issue = True
+
+    # The nodes to drain were picked for the requested desired capacity of
+    # their pool
+    pools_not_set = set(plan.desired_nodes) - pools_set
+    if pools_not_set:
+        logger.info(
+            "Not draining nodes of pools %s as their desired capacity was not updated",
+            pools_not_set,
+        )
+    drain_cloud_issue, drain_cluster_issue, journal = _apply_drain(
+        plan, view, cloud_interface, os_interface, pools_not_set
+    )
+    if journal != view.drain_journal:
+        cluster_management_interface.update_state({DRAIN_JOURNAL: journal})
+    cloud_issue = cloud_issue or drain_cloud_issue
+    cluster_issue = cluster_issue or drain_cluster_issue
+
+    if cloud_issue and cluster_issue:
+        return STATUS_CLOUD_AND_CLUSTER_ISSUE
+    elif cloud_issue:
+        return STATUS_CLOUD_ISSUE
+    elif cluster_issue:
+        return STATUS_CLUSTER_ISSUE
+    else:
+        return STATUS_SUCCESS
+
+
+def _apply_health(
+    plan: ReconcilePlan,
+    view: ClusterView,
+    cloud_interface: CloudInterface,
+    os_interface: OSInterface,
+) -> bool:
+    """Recover unhealthy nodes in place and mark the others as unhealthy in a
+    single call. The cloud platform then replaces them.
+
+    Returns:
+        success (bool): False if the nodes could not be marked as unhealthy.
+    """
+    nodes_to_recover = plan.nodes_with_action(NODE_RECOVER)
+    nodes_to_replace = plan.nodes_with_action(NODE_REPLACE)
+    if not nodes_to_recover and not nodes_to_replace:
+        logger.info("All nodes are healthy")
+        return True
+
+    nodes_recovering = set()
+    if nodes_to_recover:
+        logger.info("Attempting in-place recovery of unhealthy nodes: %s", nodes_to_recover)
+        # Workers are restarted with the number of workers per node of the
+        # node's pool
+        for pool, pool_capacity in view.pools_capacity.items():
+            pool_nodes_state = {
+                host: view.nodes_state[host]
+                for host in nodes_to_recover
+                if view.nodes.by_host(host).pool == pool
+            }
+            if pool_nodes_state:
+                nodes_recovering |= os_interface.recover_workers_on_nodes(
+                    pool_nodes_state,
+                    pool_capacity.workers_per_node,
+                    view.job_managers_capacity,
+                )
+        logger.debug("%d nodes recovering in place: %s",
+                     len(nodes_recovering), nodes_recovering)
+        logger.debug("Worker recovery statistics: %s", os_interface.worker_recovery["stats"])
+
+    nodes_to_mark_unhealthy = nodes_to_replace | (nodes_to_recover - nodes_recovering)
+    if not nodes_to_mark_unhealthy:
+        logger.info("All unhealthy nodes are being recovered in place")
+        return True
+
+    logger.info("Marking suspended and unregistered nodes as unhealthy: %s",
+                nodes_to_mark_unhealthy)
+    if not cloud_interface.set_nodes_unhealthy(nodes_to_mark_unhealthy, view.nodes):
+        logger.error("Failed to mark nodes as unhealthy")
+        return False
+
+    return True
+
+
+def _apply_drain(
+    plan: ReconcilePlan,
+    view: ClusterView,
+    cloud_interface: CloudInterface,
+    os_interface: OSInterface,
+    skipped_pools: Set[str],
+) -> Tuple[bool, bool, Dict[str, Dict]]:
+    """Stop the workers of the nodes to drain and unprotect each batch of nodes
+    as soon as their workers are confirmed stopped. Nodes of the skipped pools
+    are not drained. Nodes whose workers already stopped in a previous attempt
+    are only unprotected.
+
+    Returns:
+        cloud_issue (bool): True if some nodes could not be unprotected.
+        cluster_issue (bool): True if some workers could not be stopped.
+        journal (Dict[str, Dict]): Drain journal including the attempts of
+        this run.
+    """
+    nodes_to_drain = {
+        node
+        for node in plan.nodes_with_action(NODE_DRAIN)
+        if view.nodes.by_host(node).pool not in skipped_pools
+    }
+    if not nodes_to_drain:
+        logger.info("No nodes to stop")
+        return False, False, plan.drain_journal
+
+    cloud_issue, cluster_issue = False, False
+    nodes_to_stop = {node for node in nodes_to_drain if view.nodes.by_host(node).registered}
+    nodes_stopped = nodes_to_drain - nodes_to_stop
+    nodes_unprotected = set()
+    if nodes_stopped:
+        logger.debug("Workers already stopped on %s nodes: %s", len(nodes_stopped), nodes_stopped)
+        nodes_unprotected.update(
+            cloud_interface.set_nodes_protection(nodes_stopped, False, view.nodes)
+        )
+
+    for nodes_batch in os_interface.stop_workers_on_nodes_streaming(nodes_to_stop):
+        logger.debug("Stopped workers on %s nodes: %s", len(nodes_batch), nodes_batch)
+        nodes_stopped.update(nodes_batch)
+        nodes_unprotected.update(
+            cloud_interface.set_nodes_protection(nodes_batch, False, view.nodes)
+        )
+
+    if nodes_to_drain != nodes_stopped:
+        failed_nodes = nodes_to_drain - nodes_stopped
+        logger.debug(
+            "Failed to stop workers on %s nodes: %s", len(failed_nodes), failed_nodes
+        )
+        cluster_issue = True
+
+    if nodes_stopped != nodes_unprotected:
+        failed_nodes = nodes_stopped - nodes_unprotected
+        logger.debug(
+            "Failed to unprotect %s nodes: %s", len(failed_nodes), failed_nodes
+        )
+        cloud_issue = True
+
+    if nodes_unprotected:
+        logger.debug("Unprotected %s nodes", len(nodes_unprotected))
+
+    journal = drain_journal.record_drain_attempts(
+        plan.drain_journal,
+        view.nodes,
+        nodes_to_drain,
+        nodes_stopped,
+        nodes_unprotected,
+        time.time(),
+    )
+    return cloud_issue, cluster_issue, journal
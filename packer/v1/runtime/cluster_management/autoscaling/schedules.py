@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+from datetime import datetime, timedelta, timezone
+import logging
+from typing import Dict, List, Set
+
+logger = logging.getLogger("cluster_management.autoscaling.schedules")
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def get_scheduled_floor(schedules: List[Dict], at: datetime) -> int:
+    """Get the minimum number of nodes the capacity schedules require at a
+    given time.
+
+    A schedule is a dictionary such as
+        {"days": "Mon-Fri", "start": "08:00", "end": "18:00", "min_nodes": 20}
+    keeping at least 20 nodes from 08:00 to 18:00 UTC on weekdays. "days" is
+    "*", a range of days or a list of days and ranges, e.g. ["Mon", "Sat-Sun"].
+    A window whose end is before its start ends on the next day. Invalid
+    schedules are logged and ignored.
+
+    Args:
+        schedules (List[Dict]): Capacity schedules.
+        at (datetime): Time to evaluate the schedules at.
+
+    Returns:
+        min_nodes (int): Highest minimum number of nodes among the active
+        windows, 0 if none is active.
+    """
+    at = at.astimezone(timezone.utc)
+    floor = 0
+    for schedule in schedules:
+        try:
+            if _is_active(schedule, at):
+                floor = max(floor, int(schedule["min_nodes"]))
+
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error("Ignoring invalid capacity schedule %s: %s", schedule, e)
+
+    return floor
+
+
+def _is_active(schedule: Dict, at: datetime) -> bool:
+    """Check whether the window of a schedule contains a time."""
+    days = _parse_days(schedule.get("days", "*"))
+    start = datetime.strptime(schedule["start"], "%H:%M").time()
+    end = datetime.strptime(schedule["end"], "%H:%M").time()
+
+    if start < end:
+        return at.weekday() in days and start <= at.time() < end
+
+    # The window ends on the next day
+    previous_day = (at - timedelta(days=1)).weekday()
+    return (at.weekday() in days and at.time() >= start) or (
+        previous_day in days and at.time() < end
+    )
+
+
+def _parse_days(days) -> Set[int]:
+    """Parse the days of a schedule into weekday numbers (Monday is 0)."""
+    if isinstance(days, str):
+        days = [days]
+
+    weekdays = set()
+    for item in days:
+        item = item.strip().lower()
+        if item == "*":
+            return set(range(7))
+
+        first, _, last = item.partition("-")
+        first_day = WEEKDAYS.index(first[:3])
+        last_day = WEEKDAYS.index(last[:3]) if last else first_day
+        day = first_day
+        weekdays.add(day)
+        while day != last_day:
+            day = (day + 1) % 7
+            weekdays.add(day)
+
+    return weekdays
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+from contextlib import contextmanager
+import logging
+from typing import Dict, List, Mapping
+
+from autoscaling import reconciler
+from autoscaling.reconciler import ClusterView, ReconcilePlan
+
+logger = logging.getLogger("cluster_management.autoscaling.shadow")
+
+# Name the active policy is recorded under
+ACTIVE_POLICY = "active"
+
+# Longest interval between two runs counted in the projections, so that a
+# stopped program does not count hours it did not observe
+MAX_PROJECTION_INTERVAL_SECONDS = 600
+
+
+def evaluate(
+    view: ClusterView,
+    active_plan: ReconcilePlan,
+    candidates: List[Dict],
+    config: Mapping,
+    evaluation: Dict,
+) -> Dict:
+    """Plan the candidate policies on the view of the active policy, without
+    issuing any operation, and log their decisions next to the active one.
+
+    Each candidate is a {"name": str, "overrides": Dict} entry, whose
+    overrides replace keys of the cluster management config. The demand
+    history and forecasting model of each candidate are kept apart, so that
+    its stabilization and forecast only see its own decisions.
+
+    For the active policy and each candidate, the node-hours and the unmet
+    worker-hours of the desired capacity they plan are added up across runs.
+    They are projections: the desired capacity is counted as reached, and the
+    demand the candidates are planned for is the one the active policy's
+    cluster sees.
+
+    Args:
+        view (ClusterView): Joined state of the cluster.
+        active_plan (ReconcilePlan): Plan of the active policy.
+        candidates (List[Dict]): Candidate policies.
+        config (Mapping): Cluster management program config.
+        evaluation (Dict): Shadow evaluation state, with the time of the
+        previous run ("last_at") and the projections and state of each
+        policy ("policies").
+
+    Returns:
+        evaluation (Dict): Updated shadow evaluation state.
+    """
+    interval_seconds = 0
+    if "last_at" in evaluation:
+        interval_seconds = min(
+            max(view.read_at - evaluation["last_at"], 0), MAX_PROJECTION_INTERVAL_SECONDS
+        )
+
+    previous_policies = evaluation.get("policies", {})
+    policies = {
+        ACTIVE_POLICY: _project(
+            previous_policies.get(ACTIVE_POLICY, {}), view, active_plan, interval_seconds
+        )
+    }
+    _log_decisions(ACTIVE_POLICY, active_plan, policies[ACTIVE_POLICY])
+
+    for candidate in candidates:
+        name = candidate.get("name")
+        if not name or name == ACTIVE_POLICY or name in policies:
+            logger.error("Skipping shadow policy with a missing or duplicate name: %s", candidate)
+            continue
+
+        unknown_keys = set(candidate.get("overrides", {})) - set(config)
+        if unknown_keys:
+            logger.error("Skipping shadow policy %s with unknown settings: %s", name, unknown_keys)
+            continue
+
+        previous = previous_policies.get(name, {})
+        try:
+            # The candidate's logs would be mistaken for the active ones
+            with _quiet("cluster_management.autoscaling"):
+                candidate_view = view._replace(
+                    demand_history=previous.get("demand_history", view.demand_history),
+                    demand_forecast=previous.get("demand_forecast", view.demand_forecast),
+                    **reconciler.get_policy_settings(
+                        dict(config, **candidate.get("overrides", {}))
+                    ),
+                )
+                candidate_plan = reconciler.plan(candidate_view)
+
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error("Failed to plan shadow policy %s: %s", name, e)
+            continue
+
+        policies[name] = dict(
+            _project(previous, view, candidate_plan, interval_seconds),
+            demand_history=candidate_plan.demand_history,
+            demand_forecast=candidate_plan.demand_forecast,
+        )
+        _log_decisions(name, candidate_plan, policies[name])
+
+    return {"last_at": view.read_at, "policies": policies}
+
+
+def _project(
+    projection: Dict, view: ClusterView, plan: ReconcilePlan, interval_seconds: float
+) -> Dict:
+    """Add the node-hours and unmet worker-hours of the desired capacity of a
+    plan over the interval since the previous run."""
+    nodes, workers = 0, 0
+    for pool, capacity in view.pools_capacity.items():
+        pool_nodes = plan.desired_nodes.get(pool, capacity.desired_nodes)
+        nodes += pool_nodes
+        workers += pool_nodes * capacity.workers_per_node
+    unmet_workers = max(view.cluster_capacity.desired_workers - workers, 0)
+
+    return {
+        "nodes": nodes,
+        "runs": projection.get("runs", 0) + 1,
+        "node_hours": projection.get("node_hours", 0.0) + nodes * interval_seconds / 3600,
+        "unmet_worker_hours": projection.get("unmet_worker_hours", 0.0)
+        + unmet_workers * interval_seconds / 3600,
+    }
+
+
+def _log_decisions(name: str, plan: ReconcilePlan, projection: Dict) -> None:
+    logger.info(
+        "Policy %-20s desired nodes %4d, drain %3d, replace %3d | "
+        "%.1f node-hours, %.1f unmet worker-hours over %d runs",
+        name,
+        projection["nodes"],
+        len(plan.nodes_with_action(reconciler.NODE_DRAIN)),
+        len(plan.nodes_with_action(reconciler.NODE_REPLACE)),
+        projection["node_hours"],
+        projection["unmet_worker_hours"],
+        projection["runs"],
+    )
+
+
+@contextmanager
+def _quiet(name: str):
+    """Only let the errors of a logger and its children through."""
+    quieted_logger = logging.getLogger(name)
+    level = quieted_logger.level
+    quieted_logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        quieted_logger.setLevel(level)
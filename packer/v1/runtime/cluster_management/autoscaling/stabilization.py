@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+import logging
+from typing import List, Mapping, NamedTuple
+
+from constants import (
+    SCALE_OUT_STABILIZATION_SECONDS,
+    SCALE_IN_STABILIZATION_SECONDS,
+    MIN_NODE_LIFETIME_SECONDS,
+)
+
+logger = logging.getLogger("cluster_management.autoscaling.stabilization")
+
+
+class StabilizationSettings(NamedTuple):
+    """Class defining the anti-flapping parameters of autoscaling."""
+
+    # Seconds during which a higher demand must be sustained before scaling out
+    scale_out_window_seconds: int
+    # Seconds during which a lower demand must be sustained before scaling in
+    scale_in_window_seconds: int
+    # Seconds a node must have been running for before it can be drained
+    min_node_lifetime_seconds: int
+
+
+def get_settings(config: Mapping) -> StabilizationSettings:
+    """Read the anti-flapping parameters from the cluster management config.
+
+    Args:
+        config (Mapping): Cluster management program config.
+
+    Returns:
+        settings (StabilizationSettings): Anti-flapping parameters.
+    """
+    settings = StabilizationSettings(
+        scale_out_window_seconds=int(config[SCALE_OUT_STABILIZATION_SECONDS]),
+        scale_in_window_seconds=int(config[SCALE_IN_STABILIZATION_SECONDS]),
+        min_node_lifetime_seconds=int(config[MIN_NODE_LIFETIME_SECONDS]),
+    )
+    logger.debug("Stabilization settings: %s", settings)
+    return settings
+
+
+def record_demand(
+    demand_history: List[List], now: float, desired_workers: int, retention_seconds: int
+) -> List[List]:
+    """Add the current demand to the demand history and drop the samples
+    older than the retention.
+
+    Args:
+        demand_history (List[List]): [time, desired workers] samples.
+        now (float): Current time in seconds since the epoch.
+        desired_workers (int): Current desired number of workers.
+        retention_seconds (int): Age of the oldest sample to keep.
+
+    Returns:
+        demand_history (List[List]): Updated samples, oldest first.
+    """
+    return [
+        sample for sample in demand_history if now - sample[0] <= retention_seconds
+    ] + [[now, desired_workers]]
+
+
+def get_stabilized_demand(
+    demand_history: List[List],
+    now: float,
+    settings: StabilizationSettings,
+    capacity_workers: int,
+) -> int:
+    """Smooth the demand so that the capacity only changes when the change
+    of demand has been sustained.
+
+    The cluster scales out to the lowest demand of the scale-out window, so
+    that a short peak does not launch nodes. It scales in to the highest
+    demand of the scale-in window, so that a short dip does not drain nodes.
+    Otherwise, the capacity is kept.
+
+    Args:
+        demand_history (List[List]): [time, desired workers] samples,
+        including the current demand.
+        now (float): Current time in seconds since the epoch.
+        settings (StabilizationSettings): Anti-flapping parameters.
+        capacity_workers (int): Number of workers the current desired
+        capacity of the cloud platform holds.
+
+    Returns:
+        desired_workers (int): Stabilized desired number of workers.
+    """
+    current_demand = demand_history[-1][1]
+    scale_out_demand = min(
+        workers
+        for sampled_at, workers in demand_history
+        if now - sampled_at <= settings.scale_out_window_seconds
+        or sampled_at == now
+    )
+    scale_in_demand = max(
+        workers
+        for sampled_at, workers in demand_history
+        if now - sampled_at <= settings.scale_in_window_seconds
+        or sampled_at == now
+    )
+
+    if scale_out_demand > capacity_workers:
+        desired_workers = scale_out_demand
+    elif scale_in_demand < capacity_workers:
+        desired_workers = scale_in_demand
+    else:
+        desired_workers = capacity_workers
+
+    if desired_workers != current_demand:
+        logger.info(
+            "Demand of %s workers stabilized to %s workers "
+            "(scale-out: min %s over %ss, scale-in: max %s over %ss)",
+            current_demand,
+            desired_workers,
+            scale_out_demand,
+            settings.scale_out_window_seconds,
+            scale_in_demand,
+            settings.scale_in_window_seconds,
+        )
+
+    return desired_workers
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+from collections import Counter
+import logging
+from typing import Callable, Dict, List, Set
+
+from mwplatforminterfaces import ClusterModel, NodeRecord
+
+logger = logging.getLogger("cluster_management.autoscaling.victim_scoring")
+
+
+class ScoringContext:
+    """Class holding the cluster-wide information the criteria rank the
+    candidates with. It is updated as victims are picked."""
+
+    def __init__(self, nodes: ClusterModel) -> None:
+        # Number of nodes left in each availability zone
+        self.zone_nodes = Counter(
+            record.availability_zone
+            for record in nodes
+            if record.instance_id is not None and record.availability_zone
+        )
+
+    def release(self, record: NodeRecord) -> None:
+        """Record that a node was picked for scale-in."""
+        if record.availability_zone:
+            self.zone_nodes[record.availability_zone] -= 1
+
+
+# A criterion returns a score for a candidate. Candidates with the lowest
+# score are released first.
+Criterion = Callable[[NodeRecord, ScoringContext], float]
+
+
+def longest_idle(record: NodeRecord, context: ScoringContext) -> float:
+    """Release the nodes that have been idle for the longest time first."""
+    return -(record.seconds_idle or 0)
+
+
+def balance_zones(record: NodeRecord, context: ScoringContext) -> float:
+    """Release nodes from the availability zones with the most nodes first,
+    so that the Auto Scaling group does not rebalance the zones by launching
+    and terminating nodes."""
+    return -context.zone_nodes.get(record.availability_zone, 0)
+
+
+def on_demand_first(record: NodeRecord, context: ScoringContext) -> float:
+    """Release On-Demand nodes before Spot nodes."""
+    return 1 if record.purchase_option == "spot" else 0
+
+
+def spot_first(record: NodeRecord, context: ScoringContext) -> float:
+    """Release Spot nodes before On-Demand nodes."""
+    return 0 if record.purchase_option == "spot" else 1
+
+
+def coldest_cache(record: NodeRecord, context: ScoringContext) -> float:
+    """Release the most recently launched nodes first. Their local caches
+    (MATLAB files, attached files, data) have had the least time to warm up."""
+    return record.uptime_seconds()
+
+
+CRITERIA: Dict[str, Criterion] = {
+    "longest_idle": longest_idle,
+    "balance_zones": balance_zones,
+    "on_demand_first": on_demand_first,
+    "spot_first": spot_first,
+    "coldest_cache": coldest_cache,
+}
+
+DEFAULT_CRITERIA = ["balance_zones", "longest_idle"]
+
+
+def get_criteria(names: List[str]) -> List[Criterion]:
+    """Get the criteria from their names, ignoring unknown ones.
+
+    Args:
+        names (List[str]): Names of the criteria, most important first.
+
+    Returns:
+        criteria (List[Criterion]): Criteria, most important first.
+    """
+    criteria = []
+    for name in names:
+        if name in CRITERIA:
+            criteria.append(CRITERIA[name])
+        else:
+            logger.error("Unknown scale-in criterion: %s", name)
+
+    return criteria or [CRITERIA[name] for name in DEFAULT_CRITERIA]
+
+
+def pick_victims(
+    candidates: Set[str], nodes: ClusterModel, criteria: List[Criterion], count: int
+) -> List[str]:
+    """Pick the nodes to release among the candidates. The candidates are
+    ranked by the first criterion, ties being broken by the next criteria.
+    The ranking is updated after each pick as picking a node changes the
+    cluster-wide information, e.g. the number of nodes per zone.
+
+    Args:
+        candidates (Set[str]): Hostnames of the nodes that can be released.
+        nodes (ClusterModel): Worker nodes records.
+        criteria (List[Criterion]): Criteria, most important first.
+        count (int): Maximum number of nodes to release.
+
+    Returns:
+        victims (List[str]): Hostnames of the nodes to release, in the order
+        they were picked.
+    """
+    context = ScoringContext(nodes)
+    remaining = {host: nodes.by_host(host) for host in candidates}
+    victims = []
+    while remaining and len(victims) < count:
+        host = min(
+            sorted(remaining),
+            key=lambda h: tuple(c(remaining[h], context) for c in criteria),
+        )
+        record = remaining.pop(host)
+        logger.debug(
+            "  picked %s for scale-in: %s",
+            host,
+            {c.__name__: c(record, context) for c in criteria},
+        )
+        context.release(record)
+        victims.append(host)
+
+    return victims
@@ -0,0 +1,133 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import logging
+
+logger = logging.getLogger("cluster_management.cadence")
+
+# Factor by which the interval grows after each run in steady state
+STEADY_STATE_BACKOFF = 1.5
+
+
+class TickCadence:
+    """
+    Class to choose the interval between two runs of the cluster management
+    program in daemon mode.
+
+    The interval drops to its minimum while the cluster is changing size or
+    its demand is changing, and grows towards its maximum while the cluster is
+    in steady state.
+    """
+
+    def __init__(self, base_seconds: int, minimum_seconds: int, maximum_seconds: int):
+        """
+        Args:
+            base_seconds (int): Interval used before any activity is known.
+            minimum_seconds (int): Interval used while the cluster is active.
+            maximum_seconds (int): Longest interval used in steady state.
+        """
+        self._minimum_seconds = min(minimum_seconds, base_seconds)
+        self._maximum_seconds = max(maximum_seconds, base_seconds)
+        self._interval = float(base_seconds)
+        self._desired_workers = None
+
+    @property
+    def interval(self) -> float:
+        '''Return the current interval in seconds.'''
+        return self._interval
+
+    def update(self, cloud_capacity, cluster_capacity=None) -> float:
+        """
+        Compute the interval until the next run from the activity of the
+        cluster seen by the last run. The interval is left unchanged if the
+        last run did not read the capacities.
+
+        Args:
+            cloud_capacity (CloudCapacity): Cloud-computing platform capacity
+            info read by the last run, or None.
+            cluster_capacity (ClusterCapacity): Cluster capacity info read by
+            the last run, or None.
+
+        Returns:
+            interval (float): Seconds until the next run.
+        """
+        if cloud_capacity is None:
+            return self._interval
+
+        previous_desired_workers = self._desired_workers
+        if cluster_capacity is not None:
+            self._desired_workers = cluster_capacity.desired_workers
+
+        if is_cluster_active(cloud_capacity, cluster_capacity, previous_desired_workers):
+            self._interval = self._minimum_seconds
+        else:
+            self._interval = min(
+                self._interval * STEADY_STATE_BACKOFF, self._maximum_seconds
+            )
+
+        logger.debug(
+            "Next run in %ss. Cloud capacities: %s. Cluster capacities: %s",
+            self._interval,
+            cloud_capacity,
+            cluster_capacity,
+        )
+        return self._interval
+
+    def check_overrun(self, elapsed_seconds: float) -> bool:
+        """
+        Check whether the last run took longer than the interval. The next run
+        then starts right away instead of overlapping with the last one.
+
+        Args:
+            elapsed_seconds (float): Duration of the last run.
+
+        Returns:
+            overrun (bool): True if the run overran the interval.
+        """
+        if elapsed_seconds > self._interval:
+            logger.warning(
+                "Run took %.1fs, longer than the %.1fs interval. Starting the next run now.",
+                elapsed_seconds,
+                self._interval,
+            )
+            return True
+
+        return False
+
+
+def is_cluster_active(
+    cloud_capacity, cluster_capacity=None, previous_desired_workers: int = None
+) -> bool:
+    """
+    Check whether the cluster is changing size or about to: the desired and
+    current capacities disagree, nodes are launching or draining, or the
+    MJS cluster wants more workers than it has or changed its demand since
+    the previous run.
+
+    Args:
+        cloud_capacity (CloudCapacity): Cloud-computing platform capacity info.
+        cluster_capacity (ClusterCapacity): Cluster capacity info, or None.
+        previous_desired_workers (int): Workers desired by the MJS cluster at
+        the previous run, or None.
+
+    Returns:
+        active (bool): True if the cluster is changing size.
+    """
+    if (
+        cloud_capacity.desired_nodes != cloud_capacity.current_nodes
+        or cloud_capacity.launching_nodes > 0
+        or cloud_capacity.draining_nodes > 0
+    ):
+        return True
+
+    if cluster_capacity is None:
+        return False
+
+    # Demand beyond the maximum size of the cluster cannot be met, it does not
+    # keep the cluster active
+    desired_workers = min(
+        cluster_capacity.desired_workers, cluster_capacity.maximum_workers
+    )
+    return desired_workers > cluster_capacity.current_workers or (
+        previous_desired_workers is not None
+        and cluster_capacity.desired_workers != previous_desired_workers
+    )
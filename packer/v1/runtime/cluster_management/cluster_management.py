@@ -2,7 +2,12 @@
 
 # Copyright 2024-2026 The MathWorks, Inc.
 
+import argparse
+import signal
 import sys
+import threading
+import time
+from typing import Callable
 
 from mwplatforminterfaces import CloudInterface
 from mwplatforminterfaces import OSInterface
@@ -12,6 +17,8 @@ from mwstate import set_mw_state
 from utils import terminate_cluster
 from utils import helpers
 from cluster_management_interface import ClusterManagementProgramInterface
+from cadence import TickCadence
+from control_socket import ControlServer
 
 
 from constants import (
@@ -22,6 +29,15 @@ from constants import (
     AUTOTERMINATION_ENABLED,
     USE_PRIVATE_IP_MAPPING,
     DNS_SEARCH_SUFFIX,
+    WORKER_POOLS,
+    NODESTATUS_CACHE,
+    WORKER_RECOVERY,
+    JOBMANAGER_HOST,
+    DAEMON_INTERVAL_SECONDS,
+    DAEMON_MIN_INTERVAL_SECONDS,
+    DAEMON_MAX_INTERVAL_SECONDS,
+    DEFAULT_DAEMON_INTERVAL_SECONDS,
+    CONTROL_SOCKET_PATH,
 )
 
 from logging_config import setup_logger
@@ -29,7 +45,7 @@ from logging_config import setup_logger
 logger = setup_logger("cluster_management")
 
 def main() -> int:
-    """Execute the cluster management program.
+    """Execute the cluster management program once.
 
     The program has two routines that are executed according to the user's choice:
         1. Auto-scaling: Resize cluster based on workload. 
@@ -52,21 +68,188 @@ def main() -> int:
             3: Faced an issue with both
             4: Faced an issue while reading/writing cluster management data json
     """
-    # Initialize status variables
-    autoscaling_status = STATUS_SUCCESS
-    termination_routine_status = STATUS_SUCCESS
-    cluster_termination_status = STATUS_SUCCESS
+    interfaces = connect()
+    if interfaces is None:
+        return STATUS_INTERNAL_READ_WRITE_ISSUE
 
-    logger.info("Connecting to cluster...")
-    os_interface = OSInterface()
+    return run_tick(*interfaces)
+
+
+def run_daemon(interval_seconds: int = None) -> int:
+    """Execute the cluster management program repeatedly in a long-running
+    process.
+
+    The cloud and cluster interfaces, their caches and the event loop are
+    kept alive between runs. The interval between two runs is shortened to
+    data['config']['daemon_min_interval_seconds'] while the cluster is
+    changing size or the job manager demand changes, and lengthened up to
+    data['config']['daemon_max_interval_seconds'] while it is in steady
+    state. A run that takes longer than the interval is logged and the next
+    run starts right after it. The program reacts to the following signals:
+        - SIGTERM: Finish the current run and exit.
+        - SIGHUP: Re-read the cluster management data file and reconnect
+          before the next run.
+
+    Runs can also be requested, the last view and plan inspected and config
+    settings overridden through the Unix domain socket at
+    data['config']['control_socket_path'], if set. See control_socket.py.
+
+    Args:
+        interval_seconds (int): Fixed number of seconds between the start of
+        two runs. By default, the interval adapts to the cluster activity,
+        starting from data['config']['daemon_interval_seconds'].
+
+    Returns:
+        status (int): Status code of the last run.
+    """
+    stop_requested = threading.Event()
+    reload_requested = threading.Event()
+    wake_up = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info("Received SIGTERM, stopping after the current run...")
+        stop_requested.set()
+        wake_up.set()
+
+    def request_reload(signum, frame):
+        logger.info("Received SIGHUP, reloading before the next run...")
+        reload_requested.set()
+        wake_up.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGHUP, request_reload)
+
+    status = STATUS_SUCCESS
+    interfaces, cadence, control = None, None, None
+    while not stop_requested.is_set():
+        tick_start = time.monotonic()
+        if interfaces is None or reload_requested.is_set():
+            reload_requested.clear()
+            interfaces = connect()
+            cadence = create_cadence(interfaces, interval_seconds)
+            if control is None and interfaces is not None:
+                control = create_control_server(interfaces, wake_up)
+        else:
+            # The data file is only read once, per-run state is updated in place
+            interfaces[2].refresh_state()
+
+        if interfaces is None:
+            status = STATUS_INTERNAL_READ_WRITE_ISSUE
+            interval = cadence.interval
+        else:
+            if control is not None:
+                interfaces[2].set_config_overrides(control.get_overrides())
+                control.start_run()
+            logger.info("Starting cluster management run ...")
+            # The capacities read by the autoscaling routine drive the cadence
+            plans = []
+            status = run_tick(
+                *interfaces, on_plan=lambda view, plan: plans.append((view, plan))
+            )
+            logger.info("Finished cluster management run: %s\n\n", status)
+            view = plans[-1][0] if plans else None
+            if control is not None:
+                if plans:
+                    control.publish_plan(*plans[-1])
+                control.finish_run(status)
+            interval = cadence.update(
+                view.cloud_capacity if view else None,
+                view.cluster_capacity if view else None,
+            )
+
+        elapsed = time.monotonic() - tick_start
+        if not cadence.check_overrun(elapsed):
+            wake_up.wait(interval - elapsed)
+        wake_up.clear()
+
+    if control is not None:
+        control.stop()
+
+    return status
+
+
+def create_control_server(interfaces, wake_up: threading.Event) -> ControlServer:
+    """Start serving the control requests of the daemon mode.
+
+    Args:
+        interfaces (Tuple): Interfaces returned by connect().
+        wake_up (threading.Event): Event interrupting the wait for the next
+        run.
+
+    Returns:
+        control (ControlServer): Control server, or None if the control
+        socket is disabled or could not be opened.
+    """
+    path = interfaces[2].cluster_management_config[CONTROL_SOCKET_PATH]
+    if not path:
+        return None
+
+    control = ControlServer(path, wake_up)
+    if not control.start():
+        return None
+
+    return control
+
+
+def create_cadence(interfaces, interval_seconds: int = None) -> TickCadence:
+    """Create the cadence controller of the daemon mode from the cluster
+    management configuration.
+
+    Args:
+        interfaces (Tuple): Interfaces returned by connect(), or None.
+        interval_seconds (int): Fixed interval overriding the configuration.
 
+    Returns:
+        cadence (TickCadence): Cadence controller.
+    """
+    if interval_seconds:
+        return TickCadence(interval_seconds, interval_seconds, interval_seconds)
+
+    if interfaces is None:
+        return TickCadence(
+            DEFAULT_DAEMON_INTERVAL_SECONDS,
+            DEFAULT_DAEMON_INTERVAL_SECONDS,
+            DEFAULT_DAEMON_INTERVAL_SECONDS,
+        )
+
+    config = interfaces[2].cluster_management_config
+    return TickCadence(
+        int(config[DAEMON_INTERVAL_SECONDS]),
+        int(config[DAEMON_MIN_INTERVAL_SECONDS]),
+        int(config[DAEMON_MAX_INTERVAL_SECONDS]),
+    )
+
+
+def connect():
+    """Read the cluster management data file and connect to the cluster and
+    to the cloud computing platform.
+
+    Returns:
+        interfaces (Tuple): Cloud interface, OS interface and cluster
+        management interface, or None if one of them failed to initialize.
+    """
     logger.info("Reading the cluster management program data file...")
 
     try:
         cluster_management_interface = ClusterManagementProgramInterface()
     except Exception as e:
         logger.error("Unexpected error initializing ClusterManagementProgramInterface: %s", e)
-        return STATUS_INTERNAL_READ_WRITE_ISSUE
+        return None
+
+    logger.info("Connecting to cluster...")
+    # Worker group statuses probed and worker recoveries attempted in previous
+    # runs are reused by the health check
+    os_interface = OSInterface(
+        nodestatus_cache=cluster_management_interface.cluster_management_state[
+            NODESTATUS_CACHE
+        ],
+        worker_recovery=cluster_management_interface.cluster_management_state[
+            WORKER_RECOVERY
+        ],
+        jobmanager_host=cluster_management_interface.cluster_management_config[
+            JOBMANAGER_HOST
+        ],
+    )
 
     # The use_private_ip_mapping boolean variable determines whether
     # private IP addresses should be used to identify worker nodes, instead of hostnames
@@ -85,11 +268,41 @@ def main() -> int:
         cloud_interface = CloudInterface(
             dns_search_suffix=dns_search_suffix,
             use_private_ip_mapping=use_private_ip_mapping,
+            worker_pools=cluster_management_interface.cluster_management_config[
+                WORKER_POOLS
+            ],
         )
 
     except Exception as e:
         logger.error("Failed to initialize cloud interface: %s", str(e))
-        return STATUS_INTERNAL_READ_WRITE_ISSUE
+        return None
+
+    return cloud_interface, os_interface, cluster_management_interface
+
+
+def run_tick(
+    cloud_interface: CloudInterface,
+    os_interface: OSInterface,
+    cluster_management_interface: ClusterManagementProgramInterface,
+    on_plan: Callable = None,
+) -> int:
+    """Execute one run of the cluster management routines.
+
+    Args:
+        cloud_interface (CloudInterface): The interface to interact with the cloud.
+        os_interface (OSInterface): The interface to interact with the operating system.
+        cluster_management_interface (ClusterManagementProgramInterface): Class to read and update
+        dictionary containing state and config of the cluster management program.
+        on_plan (Callable): Called with the view and the plan of the
+        autoscaling routine.
+
+    Returns:
+        status (int): Status code of program. See main().
+    """
+    # Initialize status variables
+    autoscaling_status = STATUS_SUCCESS
+    termination_routine_status = STATUS_SUCCESS
+    cluster_termination_status = STATUS_SUCCESS
 
     # Determine cluster readiness
     mw_cluster_status = set_mw_state.main(
@@ -107,9 +320,20 @@ def main() -> int:
         and os_interface.is_mjs_running()
     ):
         logger.debug("Starting autoscaling routine...")
-        autoscaling_status = autoscaling.main(cloud_interface, os_interface)
+        autoscaling_status = autoscaling.main(
+            cloud_interface, os_interface, cluster_management_interface, on_plan
+        )
         logger.debug("Completed autoscaling routine.")
 
+        if os_interface.nodestatus_cache_updated:
+            cluster_management_interface.update_state(
+                {NODESTATUS_CACHE: os_interface.nodestatus_cache}
+            )
+        if os_interface.worker_recovery_updated:
+            cluster_management_interface.update_state(
+                {WORKER_RECOVERY: os_interface.worker_recovery}
+            )
+
     if cluster_management_interface.cluster_management_config[AUTOTERMINATION_ENABLED]:
         # Assess the termination policy set on the head-node and execute if set
         termination_routine_status = helpers.start_termination_routine(
@@ -151,7 +375,25 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    logger.info("Starting cluster management program ...")
-    status = main()
-    logger.info("Finished cluster management program.\n\n")
+    parser = argparse.ArgumentParser(description="MATLAB Parallel Server cluster management program")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run continuously instead of once",
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        help="Seconds between two runs in daemon mode",
+    )
+    args = parser.parse_args()
+
+    if args.daemon:
+        logger.info("Starting cluster management program in daemon mode ...")
+        status = run_daemon(args.interval)
+        logger.info("Stopped cluster management program.\n\n")
+    else:
+        logger.info("Starting cluster management program ...")
+        status = main()
+        logger.info("Finished cluster management program.\n\n")
     sys.exit(status)
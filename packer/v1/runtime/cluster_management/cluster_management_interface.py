@@ -1,4 +1,4 @@
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
 import json
 import logging
@@ -18,6 +18,8 @@ from constants import (
     CLUSTER_READY_FOR_TERMINATION,
     MW_STATE_SET,
     MW_STATE_COUNTER,
+    NODESTATUS_CACHE,
+    SCALING_REQUEST,
 )
 
 logger = logging.getLogger("cluster_management.cluster_management_interface")
@@ -34,6 +36,8 @@ class ClusterManagementProgramInterface:
         """
         # Flag to check if the state needs to change
         self.update_state_file = False
+        # Config values overridden at runtime, never written to the data file
+        self._config_overrides = {}
 
         try:
             current_script_dir = os.path.dirname(os.path.realpath(__file__))
@@ -61,6 +65,21 @@ class ClusterManagementProgramInterface:
             logger.error("Initialization failed: %s", str(e))
             raise RuntimeError("ClusterManagementProgramInterface initialization failed") from e
 
+    def refresh_state(self) -> None:
+        """
+        Update the state variables that depend on the current run, as done
+        when the data file is first read. Used when the program runs
+        continuously instead of being restarted for each run.
+
+        Returns:
+            None: This method only updates the program state dictionary.
+        """
+        try:
+            self._initialize_state_after_reboot()
+            self._record_if_mjs_was_busy()
+        except Exception as e:
+            logger.error("Failed to refresh program state: %s", str(e))
+
     @property
     def cluster_management_state(self):
         '''Return the cluster management program state dictionary.'''
@@ -69,8 +88,24 @@ class ClusterManagementProgramInterface:
     @property
     def cluster_management_config(self):
         '''Return a read-only view of the cluster management configuration.'''
+        if self._config_overrides:
+            return MappingProxyType(
+                {**self._cluster_management_config, **self._config_overrides}
+            )
         return MappingProxyType(self._cluster_management_config)
 
+    def set_config_overrides(self, overrides: Dict) -> None:
+        """
+        Replace the config values overridden at runtime. The overrides are
+        only kept in memory.
+
+        Returns:
+            None: This method only updates the overrides dictionary.
+        """
+        if overrides != self._config_overrides:
+            logger.info("Config overrides: %s", overrides)
+        self._config_overrides = dict(overrides)
+
     def update_state(self, updates: Dict) -> None:
         """
         Update the program state with validation for multiple key-value pairs.
@@ -191,7 +226,9 @@ class ClusterManagementProgramInterface:
                         CLUSTER_READY_FOR_TERMINATION: False,
                         WAS_MJS_BUSY: False,
                         MW_STATE_SET: False,
-                        MW_STATE_COUNTER: "0"
+                        MW_STATE_COUNTER: "0",
+                        NODESTATUS_CACHE: {},
+                        SCALING_REQUEST: {},
                     }
                 )
                 mjs_status_log_file = self._cluster_management_config[
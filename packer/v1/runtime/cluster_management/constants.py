@@ -14,6 +14,9 @@ STATUS_INTERNAL_READ_WRITE_ISSUE = 4
 # Time to wait for a new cluster to become busy before considering it for termination
 UNUSED_CLUSTER_TIMEOUT_SECONDS = 1800
 
+# Seconds between two runs in daemon mode if the configuration cannot be read
+DEFAULT_DAEMON_INTERVAL_SECONDS = 60
+
 # Cluster management program state variables
 CLUSTER_READY_FOR_TERMINATION = "cluster_ready_for_termination"
 WAS_MJS_BUSY = "was_mjs_busy"
@@ -24,6 +27,15 @@ CLUSTER_AUTO_TERMINATED = "cluster_auto_terminated"
 MIN_NODES_PRE_TERMINATION = "min_nodes_pre_termination"
 MW_STATE_SET = "mw_state_set"
 MW_STATE_COUNTER = "mw_state_counter"
+NODESTATUS_CACHE = "nodestatus_cache"
+WORKER_RECOVERY = "worker_recovery"
+SCALING_REQUEST = "scaling_request"
+DEMAND_HISTORY = "demand_history"
+DEMAND_FORECAST = "demand_forecast"
+BOOT_LATENCY = "boot_latency"
+IDLE_GAPS = "idle_gaps"
+DRAIN_JOURNAL = "drain_journal"
+SHADOW_EVALUATION = "shadow_evaluation"
 
 # Type information for cluster management program state variables (needed for validation)
 STATE_VARIABLES_TYPES: Dict[str, Type] = {
@@ -35,7 +47,16 @@ STATE_VARIABLES_TYPES: Dict[str, Type] = {
     CLUSTER_AUTO_TERMINATED: bool,
     MIN_NODES_PRE_TERMINATION: str,
     MW_STATE_SET: bool,
-    MW_STATE_COUNTER: str
+    MW_STATE_COUNTER: str,
+    NODESTATUS_CACHE: dict,
+    WORKER_RECOVERY: dict,
+    SCALING_REQUEST: dict,
+    DEMAND_HISTORY: list,
+    DEMAND_FORECAST: dict,
+    BOOT_LATENCY: dict,
+    IDLE_GAPS: dict,
+    DRAIN_JOURNAL: dict,
+    SHADOW_EVALUATION: dict,
 }
 
 # Cluster management program config variables. The are configuration parameters that should not be modified by the program.
@@ -46,3 +67,33 @@ INITIAL_DESIRED_CAPACITY = "initial_desired_capacity"
 MJS_STATUS_LOG_FILE = "mjs_status_log_file"
 USE_PRIVATE_IP_MAPPING = "use_private_ip_mapping"
 DNS_SEARCH_SUFFIX = "dns_search_suffix"
+JOBMANAGER_HOST = "jobmanager_host"
+DAEMON_MODE_ENABLED = "daemon_mode_enabled"
+DAEMON_INTERVAL_SECONDS = "daemon_interval_seconds"
+DAEMON_MIN_INTERVAL_SECONDS = "daemon_min_interval_seconds"
+DAEMON_MAX_INTERVAL_SECONDS = "daemon_max_interval_seconds"
+SCALING_CONVERGENCE_TIMEOUT_SECONDS = "scaling_convergence_timeout_seconds"
+SCALE_OUT_STABILIZATION_SECONDS = "scale_out_stabilization_seconds"
+SCALE_IN_STABILIZATION_SECONDS = "scale_in_stabilization_seconds"
+MIN_NODE_LIFETIME_SECONDS = "min_node_lifetime_seconds"
+SCALE_IN_CRITERIA = "scale_in_criteria"
+FORECAST_ENABLED = "forecast_enabled"
+FORECAST_BUCKET_SECONDS = "forecast_bucket_seconds"
+FORECAST_SEASON_BUCKETS = "forecast_season_buckets"
+HEADROOM_WORKERS = "headroom_workers"
+HEADROOM_PERCENT = "headroom_percent"
+CAPACITY_SCHEDULES = "capacity_schedules"
+ADAPTIVE_IDLE_TIMEOUT_ENABLED = "adaptive_idle_timeout_enabled"
+IDLE_TIMEOUT_BOOT_DELAY_WEIGHT = "idle_timeout_boot_delay_weight"
+MAX_SURGE_NODES = "max_surge_nodes"
+MAX_SURGE_PERCENT = "max_surge_percent"
+WORKER_POOLS = "worker_pools"
+POOL_SPLIT_POLICY = "pool_split_policy"
+LICENSE_SOURCE = "license_source"
+LICENSE_SERVER = "license_server"
+LICENSE_FEATURE = "license_feature"
+LICENSE_CAPACITY_FILE = "license_capacity_file"
+SHADOW_POLICIES = "shadow_policies"
+HEALTH_CHECK_GRACE_PERCENTILE = "health_check_grace_percentile"
+SCALE_IN_ENABLED = "scale_in_enabled"
+CONTROL_SOCKET_PATH = "control_socket_path"
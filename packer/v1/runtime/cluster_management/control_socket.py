@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+
+"""Control the cluster management daemon through its Unix domain socket.
+
+Each request is a JSON object on a single line, answered by a JSON object on
+a single line:
+    {"command": "reconcile", "wait": false}
+        Start a run now, and optionally wait for it to finish.
+    {"command": "status"}
+        Return the view and the plan of the last autoscaling run, and the
+        active overrides.
+    {"command": "override", "settings": {"scale_in_enabled": false}, "seconds": 3600}
+        Override config settings for a limited time. The values are checked
+        against OVERRIDABLE_SETTINGS, and the overrides are kept in memory
+        only.
+    {"command": "clear_overrides"}
+        Remove all the overrides.
+
+Usage:
+    control_socket.py reconcile [--wait]
+    control_socket.py status
+    control_socket.py override scale_in_enabled=false [--minutes 60]
+    control_socket.py clear
+"""
+
+import argparse
+from datetime import datetime
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Type
+
+from constants import (
+    AUTOSCALING_ENABLED,
+    AUTOTERMINATION_ENABLED,
+    SCALE_IN_ENABLED,
+    SCALE_OUT_STABILIZATION_SECONDS,
+    SCALE_IN_STABILIZATION_SECONDS,
+    MIN_NODE_LIFETIME_SECONDS,
+    HEADROOM_WORKERS,
+    HEADROOM_PERCENT,
+    FORECAST_ENABLED,
+    ADAPTIVE_IDLE_TIMEOUT_ENABLED,
+    MAX_SURGE_NODES,
+    MAX_SURGE_PERCENT,
+)
+
+logger = logging.getLogger("cluster_management.control_socket")
+
+DEFAULT_CONTROL_SOCKET = "/var/run/mathworks/clustermanagement.sock"
+
+
+class SettingRange(NamedTuple):
+    """Class defining the values an overridden setting accepts."""
+
+    value_type: Type
+    minimum: float = None
+    maximum: float = None
+
+
+# Settings that can be overridden at runtime, with the values they accept.
+# The other settings are only read when the daemon connects.
+OVERRIDABLE_SETTINGS: Dict[str, SettingRange] = {
+    AUTOSCALING_ENABLED: SettingRange(bool),
+    AUTOTERMINATION_ENABLED: SettingRange(bool),
+    SCALE_IN_ENABLED: SettingRange(bool),
+    SCALE_OUT_STABILIZATION_SECONDS: SettingRange(int, 0),
+    SCALE_IN_STABILIZATION_SECONDS: SettingRange(int, 0),
+    MIN_NODE_LIFETIME_SECONDS: SettingRange(int, 0),
+    HEADROOM_WORKERS: SettingRange(int, 0),
+    HEADROOM_PERCENT: SettingRange(float, 0, 100),
+    FORECAST_ENABLED: SettingRange(bool),
+    ADAPTIVE_IDLE_TIMEOUT_ENABLED: SettingRange(bool),
+    MAX_SURGE_NODES: SettingRange(int, 0),
+    MAX_SURGE_PERCENT: SettingRange(float, 0, 100),
+}
+
+DEFAULT_OVERRIDE_SECONDS = 3600
+MAX_OVERRIDE_SECONDS = 24 * 3600
+
+# Longest time a client waits for a requested run to finish
+RECONCILE_WAIT_SECONDS = 600
+
+# Longest request accepted
+MAX_REQUEST_BYTES = 65536
+
+
+class ControlServer:
+    """
+    Class serving the control requests of the daemon on a Unix domain socket.
+
+    Requests are served on a background thread. The daemon publishes the
+    result of each run and reads the active overrides before each run, so
+    the requests never touch the interfaces while a run uses them.
+    """
+
+    def __init__(self, path: str, wake_up: threading.Event):
+        """
+        Args:
+            path (str): Path of the socket.
+            wake_up (threading.Event): Event interrupting the wait for the
+            next run.
+        """
+        self._path = path
+        self._wake_up = wake_up
+        self._lock = threading.Condition()
+        self._overrides: Dict[str, Dict] = {}
+        self._snapshot: Dict = {}
+        self._last_run: Dict = {}
+        self._runs_started = 0
+        self._runs_finished = 0
+        self._server = None
+
+    def start(self) -> bool:
+        """
+        Listen on the socket in a background thread.
+
+        Returns:
+            status (bool): True if the socket is listening.
+        """
+        control = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            timeout = 10
+
+            def handle(self):
+                try:
+                    request = json.loads(self.rfile.readline(MAX_REQUEST_BYTES))
+                    response = control.handle_request(request)
+                except (OSError, ValueError) as e:
+                    response = {"ok": False, "error": f"Invalid request: {e}"}
+                self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            if os.path.exists(self._path):
+                os.remove(self._path)
+            # The socket is created with the owner and group permissions only,
+            # so that it is never reachable by other users
+            umask = os.umask(0o117)
+            try:
+                self._server = socketserver.ThreadingUnixStreamServer(self._path, Handler)
+            finally:
+                os.umask(umask)
+            self._server.daemon_threads = True
+        except OSError as e:
+            logger.error("Failed to listen on control socket %s: %s", self._path, e)
+            return False
+
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.info("Listening for control requests on %s", self._path)
+        return True
+
+    def stop(self) -> None:
+        """Stop listening and remove the socket."""
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+    def get_overrides(self) -> Dict[str, Any]:
+        """
+        Get the overrides that have not expired.
+
+        Returns:
+            overrides (Dict[str, Any]): Overridden values keyed by setting.
+        """
+        now = time.time()
+        with self._lock:
+            self._overrides = {
+                key: override
+                for key, override in self._overrides.items()
+                if override["expires_at"] > now
+            }
+            return {key: override["value"] for key, override in self._overrides.items()}
+
+    def start_run(self) -> None:
+        """Record the start of a run."""
+        with self._lock:
+            self._runs_started += 1
+            self._last_run = dict(self._last_run, started_at=time.time())
+
+    def publish_plan(self, view, plan) -> None:
+        """
+        Publish the view and the plan of an autoscaling run.
+
+        Args:
+            view (ClusterView): Joined state of the cluster.
+            plan (ReconcilePlan): Operations of the run.
+        """
+        snapshot = {"view": to_json(view), "plan": to_json(plan)}
+        with self._lock:
+            self._snapshot = snapshot
+
+    def finish_run(self, status: int) -> None:
+        """
+        Record the end of a run and release the clients waiting for it.
+
+        Args:
+            status (int): Status code of the run.
+        """
+        with self._lock:
+            self._runs_finished += 1
+            self._last_run = dict(self._last_run, finished_at=time.time(), status=status)
+            self._lock.notify_all()
+
+    def handle_request(self, request: Dict) -> Dict:
+        """
+        Serve a control request.
+
+        Args:
+            request (Dict): Decoded request.
+
+        Returns:
+            response (Dict): Response, with "ok" False and an "error" if the
+            request failed.
+        """
+        command = request.get("command") if isinstance(request, dict) else None
+        logger.debug("Control request: %s", request)
+
+        if command == "reconcile":
+            with self._lock:
+                target_run = self._runs_started + 1
+            logger.info("Run requested through the control socket")
+            self._wake_up.set()
+            if not request.get("wait"):
+                return {"ok": True}
+
+            with self._lock:
+                finished = self._lock.wait_for(
+                    lambda: self._runs_finished >= target_run, RECONCILE_WAIT_SECONDS
+                )
+                if not finished:
+                    return {"ok": False, "error": "Timed out waiting for the run"}
+                return {"ok": True, "run": self._last_run}
+
+        if command == "status":
+            overrides = self.get_overrides()
+            with self._lock:
+                return dict(
+                    self._snapshot, ok=True, run=self._last_run, overrides=overrides
+                )
+
+        if command == "override":
+            settings = request.get("settings")
+            seconds = request.get("seconds", DEFAULT_OVERRIDE_SECONDS)
+            if not isinstance(settings, dict) or not settings:
+                return {"ok": False, "error": "settings must be a non-empty object"}
+            unknown_settings = set(settings) - set(OVERRIDABLE_SETTINGS)
+            if unknown_settings:
+                return {
+                    "ok": False,
+                    "error": f"Settings cannot be overridden: {sorted(unknown_settings)}",
+                }
+            invalid_settings = {
+                key: value
+                for key, value in settings.items()
+                if not is_valid_setting(value, OVERRIDABLE_SETTINGS[key])
+            }
+            if invalid_settings:
+                return {
+                    "ok": False,
+                    "error": "Invalid values: "
+                    + ", ".join(
+                        f"{key}={json.dumps(value)} ({describe_range(OVERRIDABLE_SETTINGS[key])})"
+                        for key, value in sorted(invalid_settings.items())
+                    ),
+                }
+            if not isinstance(seconds, (int, float)) or not 0 < seconds <= MAX_OVERRIDE_SECONDS:
+                return {
+                    "ok": False,
+                    "error": f"seconds must be between 0 and {MAX_OVERRIDE_SECONDS}",
+                }
+
+            expires_at = time.time() + seconds
+            with self._lock:
+                for key, value in settings.items():
+                    self._overrides[key] = {"value": value, "expires_at": expires_at}
+            logger.info("Overriding %s for %ss", settings, seconds)
+            return {"ok": True, "overrides": self.get_overrides()}
+
+        if command == "clear_overrides":
+            with self._lock:
+                self._overrides = {}
+            logger.info("Cleared the overrides")
+            return {"ok": True}
+
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+
+def is_valid_setting(value: Any, setting_range: SettingRange) -> bool:
+    """
+    Check a value against the values a setting accepts. Booleans are not
+    accepted as numbers, and whole numbers are accepted as floats.
+
+    Args:
+        value (Any): Value to check.
+        setting_range (SettingRange): Values the setting accepts.
+
+    Returns:
+        valid (bool): True if the setting accepts the value.
+    """
+    if setting_range.value_type is bool:
+        return isinstance(value, bool)
+
+    numeric_types = (int, float) if setting_range.value_type is float else (int,)
+    if isinstance(value, bool) or not isinstance(value, numeric_types):
+        return False
+
+    return (setting_range.minimum is None or value >= setting_range.minimum) and (
+        setting_range.maximum is None or value <= setting_range.maximum
+    )
+
+
+def describe_range(setting_range: SettingRange) -> str:
+    """Describe the values a setting accepts."""
+    if setting_range.value_type is bool:
+        return "true or false"
+
+    kind = "an integer" if setting_range.value_type is int else "a number"
+    if setting_range.maximum is not None:
+        return f"{kind} between {setting_range.minimum} and {setting_range.maximum}"
+    return f"{kind} of at least {setting_range.minimum}"
+
+
+def to_json(value: Any) -> Any:
+    """
+    Convert the named tuples, node records and sets of a view or a plan to
+    JSON types.
+
+    Args:
+        value (Any): Value to convert.
+
+    Returns:
+        value (Any): Value made of JSON types.
+    """
+    if hasattr(value, "_asdict"):
+        return {key: to_json(item) for key, item in value._asdict().items()}
+    if isinstance(value, dict):
+        return {str(key): to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_json(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "__slots__") and not isinstance(value, (str, int, float, bool)):
+        # Node records and cluster models
+        if hasattr(value, "__iter__"):
+            return [to_json(item) for item in value]
+        return {name: to_json(getattr(value, name)) for name in value.__slots__}
+    return value
+
+
+def send_request(request: Dict, path: str = DEFAULT_CONTROL_SOCKET) -> Dict:
+    """
+    Send a request to the daemon.
+
+    Args:
+        request (Dict): Request.
+        path (str): Path of the socket.
+
+    Returns:
+        response (Dict): Response of the daemon.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(RECONCILE_WAIT_SECONDS + 10)
+        sock.connect(path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+def _parse_setting(setting: str):
+    """Parse a KEY=VALUE setting, the value being JSON or a string."""
+    key, _, value = setting.partition("=")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Control the cluster management daemon")
+    parser.add_argument("--socket", default=DEFAULT_CONTROL_SOCKET, help="Path of the control socket")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reconcile_parser = subparsers.add_parser("reconcile", help="Start a run now")
+    reconcile_parser.add_argument("--wait", action="store_true", help="Wait for the run to finish")
+
+    subparsers.add_parser("status", help="Show the last view and plan")
+
+    override_parser = subparsers.add_parser("override", help="Override settings for a limited time")
+    override_parser.add_argument("settings", nargs="+", help="KEY=VALUE settings")
+    override_parser.add_argument("--minutes", type=float, default=DEFAULT_OVERRIDE_SECONDS / 60, help="Duration in minutes")
+
+    subparsers.add_parser("clear", help="Remove all the overrides")
+
+    args = parser.parse_args()
+
+    if args.command == "reconcile":
+        request = {"command": "reconcile", "wait": args.wait}
+    elif args.command == "status":
+        request = {"command": "status"}
+    elif args.command == "override":
+        request = {
+            "command": "override",
+            "settings": dict(map(_parse_setting, args.settings)),
+            "seconds": args.minutes * 60,
+        }
+    else:
+        request = {"command": "clear_overrides"}
+
+    try:
+        response = send_request(request, args.socket)
+    except OSError as e:
+        print(f"Failed to reach the cluster management daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(response, indent=2))
+    sys.exit(0 if response.get("ok") else 1)
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
-# Copyright 2025 The MathWorks, Inc.
+# Copyright 2025-2026 The MathWorks, Inc.
 
 import logging
 
 from mwplatforminterfaces import CloudInterface, OSInterface
 from cluster_management_interface import ClusterManagementProgramInterface
+from utils.fetch import fetch_concurrently
 
 from constants import (
     STATUS_SUCCESS,
@@ -71,8 +72,10 @@ def main(
         logger.info("Job manager is not running, will re-check in next iteration.")
         return STATUS_CLUSTER_ISSUE
     
-    # Retrieving cloud cluster capacity information
-    cloud_capacity = cloud_interface.get_cloud_capacity()
+    # Retrieving cloud cluster and MJS capacity information at the same time
+    cloud_capacity, cluster_state = fetch_concurrently(
+        cloud_interface.get_cloud_capacity, os_interface.get_cluster_state_async
+    )
     if cloud_capacity is None:
         logger.error("There was an issue retrieving cloud capacities, exiting.")
         return STATUS_CLOUD_ISSUE
@@ -88,14 +91,12 @@ def main(
         cluster_management_interface.update_state({MW_STATE_SET : True})
         return STATUS_SUCCESS
 
-    # Get MJS capacities
-    cluster_capacity = os_interface.get_cluster_capacity()
-    if cluster_capacity is None:
+    if cluster_state is None:
         logger.error("There was an issue retrieving cluster capacities, exiting.")
         return STATUS_CLUSTER_ISSUE
     
     # Get the number of workers registered with MJS
-    mjs_current_workers = cluster_capacity.current_workers
+    mjs_current_workers = cluster_state.capacity.current_workers
     if mjs_current_workers > 0:
         # If at least one worker is registered with MJS, set the mw-state tag as ready
         logger.info("Found a worker registered with MJS. Setting mw-state as ready")
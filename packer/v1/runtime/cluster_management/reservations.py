@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+
+"""Record time-boxed reservations of workers.
+
+While a reservation is active, autoscaling keeps at least the reserved number
+of workers in the cluster and never drains the nodes pinned by the
+reservation, however long they stay idle.
+
+Usage:
+    reservations.py add --workers 64 --until 17:00 [--name alice] [--host HOST ...]
+    reservations.py add --workers 16 --hours 2
+    reservations.py list
+    reservations.py remove ID
+"""
+
+import argparse
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import fcntl
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from typing import Dict, List
+
+logger = logging.getLogger("cluster_management.reservations")
+
+RESERVATIONS_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "data", "capacity_reservations.json"
+)
+
+
+def read_reservations(path: str = RESERVATIONS_FILE) -> List[Dict]:
+    """Read all the recorded reservations.
+
+    Args:
+        path (str): Reservations file.
+
+    Returns:
+        reservations (List[Dict]): Recorded reservations, empty if the file
+        does not exist or cannot be read.
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)["reservations"]
+
+    except FileNotFoundError:
+        pass
+
+    except (OSError, json.JSONDecodeError, KeyError) as e:
+        logger.error("Failed to read reservations from %s: %s", path, e)
+
+    return []
+
+
+def get_active_reservations(now: float, path: str = RESERVATIONS_FILE) -> List[Dict]:
+    """Read the reservations that have not expired.
+
+    Args:
+        now (float): Current time in seconds since the epoch.
+        path (str): Reservations file.
+
+    Returns:
+        reservations (List[Dict]): Active reservations.
+    """
+    return [r for r in read_reservations(path) if r["expires_at"] > now]
+
+
+def add_reservation(
+    workers: int,
+    expires_at: float,
+    name: str = "",
+    hosts: List[str] = (),
+    path: str = RESERVATIONS_FILE,
+) -> Dict:
+    """Record a reservation. Expired reservations are removed at the same
+    time.
+
+    Args:
+        workers (int): Number of workers to keep in the cluster.
+        expires_at (float): Expiry time in seconds since the epoch.
+        name (str): Name of the owner of the reservation.
+        hosts (List[str]): Hostnames of the nodes to never drain.
+        path (str): Reservations file.
+
+    Returns:
+        reservation (Dict): The recorded reservation.
+    """
+    now = time.time()
+    reservation = {
+        "id": uuid.uuid4().hex[:8],
+        "name": name,
+        "workers": workers,
+        "hosts": list(hosts),
+        "created_at": now,
+        "expires_at": expires_at,
+    }
+    with _locked(path):
+        reservations = get_active_reservations(now, path)
+        reservations.append(reservation)
+        _write_reservations(reservations, path)
+
+    return reservation
+
+
+def remove_reservation(reservation_id: str, path: str = RESERVATIONS_FILE) -> bool:
+    """Remove a reservation before it expires.
+
+    Args:
+        reservation_id (str): Id of the reservation.
+        path (str): Reservations file.
+
+    Returns:
+        removed (bool): True if the reservation was found.
+    """
+    with _locked(path):
+        reservations = get_active_reservations(time.time(), path)
+        remaining = [r for r in reservations if r["id"] != reservation_id]
+        _write_reservations(remaining, path)
+
+    return len(remaining) != len(reservations)
+
+
+@contextmanager
+def _locked(path: str):
+    """Serialize the updates of the reservations file."""
+    with open(f"{path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _write_reservations(reservations: List[Dict], path: str) -> None:
+    """Replace the reservations file atomically so that readers never see a
+    partial file."""
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as f:
+        json.dump({"reservations": reservations}, f, indent=4)
+    os.replace(temporary_path, path)
+
+
+def _parse_expiry(until: str, hours: float) -> float:
+    """Get the expiry time from an HH:MM UTC time or a number of hours."""
+    now = datetime.now(timezone.utc)
+    if hours is not None:
+        return (now + timedelta(hours=hours)).timestamp()
+
+    expires_at = datetime.combine(
+        now.date(), datetime.strptime(until, "%H:%M").time(), timezone.utc
+    )
+    if expires_at <= now:
+        expires_at += timedelta(days=1)
+    return expires_at.timestamp()
+
+
+def _format_reservation(reservation: Dict) -> str:
+    expires_at = datetime.fromtimestamp(reservation["expires_at"], timezone.utc)
+    return "{}  {:>5} workers  until {:%Y-%m-%d %H:%M} UTC  {}  {}".format(
+        reservation["id"],
+        reservation["workers"],
+        expires_at,
+        reservation["name"],
+        " ".join(reservation["hosts"]),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reserve workers of the cluster")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="Reserve workers")
+    add_parser.add_argument("--workers", type=int, required=True, help="Number of workers to keep")
+    expiry = add_parser.add_mutually_exclusive_group(required=True)
+    expiry.add_argument("--until", help="Expiry time (HH:MM, UTC)")
+    expiry.add_argument("--hours", type=float, help="Duration in hours")
+    add_parser.add_argument("--name", default=os.environ.get("USER", ""), help="Owner of the reservation")
+    add_parser.add_argument("--host", action="append", default=[], help="Hostname of a node to never drain")
+
+    subparsers.add_parser("list", help="List the active reservations")
+
+    remove_parser = subparsers.add_parser("remove", help="Remove a reservation")
+    remove_parser.add_argument("id", help="Id of the reservation")
+
+    args = parser.parse_args()
+
+    if args.command == "add":
+        if args.workers <= 0:
+            parser.error("--workers must be positive")
+        try:
+            expires_at = _parse_expiry(args.until, args.hours)
+        except ValueError:
+            parser.error("--until must be a time in the HH:MM format")
+        print(_format_reservation(
+            add_reservation(args.workers, expires_at, args.name, args.host)
+        ))
+
+    elif args.command == "list":
+        for reservation in get_active_reservations(time.time()):
+            print(_format_reservation(reservation))
+
+    elif args.command == "remove":
+        if not remove_reservation(args.id):
+            print(f"No active reservation {args.id}", file=sys.stderr)
+            sys.exit(1)
@@ -0,0 +1 @@
+# Copyright 2026 The MathWorks, Inc.
@@ -0,0 +1,118 @@
+# Copyright 2026 The MathWorks, Inc.
+
+"""Build the joined views of hand-written clusters for the reconciler
+tests."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from mwplatforminterfaces import ClusterModel, NodeRecord
+from mwplatforminterfaces.cloud_interface import CloudCapacity, WorkerPool
+from mwplatforminterfaces.constants import DEFAULT_POOL
+from mwplatforminterfaces.os_interface import ClusterCapacity
+
+from autoscaling.forecast import ForecastSettings
+from autoscaling.reconciler import ClusterView
+from autoscaling.stabilization import StabilizationSettings
+
+# Time every view is read at. Node uptimes are measured against the clock.
+NOW = datetime.now(timezone.utc)
+
+IDLE_TIMEOUT_SECONDS = 600
+
+
+def make_nodes(nodes: Dict[str, Dict]) -> ClusterModel:
+    """Build the records of nodes running in the default pool.
+
+    Args:
+        nodes (Dict[str, Dict]): Attributes of each node keyed by hostname:
+        "idle" (seconds idle, or None if the node is not registered),
+        "uptime" (seconds since launch, one day by default) and any
+        NodeRecord argument.
+
+    Returns:
+        nodes (ClusterModel): Worker nodes records.
+    """
+    model = ClusterModel()
+    nodes_workers, nodes_seconds_idle = {}, {}
+    for index, (host, attributes) in enumerate(nodes.items()):
+        attributes = dict(attributes)
+        seconds_idle = attributes.pop("idle", None)
+        uptime = attributes.pop("uptime", 86400)
+        record = dict(
+            instance_id=f"i-{index:04d}",
+            lifecycle_state="InService",
+            health_status="Healthy",
+            protected=True,
+            launch_time=NOW - timedelta(seconds=uptime),
+            availability_zone="us-east-1a",
+            purchase_option="on-demand",
+        )
+        record.update(attributes)
+        model.add(NodeRecord(host, **record))
+        if seconds_idle is not None:
+            nodes_workers[host] = 4
+            nodes_seconds_idle[host] = seconds_idle
+
+    model.record_workers(nodes_workers, nodes_seconds_idle)
+    return model
+
+
+def make_view(
+    cloud_capacity: CloudCapacity,
+    cluster_capacity: ClusterCapacity,
+    nodes: ClusterModel,
+    **fields,
+) -> ClusterView:
+    """Build the view of a single-pool cluster. Every policy beyond the
+    baseline capacity control, health check and scale-in protection is
+    disabled unless set in fields.
+
+    Args:
+        cloud_capacity (CloudCapacity): Capacity of the default pool.
+        cluster_capacity (ClusterCapacity): Job managers' worker limits.
+        nodes (ClusterModel): Worker nodes records.
+        fields: ClusterView fields to override.
+
+    Returns:
+        view (ClusterView): Joined state of the cluster.
+    """
+    view = dict(
+        cloud_capacity=cloud_capacity,
+        pools_capacity={DEFAULT_POOL: cloud_capacity},
+        pools=[WorkerPool(DEFAULT_POOL, 0, "m5.xlarge", cloud_capacity.workers_per_node)],
+        pool_split_policy="priority",
+        cluster_capacity=cluster_capacity,
+        job_managers_capacity={"jm": cluster_capacity},
+        idle_timeout_seconds=IDLE_TIMEOUT_SECONDS,
+        grace_period_seconds=IDLE_TIMEOUT_SECONDS,
+        idle_gaps={},
+        adaptive_idle_timeout=False,
+        idle_timeout_boot_delay_weight=1.0,
+        nodes=nodes,
+        # Every node ran for longer than the grace period
+        nodes_state={record.hostname: record.cloud_state for record in nodes},
+        suspended_nodes=set(),
+        nodes_seconds_idle=nodes.registered_nodes(),
+        heartbeats={},
+        drain_journal={},
+        scaling_request={},
+        demand_history=[],
+        stabilization=StabilizationSettings(0, 0, 0),
+        # Baseline scale-in releases the nodes idle for the longest first
+        scale_in_criteria=["longest_idle"],
+        demand_forecast={},
+        forecast=ForecastSettings(False, 900, 96),
+        boot_latency={},
+        headroom_workers=0,
+        headroom_percent=0.0,
+        capacity_schedules=[],
+        max_surge_nodes=0,
+        max_surge_percent=0.0,
+        scale_in_enabled=True,
+        license_usage=None,
+        reservations=[],
+        read_at=NOW.timestamp(),
+    )
+    view.update(fields)
+    return ClusterView(**view)
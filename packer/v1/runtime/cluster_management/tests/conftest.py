@@ -0,0 +1,20 @@
+# Copyright 2026 The MathWorks, Inc.
+
+"""Make the cluster management scripts and the mwplatforminterfaces package
+importable the way they are on the headnode."""
+
+from pathlib import Path
+import sys
+
+RUNTIME_ROOT = Path(__file__).resolve().parents[2]
+
+for path in (RUNTIME_ROOT / "mwplatforminterfaces", RUNTIME_ROOT / "cluster_management"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# mwplatforminterfaces redirects the standard streams to its log file, which
+# would hide the test reports
+stdout, stderr = sys.stdout, sys.stderr
+import mwplatforminterfaces  # noqa: E402,F401
+
+sys.stdout, sys.stderr = stdout, stderr
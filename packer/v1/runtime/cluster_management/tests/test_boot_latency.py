@@ -0,0 +1,73 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from autoscaling import boot_latency
+from autoscaling import health_check
+from autoscaling.boot_latency import BOOT_LATENCY_MAX_SECONDS, DEFAULT_BOOT_LATENCY_SECONDS
+from autoscaling.health_check import GRACE_PERIOD_MARGIN_SECONDS, MIN_GRACE_PERIOD_SAMPLES
+
+from tests.cluster_views import NOW, make_nodes
+
+LAUNCHED_AT = NOW.timestamp() - 60
+
+
+def _nodes(registered, uptime=60):
+    return make_nodes({"n1": {"idle": 0, "uptime": uptime} if registered else {"uptime": uptime}})
+
+
+def test_boot_is_measured_from_launch_to_registration():
+    state = boot_latency.update_boot_latency({}, _nodes(False), LAUNCHED_AT + 60)
+    assert state["pending"] == {"i-0000": LAUNCHED_AT}
+
+    state = boot_latency.update_boot_latency(state, _nodes(True), LAUNCHED_AT + 150)
+
+    assert state["pending"] == {}
+    assert state["samples"] == [150]
+
+
+def test_only_the_first_registration_is_sampled():
+    state = boot_latency.update_boot_latency({}, _nodes(False), LAUNCHED_AT + 60)
+    state = boot_latency.update_boot_latency(state, _nodes(True), LAUNCHED_AT + 150)
+
+    # The workers of the node are recovered and register again
+    state = boot_latency.update_boot_latency(state, _nodes(False), LAUNCHED_AT + 900)
+    state = boot_latency.update_boot_latency(state, _nodes(True), LAUNCHED_AT + 960)
+
+    assert state["pending"] == {}
+    assert state["samples"] == [150]
+
+
+def test_nodes_registered_when_first_seen_are_not_sampled():
+    state = boot_latency.update_boot_latency({}, _nodes(True), LAUNCHED_AT + 60)
+    state = boot_latency.update_boot_latency(state, _nodes(False), LAUNCHED_AT + 120)
+    state = boot_latency.update_boot_latency(state, _nodes(True), LAUNCHED_AT + 180)
+
+    assert state["samples"] == []
+    assert state["registered"] == ["i-0000"]
+
+
+def test_gone_and_old_nodes_are_forgotten():
+    state = boot_latency.update_boot_latency({}, _nodes(True), LAUNCHED_AT + 60)
+    state = boot_latency.update_boot_latency(state, make_nodes({}), LAUNCHED_AT + 120)
+    assert state["registered"] == []
+
+    old_node = _nodes(False, uptime=BOOT_LATENCY_MAX_SECONDS + 60)
+    assert boot_latency.update_boot_latency({}, old_node, NOW.timestamp())["pending"] == {}
+
+
+def test_boot_latency_percentile():
+    state = {"samples": [100, 400, 200, 300]}
+
+    assert boot_latency.get_boot_latency_seconds(state) == 200
+    assert boot_latency.get_boot_latency_seconds(state, 90) == 400
+    assert boot_latency.get_boot_latency_seconds({}) == DEFAULT_BOOT_LATENCY_SECONDS
+
+
+def test_grace_period_follows_the_boot_latency_once_measured():
+    samples = list(range(100, 100 + 10 * MIN_GRACE_PERIOD_SAMPLES, 10))
+
+    assert health_check.get_grace_period_seconds({"samples": samples[:-1]}, 90, 600) == 600
+    assert health_check.get_grace_period_seconds({"samples": samples}, 0, 600) == 600
+    assert (
+        health_check.get_grace_period_seconds({"samples": samples}, 90, 600)
+        == samples[8] + GRACE_PERIOD_MARGIN_SECONDS
+    )
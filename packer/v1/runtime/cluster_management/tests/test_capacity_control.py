@@ -0,0 +1,41 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from mwplatforminterfaces.cloud_interface import CloudCapacity
+
+from autoscaling import capacity_control
+
+
+def test_node_count_from_workers_is_bounded():
+    assert capacity_control.get_node_count_from_workers(9, 4, 0, 10) == 3
+    assert capacity_control.get_node_count_from_workers(100, 4, 0, 10) == 10
+    assert capacity_control.get_node_count_from_workers(0, 4, 2, 10) == 2
+
+
+def test_headroom_is_the_larger_of_a_number_and_a_percentage():
+    assert capacity_control.add_headroom(40, 4, 25) == 50
+    assert capacity_control.add_headroom(8, 4, 25) == 12
+    assert capacity_control.add_headroom(0, 0, 25) == 0
+
+
+def test_surge_limit_is_disabled_by_default():
+    assert capacity_control.limit_surge(CloudCapacity(2, 0, 20, 2, 4), 10, 0, 0, 2) == 10
+
+
+def test_surge_stages_start_from_the_ready_nodes():
+    capacity = CloudCapacity(6, 0, 20, 6, 4)
+
+    assert capacity_control.limit_surge(capacity, 20, 4, 0, 6) == 10
+    # Nodes still booting do not count, the current stage is kept
+    assert capacity_control.limit_surge(capacity, 20, 4, 0, 2) == 6
+
+
+def test_surge_percentage_of_the_ready_nodes():
+    capacity = CloudCapacity(10, 0, 40, 10, 4)
+
+    assert capacity_control.limit_surge(capacity, 40, 0, 50, 10) == 15
+    # At least one node is launched by each stage
+    assert capacity_control.limit_surge(CloudCapacity(0, 0, 40, 0, 4), 40, 0, 50, 0) == 1
+
+
+def test_scale_in_is_not_limited():
+    assert capacity_control.limit_surge(CloudCapacity(10, 0, 20, 10, 4), 2, 1, 0, 10) == 2
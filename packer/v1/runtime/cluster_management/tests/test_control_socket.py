@@ -0,0 +1,111 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import os
+import stat
+import threading
+
+import pytest
+
+import control_socket
+from control_socket import ControlServer, MAX_OVERRIDE_SECONDS
+
+from constants import (
+    HEADROOM_PERCENT,
+    HEADROOM_WORKERS,
+    MAX_SURGE_NODES,
+    MIN_NODE_LIFETIME_SECONDS,
+    SCALE_IN_ENABLED,
+)
+
+
+@pytest.fixture
+def control(tmp_path):
+    return ControlServer(str(tmp_path / "control.sock"), threading.Event())
+
+
+def _override(control, settings, **request):
+    return control.handle_request(dict({"command": "override", "settings": settings}, **request))
+
+
+def test_override_and_clear(control):
+    response = _override(
+        control, {SCALE_IN_ENABLED: False, HEADROOM_WORKERS: 8, HEADROOM_PERCENT: 12.5}
+    )
+
+    assert response["ok"]
+    assert control.get_overrides() == {
+        SCALE_IN_ENABLED: False,
+        HEADROOM_WORKERS: 8,
+        HEADROOM_PERCENT: 12.5,
+    }
+    assert control.handle_request({"command": "status"})["overrides"] == response["overrides"]
+
+    assert control.handle_request({"command": "clear_overrides"}) == {"ok": True}
+    assert control.get_overrides() == {}
+
+
+def test_overrides_expire(control, monkeypatch):
+    now = control_socket.time.time()
+    assert _override(control, {MAX_SURGE_NODES: 2}, seconds=60)["ok"]
+
+    monkeypatch.setattr(control_socket.time, "time", lambda: now + 61)
+
+    assert control.get_overrides() == {}
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {SCALE_IN_ENABLED: "false"},
+        {SCALE_IN_ENABLED: 0},
+        {HEADROOM_WORKERS: -1},
+        {HEADROOM_WORKERS: 2.5},
+        {HEADROOM_WORKERS: True},
+        {HEADROOM_PERCENT: 150},
+        {HEADROOM_PERCENT: "10"},
+        {MAX_SURGE_NODES: None},
+    ],
+)
+def test_invalid_values_are_rejected(control, settings):
+    response = _override(control, dict(settings, **{MIN_NODE_LIFETIME_SECONDS: 600}))
+
+    assert not response["ok"]
+    assert "Invalid values" in response["error"]
+    # No setting of a rejected request is applied
+    assert control.get_overrides() == {}
+
+
+@pytest.mark.parametrize(
+    "request_fields",
+    [
+        {"settings": {}},
+        {"settings": ["scale_in_enabled"]},
+        {"settings": {"worker_pools": []}},
+        {"settings": {SCALE_IN_ENABLED: False}, "seconds": 0},
+        {"settings": {SCALE_IN_ENABLED: False}, "seconds": MAX_OVERRIDE_SECONDS + 1},
+    ],
+)
+def test_invalid_override_requests_are_rejected(control, request_fields):
+    response = control.handle_request(dict({"command": "override"}, **request_fields))
+
+    assert not response["ok"]
+    assert control.get_overrides() == {}
+
+
+def test_unknown_command(control):
+    assert not control.handle_request({"command": "restart"})["ok"]
+    assert not control.handle_request(["status"])["ok"]
+
+
+def test_socket_is_reachable_by_the_owner_and_group_only(control, tmp_path):
+    umask = os.umask(0o022)
+    try:
+        assert control.start()
+        mode = stat.S_IMODE(os.stat(tmp_path / "control.sock").st_mode)
+        assert mode & 0o007 == 0
+        assert control_socket.send_request({"command": "status"}, control._path)["ok"]
+        # The umask of the process is left unchanged
+        assert os.umask(0o022) == 0o022
+    finally:
+        control.stop()
+        os.umask(umask)
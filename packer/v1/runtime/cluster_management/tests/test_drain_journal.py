@@ -0,0 +1,195 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from mwplatforminterfaces import ClusterModel, NodeRecord
+from mwplatforminterfaces.cloud_interface import CloudCapacity
+from mwplatforminterfaces.constants import DEFAULT_POOL
+
+from autoscaling import drain_journal
+from autoscaling.drain_journal import (
+    DRAIN_STOPPING,
+    DRAIN_UNPROTECT_FAILED,
+    DRAIN_UNPROTECTED,
+    DRAIN_STUCK_SECONDS,
+    MAX_DRAIN_ATTEMPTS,
+)
+from constants import (
+    DRAIN_JOURNAL,
+    INITIAL_TERMINATION_POLICY,
+    MJS_STATUS_LOG_FILE,
+    STATUS_CLOUD_AND_CLUSTER_ISSUE,
+    STATUS_CLOUD_ISSUE,
+)
+from utils import terminate_cluster
+
+from tests.cluster_views import make_nodes
+
+NOW = 1_000_000.0
+
+NODES = make_nodes({"n1": {"idle": 900}, "n2": {"idle": 900}, "n3": {"idle": 900}})
+
+
+def _entry(started_ago, last_attempt_ago, attempts, last_result, instance_id="i-0000"):
+    return {
+        "instance_id": instance_id,
+        "started_at": NOW - started_ago,
+        "attempts": attempts,
+        "last_attempt_at": NOW - last_attempt_ago,
+        "last_result": last_result,
+    }
+
+
+def test_retry_delay_doubles_up_to_the_maximum():
+    assert [drain_journal.get_retry_delay_seconds(n) for n in range(1, 6)] == [
+        60,
+        120,
+        240,
+        480,
+        600,
+    ]
+    assert drain_journal.get_retry_delay_seconds(0) == 60
+
+
+def test_record_drain_attempts():
+    journal = drain_journal.record_drain_attempts(
+        {}, NODES, {"n1", "n2", "n3"}, {"n2", "n3"}, {"n3"}, NOW
+    )
+
+    assert journal["n1"] == _entry(0, 0, 1, DRAIN_STOPPING)
+    assert journal["n2"]["last_result"] == DRAIN_UNPROTECT_FAILED
+    assert journal["n3"]["last_result"] == DRAIN_UNPROTECTED
+    assert journal["n3"]["instance_id"] == "i-0002"
+
+    journal = drain_journal.record_drain_attempts(
+        journal, NODES, {"n1"}, set(), set(), NOW + 60
+    )
+
+    assert journal["n1"]["attempts"] == 2
+    assert journal["n1"]["started_at"] == NOW
+    assert journal["n1"]["last_attempt_at"] == NOW + 60
+
+
+def test_nodes_without_an_instance_are_not_recorded():
+    nodes = ClusterModel()
+    nodes.add(NodeRecord("n4"))
+
+    journal = drain_journal.record_drain_attempts(
+        {}, nodes, {"n4", "n5"}, {"n4", "n5"}, set(), NOW
+    )
+
+    assert journal == {}
+
+
+def test_drains_complete_when_the_node_is_gone_or_replaced():
+    journal = {
+        "n1": _entry(30, 30, 1, DRAIN_STOPPING, instance_id="i-old"),
+        "n9": _entry(30, 30, 1, DRAIN_STOPPING),
+    }
+
+    decisions = drain_journal.get_drain_decisions(journal, NODES, NOW)
+
+    assert decisions.journal == {}
+    assert not (decisions.in_flight | decisions.retry | decisions.stuck)
+
+
+def test_drain_decisions():
+    journal = {
+        # Not settled yet
+        "n1": _entry(30, 30, 1, DRAIN_STOPPING, "i-0000"),
+        # Settled and still protected
+        "n2": _entry(300, 120, 1, DRAIN_STOPPING, "i-0001"),
+        # Unprotected and waiting for its termination
+        "n3": _entry(300, 120, 1, DRAIN_UNPROTECTED, "i-0002"),
+    }
+
+    decisions = drain_journal.get_drain_decisions(journal, NODES, NOW)
+
+    assert decisions.journal == journal
+    assert decisions.in_flight == {"n1", "n3"}
+    assert decisions.retry == {"n2"}
+    assert decisions.stuck == set()
+
+
+def test_stuck_drains():
+    journal = {
+        "n1": _entry(3000, 600, MAX_DRAIN_ATTEMPTS, DRAIN_STOPPING, "i-0000"),
+        "n2": _entry(DRAIN_STUCK_SECONDS, 120, 1, DRAIN_UNPROTECTED, "i-0001"),
+    }
+
+    decisions = drain_journal.get_drain_decisions(journal, NODES, NOW)
+
+    assert decisions.stuck == {"n1", "n2"}
+
+
+class _CloudInterface:
+    """Cloud platform whose worker nodes cannot be read."""
+
+    def __init__(self, pools_capacity):
+        self.pools_capacity = pools_capacity
+        self.pools_set = None
+
+    def get_pools_capacity(self):
+        return self.pools_capacity
+
+    def set_pools_capacity(self, pools_desired_nodes):
+        self.pools_set = pools_desired_nodes
+        return set(pools_desired_nodes)
+
+    def get_cluster_model(self):
+        return None
+
+    def set_nodes_protection(self, hostnames, protected, cluster_model=None):
+        raise AssertionError("Nodes unprotected without their instance ids")
+
+    def unprotect_all_nodes(self):
+        raise AssertionError("Nodes unprotected while their workers run")
+
+
+class _OSInterface:
+    def get_worker_nodes(self):
+        return {"n1", "n2"}
+
+    def stop_workers_on_nodes_streaming(self, hostnames):
+        raise AssertionError("Workers stopped without their instance ids")
+
+
+class _ClusterManagementInterface:
+    def __init__(self, journal):
+        self.cluster_management_config = {
+            MJS_STATUS_LOG_FILE: "",
+            INITIAL_TERMINATION_POLICY: "",
+        }
+        self.cluster_management_state = {DRAIN_JOURNAL: journal}
+        self.update_state_file = False
+
+    def update_state(self, updates):
+        self.cluster_management_state.update(updates)
+        self.update_state_file = True
+
+    def update_cluster_management_data_file(self):
+        self.update_state_file = False
+        return True
+
+
+def test_termination_without_the_nodes_keeps_the_workers_and_the_journal():
+    journal = {"n1": _entry(30, 30, 1, DRAIN_STOPPING)}
+    cloud_interface = _CloudInterface({DEFAULT_POOL: CloudCapacity(2, 0, 10, 2, 4)})
+    cluster_management_interface = _ClusterManagementInterface(journal)
+
+    status = terminate_cluster.main(
+        cloud_interface, _OSInterface(), cluster_management_interface
+    )
+
+    assert status == STATUS_CLOUD_AND_CLUSTER_ISSUE
+    assert cloud_interface.pools_set == {DEFAULT_POOL: 0}
+    assert cluster_management_interface.cluster_management_state[DRAIN_JOURNAL] == journal
+
+
+def test_termination_without_the_capacity_changes_nothing():
+    cloud_interface = _CloudInterface(None)
+
+    status = terminate_cluster.main(
+        cloud_interface, _OSInterface(), _ClusterManagementInterface({})
+    )
+
+    assert status == STATUS_CLOUD_ISSUE
+    assert cloud_interface.pools_set is None
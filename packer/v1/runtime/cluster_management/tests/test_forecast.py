@@ -0,0 +1,100 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from autoscaling import forecast
+from autoscaling.forecast import ForecastSettings
+
+BUCKET_SECONDS = 900
+SEASON = [0, 8, 32, 8]
+
+
+def _train(seasons, pattern=SEASON):
+    model = {}
+    for bucket in range(seasons * len(pattern)):
+        # Several samples per bucket, the peak is kept
+        for offset, share in ((0, 0.5), (300, 1), (600, 0.25)):
+            model = forecast.update_model(
+                model,
+                bucket * BUCKET_SECONDS + offset,
+                round(pattern[bucket % len(pattern)] * share),
+                BUCKET_SECONDS,
+                len(pattern),
+            )
+    return model
+
+
+def test_get_settings():
+    settings = forecast.get_settings(
+        {
+            "forecast_enabled": True,
+            "forecast_bucket_seconds": "900",
+            "forecast_season_buckets": 96,
+        }
+    )
+
+    assert settings == ForecastSettings(True, 900, 96)
+
+
+def test_peak_of_the_bucket_is_kept():
+    model = forecast.update_model({}, 0, 4, BUCKET_SECONDS, 4)
+    model = forecast.update_model(model, 300, 12, BUCKET_SECONDS, 4)
+    model = forecast.update_model(model, 600, 8, BUCKET_SECONDS, 4)
+
+    assert model["peak"] == 12
+    assert model["fitted_buckets"] == 0
+
+
+def test_no_forecast_before_the_warmup_seasons():
+    model = _train(forecast.WARMUP_SEASONS - 1)
+
+    assert forecast.get_forecast(model, len(SEASON) * BUCKET_SECONDS) is None
+    assert forecast.get_forecast({}, 0) is None
+
+
+def test_seasonal_demand_is_forecast():
+    seasons = 6
+    model = _train(seasons)
+    start = seasons * len(SEASON) * BUCKET_SECONDS
+
+    forecasts = [
+        forecast.get_forecast(model, start + bucket * BUCKET_SECONDS)
+        for bucket in range(len(SEASON))
+    ]
+
+    # The peak bucket is forecast ahead of the quiet ones
+    assert forecasts.index(max(forecasts)) == SEASON.index(max(SEASON))
+    for predicted, actual in zip(forecasts, SEASON):
+        assert abs(predicted - actual) <= 4
+
+
+def test_settings_change_restarts_the_model():
+    model = _train(forecast.WARMUP_SEASONS)
+
+    restarted = forecast.update_model(
+        model, model["bucket"] * BUCKET_SECONDS, 4, BUCKET_SECONDS, 8
+    )
+
+    assert restarted["fitted_buckets"] == 0
+    assert restarted["level"] is None
+
+
+def test_gap_of_more_than_a_season_restarts_the_model():
+    model = _train(forecast.WARMUP_SEASONS)
+
+    restarted = forecast.update_model(
+        model,
+        (model["bucket"] + len(SEASON) + 1) * BUCKET_SECONDS,
+        4,
+        BUCKET_SECONDS,
+        len(SEASON),
+    )
+
+    assert restarted["fitted_buckets"] == 0
+
+
+def test_missed_buckets_are_fitted_with_the_last_peak():
+    model = forecast.update_model({}, 0, 8, BUCKET_SECONDS, 4)
+
+    model = forecast.update_model(model, 3 * BUCKET_SECONDS, 4, BUCKET_SECONDS, 4)
+
+    assert model["fitted_buckets"] == 3
+    assert model["peak"] == 4
@@ -0,0 +1,78 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from autoscaling import idle_timeout
+
+MAX_IDLE_TIMEOUT_SECONDS = 600
+BOOT_LATENCY_SECONDS = 300
+
+
+def _timeout(samples, boot_delay_weight=1.0):
+    return idle_timeout.get_adaptive_idle_timeout(
+        {"samples": samples},
+        MAX_IDLE_TIMEOUT_SECONDS,
+        BOOT_LATENCY_SECONDS,
+        boot_delay_weight,
+    )
+
+
+def test_gaps_end_when_the_idle_duration_drops():
+    idle_gaps = idle_timeout.update_idle_gaps({}, {"n1": 100, "n2": 200, "n3": 0})
+    idle_gaps = idle_timeout.update_idle_gaps(idle_gaps, {"n1": 400, "n2": 10, "n3": 50})
+
+    assert idle_gaps["samples"] == [[200, True]]
+    assert idle_gaps["idle"] == {"n1": 400, "n2": 10, "n3": 50}
+
+
+def test_nodes_leaving_while_idle_record_censored_gaps():
+    idle_gaps = idle_timeout.update_idle_gaps({}, {"n1": 650, "n2": 30})
+    idle_gaps = idle_timeout.update_idle_gaps(idle_gaps, {"n2": 60})
+
+    assert idle_gaps["samples"] == [[650, False]]
+    assert idle_gaps["idle"] == {"n2": 60}
+
+
+def test_samples_are_bounded():
+    idle_gaps = {"idle": {}, "samples": [[i, True] for i in range(idle_timeout.IDLE_GAP_SAMPLES)]}
+    idle_gaps = idle_timeout.update_idle_gaps(dict(idle_gaps, idle={"n1": 5}), {})
+
+    assert len(idle_gaps["samples"]) == idle_timeout.IDLE_GAP_SAMPLES
+    assert idle_gaps["samples"][-1] == [5, False]
+
+
+def test_configured_timeout_until_enough_gaps_are_measured():
+    samples = [[100, True]] * (idle_timeout.MIN_IDLE_GAP_SAMPLES - 1)
+
+    assert _timeout(samples) == MAX_IDLE_TIMEOUT_SECONDS
+
+
+def test_timeout_covers_the_short_gaps_between_jobs():
+    samples = [[120, True]] * 15 + [[3000, True]] * 5
+
+    assert _timeout(samples) == 120
+
+
+def test_timeout_is_the_lowest_when_nodes_are_never_reused():
+    samples = [[3000, True]] * 10 + [[700, False]] * 10
+
+    assert _timeout(samples) == idle_timeout.MIN_IDLE_TIMEOUT_SECONDS
+
+
+def test_timeout_weighs_the_job_delay_of_a_relaunch():
+    samples = [[550, True]] * 10 + [[60, True]] * 10
+
+    assert _timeout(samples, boot_delay_weight=0) == 60
+    # Ties are broken in favour of the longest timeout
+    assert _timeout(samples, boot_delay_weight=10) == MAX_IDLE_TIMEOUT_SECONDS
+
+
+def test_censored_gaps_do_not_ratchet_the_timeout_down():
+    # Nodes drained after a 300s timeout, and jobs arriving after 550s idle
+    samples = [[550, True]] * 10 + [[310, False]] * 10
+
+    assert _timeout(samples) == 550
+
+
+def test_timeout_is_bounded_by_the_configured_one():
+    samples = [[100, True]] * 20
+
+    assert idle_timeout.get_adaptive_idle_timeout({"samples": samples}, 30, 300, 1.0) == 30
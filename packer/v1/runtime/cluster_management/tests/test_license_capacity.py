@@ -0,0 +1,92 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import json
+
+from autoscaling import license_capacity
+from autoscaling.license_capacity import LicenseUsage
+
+from constants import LICENSE_CAPACITY_FILE, LICENSE_SOURCE
+
+LMSTAT_OUTPUT = """lmutil - Copyright (c) 1989-2023 Flexera. All Rights Reserved.
+Flexible License Manager status on Mon 3/2/2026 09:00
+
+License server status: 27000@license-server
+    License file(s) on license-server: /usr/local/MATLAB/etc/license.dat:
+
+license-server: license server UP (MASTER) v11.19.5
+
+Vendor daemon status (on license-server):
+
+  MLM: UP v11.19.5
+Feature usage info:
+
+Users of MATLAB_Distrib_Comp_Engine:  (Total of 64 licenses issued;  Total of 13 licenses in use)
+
+  "MATLAB_Distrib_Comp_Engine" v49, vendor: MLM, expiry: 01-jan-0000
+  floating license
+
+    mjs ip-10-0-0-11.ec2.internal /dev/tty (v49) (license-server/27000 101), start Mon 3/2 8:00, 4 licenses
+    mjs ip-10-0-0-12 /dev/tty (v49) (license-server/27000 102), start Mon 3/2 8:00, 4 licenses
+    mjs ip-10-0-0-11.ec2.internal /dev/tty (v49) (license-server/27000 103), start Mon 3/2 8:05
+    alice laptop /dev/tty (v49) (license-server/27000 104), start Mon 3/2 8:10, 4 licenses
+
+Users of MATLAB:  (Total of 10 licenses issued;  Total of 1 license in use)
+
+    alice laptop /dev/tty (v49) (license-server/27000 105), start Mon 3/2 8:10
+"""
+
+FEATURE = "MATLAB_Distrib_Comp_Engine"
+
+
+def test_parse_lmstat():
+    usage = license_capacity.parse_lmstat(LMSTAT_OUTPUT, FEATURE)
+
+    assert usage == LicenseUsage(
+        issued=64,
+        in_use=13,
+        hosts_in_use={"ip-10-0-0-11.ec2.internal": 5, "ip-10-0-0-12": 4, "laptop": 4},
+    )
+
+
+def test_parse_lmstat_stops_at_the_next_feature():
+    usage = license_capacity.parse_lmstat(LMSTAT_OUTPUT, "MATLAB")
+
+    assert usage == LicenseUsage(issued=10, in_use=1, hosts_in_use={"laptop": 1})
+
+
+def test_parse_lmstat_without_the_feature():
+    assert license_capacity.parse_lmstat(LMSTAT_OUTPUT, "Parallel_Toolbox") is None
+    assert license_capacity.parse_lmstat("", FEATURE) is None
+
+
+def test_license_cap_counts_the_cluster_licenses_and_the_free_ones():
+    usage = license_capacity.parse_lmstat(LMSTAT_OUTPUT, FEATURE)
+
+    # Hostnames match whether short or fully qualified
+    hosts = {"ip-10-0-0-11", "ip-10-0-0-12.ec2.internal"}
+    assert license_capacity.get_license_cap_workers(usage, hosts) == 9 + 51
+    assert license_capacity.get_license_cap_workers(usage, set()) == 51
+
+
+def test_over_used_licenses_leave_only_the_cluster_ones():
+    usage = LicenseUsage(issued=8, in_use=10, hosts_in_use={"n1": 6, "laptop": 4})
+
+    assert license_capacity.get_license_cap_workers(usage, {"n1"}) == 6
+
+
+def test_file_source(tmp_path):
+    path = tmp_path / "license.json"
+    path.write_text(json.dumps({"issued": 64, "in_use": 10, "hosts_in_use": {"n1": 4}}))
+    source = license_capacity.get_license_source(
+        {LICENSE_SOURCE: "file", LICENSE_CAPACITY_FILE: str(path)}
+    )
+
+    assert source() == LicenseUsage(64, 10, {"n1": 4})
+
+    path.write_text("{}")
+    assert source() is None
+
+
+def test_no_license_source():
+    assert license_capacity.get_license_source({LICENSE_SOURCE: ""}) is None
+    assert license_capacity.get_license_source({LICENSE_SOURCE: "unknown"}) is None
@@ -0,0 +1,113 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from botocore.exceptions import ClientError
+
+from mwplatforminterfaces import CloudInterface
+from mwplatforminterfaces.cloud_interface import (
+    CloudCapacity,
+    WorkerPool,
+    combine_capacities,
+)
+from mwplatforminterfaces.constants import DEFAULT_POOL
+
+from autoscaling import pools
+
+POOLS = [WorkerPool("gpu", 1, "g5.xlarge", 1), WorkerPool(DEFAULT_POOL, 0, "m5.xlarge", 4)]
+POOLS_CAPACITY = {
+    "gpu": CloudCapacity(0, 1, 4, 1, 1),
+    DEFAULT_POOL: CloudCapacity(0, 0, 10, 0, 4),
+}
+
+
+def test_priority_split_fills_the_pools_in_order():
+    assert pools.split_demand(3, POOLS, POOLS_CAPACITY, "priority") == {
+        "gpu": 3,
+        DEFAULT_POOL: 0,
+    }
+    assert pools.split_demand(12, POOLS, POOLS_CAPACITY, "priority") == {
+        "gpu": 4,
+        DEFAULT_POOL: 8,
+    }
+
+
+def test_minimum_nodes_are_counted_first():
+    assert pools.split_demand(0, POOLS, POOLS_CAPACITY, "priority") == {
+        "gpu": 1,
+        DEFAULT_POOL: 0,
+    }
+
+
+def test_proportional_split():
+    # 3 spare workers in the gpu pool and 40 in the default pool
+    assert pools.split_demand(44, POOLS, POOLS_CAPACITY, "proportional") == {
+        "gpu": 4,
+        DEFAULT_POOL: 40,
+    }
+    assert pools.split_demand(23, POOLS, POOLS_CAPACITY, "proportional") == {
+        "gpu": 3,
+        DEFAULT_POOL: 21,
+    }
+
+
+def test_unknown_policy_splits_by_priority():
+    assert pools.split_demand(12, POOLS, POOLS_CAPACITY, "unknown") == pools.split_demand(
+        12, POOLS, POOLS_CAPACITY, "priority"
+    )
+
+
+def test_pools_without_capacity_are_left_out():
+    assert pools.split_demand(12, POOLS, {DEFAULT_POOL: POOLS_CAPACITY[DEFAULT_POOL]}, "priority") == {
+        DEFAULT_POOL: 12
+    }
+
+
+def test_combined_capacity_uses_the_workers_per_node_of_the_default_pool():
+    assert combine_capacities(POOLS_CAPACITY) == CloudCapacity(0, 1, 14, 1, 4)
+
+
+def test_combined_capacity_without_the_default_pool():
+    assert combine_capacities(
+        {"gpu": POOLS_CAPACITY["gpu"], "big": CloudCapacity(1, 0, 2, 1, 16)}
+    ) == CloudCapacity(1, 1, 6, 2, 1)
+
+
+class _AutoScalingClient:
+    def __init__(self, groups, error=None):
+        self.groups = groups
+        self.error = error
+
+    def describe_auto_scaling_groups(self, AutoScalingGroupNames):
+        if self.error:
+            raise self.error
+        return {
+            "AutoScalingGroups": [
+                {"AutoScalingGroupName": name}
+                for name in AutoScalingGroupNames
+                if name in self.groups
+            ]
+        }
+
+
+def _aws_interface(groups, error=None):
+    # The interface reads the instance metadata when created
+    interface = object.__new__(CloudInterface)
+    interface._AWSInterface__asg_client = _AutoScalingClient(groups, error)
+    interface._AWSInterface__pools_asg_name = {DEFAULT_POOL: "cluster-asg", "gpu": "gpu-asg"}
+    return interface
+
+
+def test_missing_pool_group_leaves_the_other_pools():
+    asgs_data = _aws_interface({"cluster-asg"})._get_asg_descriptions()
+
+    assert set(asgs_data) == {DEFAULT_POOL}
+
+
+def test_missing_default_group_fails_the_read():
+    assert _aws_interface({"gpu-asg"})._get_asg_descriptions() is None
+    assert (
+        _aws_interface(
+            {"cluster-asg", "gpu-asg"},
+            ClientError({"Error": {"Code": "Throttling"}}, "DescribeAutoScalingGroups"),
+        )._get_asg_descriptions()
+        is None
+    )
@@ -0,0 +1,248 @@
+# Copyright 2026 The MathWorks, Inc.
+
+"""Golden tests of the reconciler plan.
+
+The expected decisions are the ones the capacity control, health check and
+scale-in protection routines the reconciler replaced make on the same
+cluster. The policies added since then only change them where a test says
+so.
+"""
+
+from mwplatforminterfaces.cloud_interface import CloudCapacity
+from mwplatforminterfaces.constants import DEFAULT_POOL
+from mwplatforminterfaces.os_interface import ClusterCapacity
+
+from autoscaling import drain_journal
+from autoscaling import reconciler
+from autoscaling.reconciler import NODE_DRAIN, NODE_RECOVER, NODE_REPLACE
+from autoscaling.stabilization import StabilizationSettings
+
+from tests.cluster_views import NOW, make_nodes, make_view
+
+SCALE_IN_CLOUD = CloudCapacity(
+    desired_nodes=4, minimum_nodes=0, maximum_nodes=10, current_nodes=4, workers_per_node=4
+)
+SCALE_IN_CLUSTER = ClusterCapacity(current_workers=16, desired_workers=4, maximum_workers=40)
+SCALE_IN_NODES = {
+    "n1": {"idle": 900},
+    "n2": {"idle": 700},
+    "n3": {"idle": 400},
+    "n4": {"idle": 100},
+}
+
+
+def _scale_in_view(nodes=None, **fields):
+    return make_view(
+        SCALE_IN_CLOUD, SCALE_IN_CLUSTER, make_nodes(nodes or SCALE_IN_NODES), **fields
+    )
+
+
+def _drain_entry(seconds_ago, **entry):
+    at = NOW.timestamp() - seconds_ago
+    return dict(
+        {
+            "instance_id": "i-0000",
+            "started_at": at,
+            "attempts": 1,
+            "last_attempt_at": at,
+            "last_result": drain_journal.DRAIN_STOPPING,
+        },
+        **entry,
+    )
+
+
+def test_steady_state_changes_nothing():
+    view = make_view(
+        CloudCapacity(2, 0, 10, 2, 4),
+        ClusterCapacity(8, 8, 40),
+        make_nodes({"n1": {"idle": 0}, "n2": {"idle": 0}}),
+    )
+
+    plan = reconciler.plan(view)
+
+    assert plan.maximum_workers is None
+    assert plan.desired_nodes == {}
+    assert set(plan.nodes_actions.values()) == {reconciler.NODE_KEEP}
+
+
+def test_scale_out():
+    view = make_view(
+        CloudCapacity(2, 0, 10, 2, 4),
+        ClusterCapacity(8, 20, 32),
+        make_nodes({"n1": {"idle": 0}, "n2": {"idle": 0}}),
+    )
+
+    plan = reconciler.plan(view)
+
+    # Baseline: maximum workers 40, desired capacity 5 nodes
+    assert plan.maximum_workers == 40
+    assert plan.desired_nodes == {DEFAULT_POOL: 5}
+    assert plan.nodes_with_action(NODE_DRAIN) == set()
+
+
+def test_scale_in_drains_the_nodes_idle_for_longer_than_the_timeout():
+    plan = reconciler.plan(_scale_in_view())
+
+    # Baseline: desired capacity 1 node, n1 and n2 stopped and unprotected
+    assert plan.maximum_workers is None
+    assert plan.desired_nodes == {DEFAULT_POOL: 1}
+    assert plan.nodes_with_action(NODE_DRAIN) == {"n1", "n2"}
+
+
+def test_scale_in_keeps_young_nodes():
+    nodes = dict(SCALE_IN_NODES, n1={"idle": 900, "uptime": 1800})
+    view = _scale_in_view(nodes, stabilization=StabilizationSettings(0, 0, 3600))
+
+    plan = reconciler.plan(view)
+
+    assert plan.desired_nodes == {DEFAULT_POOL: 1}
+    assert plan.nodes_with_action(NODE_DRAIN) == {"n2"}
+
+
+def test_scale_in_keeps_reserved_nodes():
+    view = _scale_in_view(
+        reservations=[
+            {"id": "r1", "workers": 4, "hosts": ["n1"], "expires_at": NOW.timestamp() + 60}
+        ]
+    )
+
+    plan = reconciler.plan(view)
+
+    assert plan.desired_nodes == {DEFAULT_POOL: 1}
+    assert plan.nodes_with_action(NODE_DRAIN) == {"n2"}
+
+
+def test_scale_in_leaves_drains_in_flight_to_settle():
+    view = _scale_in_view(drain_journal={"n1": _drain_entry(30)})
+
+    plan = reconciler.plan(view)
+
+    # n1 counts towards the nodes to release without being drained again
+    assert plan.nodes_with_action(NODE_DRAIN) == {"n2"}
+    assert plan.nodes_actions["n1"] == reconciler.NODE_KEEP
+    assert set(plan.drain_journal) == {"n1"}
+
+
+def test_scale_in_retries_settled_drains():
+    view = _scale_in_view(drain_journal={"n1": _drain_entry(120)})
+
+    plan = reconciler.plan(view)
+
+    assert plan.nodes_with_action(NODE_DRAIN) == {"n1", "n2"}
+
+
+def test_scale_in_replaces_stuck_drains():
+    view = _scale_in_view(
+        drain_journal={
+            "n1": _drain_entry(
+                600, attempts=drain_journal.MAX_DRAIN_ATTEMPTS
+            )
+        }
+    )
+
+    plan = reconciler.plan(view)
+
+    assert plan.nodes_with_action(NODE_REPLACE) == {"n1"}
+    assert plan.nodes_with_action(NODE_DRAIN) == {"n2"}
+
+
+def test_scale_in_disabled_keeps_the_capacity():
+    plan = reconciler.plan(_scale_in_view(scale_in_enabled=False))
+
+    assert plan.desired_nodes == {}
+    assert plan.nodes_with_action(NODE_DRAIN) == set()
+
+
+def _unhealthy_view(**fields):
+    return make_view(
+        SCALE_IN_CLOUD,
+        ClusterCapacity(12, 16, 40),
+        make_nodes({"n1": {"idle": 0}, "n2": {"idle": 0}, "n3": {"idle": 0}, "n4": {}}),
+        suspended_nodes={"n3"},
+        **fields,
+    )
+
+
+def test_unhealthy_nodes_are_recovered():
+    plan = reconciler.plan(_unhealthy_view())
+
+    # Baseline: n3 (suspended) and n4 (unregistered) marked as unhealthy
+    assert plan.maximum_workers is None
+    assert plan.desired_nodes == {}
+    assert plan.nodes_with_action(NODE_RECOVER) == {"n3", "n4"}
+    assert plan.nodes_with_action(NODE_REPLACE) == set()
+
+
+def test_interrupted_nodes_are_replaced():
+    plan = reconciler.plan(
+        _unhealthy_view(heartbeats={"n4": {"spot_interruption": True}})
+    )
+
+    assert plan.nodes_with_action(NODE_RECOVER) == {"n3"}
+    assert plan.nodes_with_action(NODE_REPLACE) == {"n4"}
+
+
+def test_nodes_in_their_grace_period_are_not_checked():
+    view = _unhealthy_view()
+    view = view._replace(
+        nodes_state={host: view.nodes_state[host] for host in ("n1", "n2", "n3")}
+    )
+
+    plan = reconciler.plan(view)
+
+    assert plan.nodes_with_action(NODE_RECOVER) == {"n3"}
+
+
+def _surge_view(cloud_capacity=CloudCapacity(2, 0, 20, 2, 4), **fields):
+    return make_view(
+        cloud_capacity,
+        ClusterCapacity(cloud_capacity.current_nodes * 4, 40, 80),
+        make_nodes({f"n{i}": {"idle": 0} for i in range(cloud_capacity.current_nodes)}),
+        **fields,
+    )
+
+
+def test_scale_out_without_surge_limit():
+    plan = reconciler.plan(_surge_view())
+
+    # Baseline: desired capacity 10 nodes at once
+    assert plan.desired_nodes == {DEFAULT_POOL: 10}
+
+
+def test_scale_out_in_stages_of_max_surge_nodes():
+    assert reconciler.plan(_surge_view(max_surge_nodes=2)).desired_nodes == {
+        DEFAULT_POOL: 4
+    }
+    assert reconciler.plan(
+        _surge_view(CloudCapacity(4, 0, 20, 4, 4), max_surge_nodes=2)
+    ).desired_nodes == {DEFAULT_POOL: 6}
+
+
+def test_next_stage_waits_for_the_nodes_to_register():
+    nodes = make_nodes(
+        {
+            "n0": {"idle": 0},
+            "n1": {"idle": 0},
+            # Launched by the previous stage and still booting
+            "n2": {"lifecycle_state": "Pending", "uptime": 30},
+            "n3": {"uptime": 60},
+        }
+    )
+    view = make_view(
+        CloudCapacity(4, 0, 20, 4, 4),
+        ClusterCapacity(8, 40, 80),
+        nodes,
+        nodes_state={host: nodes.by_host(host).cloud_state for host in ("n0", "n1")},
+        max_surge_nodes=2,
+    )
+
+    assert reconciler.plan(view).desired_nodes == {DEFAULT_POOL: 4}
+
+
+def test_scale_out_in_stages_of_max_surge_percent():
+    assert reconciler.plan(_surge_view(max_surge_percent=50)).desired_nodes == {
+        DEFAULT_POOL: 3
+    }
+    assert reconciler.plan(
+        _surge_view(CloudCapacity(8, 0, 20, 8, 4), max_surge_percent=50)
+    ).desired_nodes == {DEFAULT_POOL: 10}
@@ -0,0 +1,47 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import time
+
+import reservations
+
+
+def test_missing_file_has_no_reservations(tmp_path):
+    assert reservations.read_reservations(str(tmp_path / "missing.json")) == []
+
+
+def test_unreadable_file_has_no_reservations(tmp_path):
+    path = tmp_path / "reservations.json"
+    path.write_text("{not json")
+
+    assert reservations.read_reservations(str(path)) == []
+
+
+def test_add_and_remove_reservations(tmp_path):
+    path = str(tmp_path / "reservations.json")
+    now = time.time()
+
+    first = reservations.add_reservation(16, now + 3600, "alice", ["n1"], path)
+    second = reservations.add_reservation(8, now + 7200, path=path)
+
+    assert reservations.get_active_reservations(now, path) == [first, second]
+    assert first["hosts"] == ["n1"]
+
+    assert reservations.remove_reservation(first["id"], path)
+    assert not reservations.remove_reservation(first["id"], path)
+    assert reservations.get_active_reservations(now, path) == [second]
+
+
+def test_expired_reservations_are_inactive_and_removed(tmp_path):
+    path = str(tmp_path / "reservations.json")
+    now = time.time()
+    expiring = reservations.add_reservation(16, now + 60, path=path)
+
+    assert reservations.get_active_reservations(now + 61, path) == []
+
+    expired = reservations.add_reservation(16, now - 1, path=path)
+    assert reservations.get_active_reservations(now, path) == [expiring]
+
+    # Adding a reservation drops the expired ones from the file
+    active = reservations.add_reservation(4, now + 3600, path=path)
+    assert expired not in reservations.read_reservations(path)
+    assert reservations.read_reservations(path) == [expiring, active]
@@ -0,0 +1,66 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from datetime import datetime, timedelta, timezone
+
+from autoscaling import schedules
+
+# A Monday
+MONDAY = datetime(2026, 3, 2, tzinfo=timezone.utc)
+
+OFFICE_HOURS = {"days": "Mon-Fri", "start": "08:00", "end": "18:00", "min_nodes": 20}
+NIGHTLY = {"days": ["Fri"], "start": "22:00", "end": "02:00", "min_nodes": 50}
+
+
+def _at(day, hour, minute=0):
+    return MONDAY + timedelta(days=day, hours=hour, minutes=minute)
+
+
+def test_window_contains_its_start_but_not_its_end():
+    assert schedules.get_scheduled_floor([OFFICE_HOURS], _at(0, 8)) == 20
+    assert schedules.get_scheduled_floor([OFFICE_HOURS], _at(0, 17, 59)) == 20
+    assert schedules.get_scheduled_floor([OFFICE_HOURS], _at(0, 18)) == 0
+    assert schedules.get_scheduled_floor([OFFICE_HOURS], _at(0, 7, 59)) == 0
+
+
+def test_days_of_the_window():
+    assert schedules.get_scheduled_floor([OFFICE_HOURS], _at(4, 12)) == 20
+    assert schedules.get_scheduled_floor([OFFICE_HOURS], _at(5, 12)) == 0
+    assert schedules.get_scheduled_floor([dict(OFFICE_HOURS, days="*")], _at(6, 12)) == 20
+    assert (
+        schedules.get_scheduled_floor([dict(OFFICE_HOURS, days="Sat-Mon")], _at(6, 12))
+        == 20
+    )
+    assert (
+        schedules.get_scheduled_floor([dict(OFFICE_HOURS, days="Sat-Mon")], _at(1, 12))
+        == 0
+    )
+
+
+def test_window_ending_on_the_next_day():
+    assert schedules.get_scheduled_floor([NIGHTLY], _at(4, 23)) == 50
+    assert schedules.get_scheduled_floor([NIGHTLY], _at(5, 1)) == 50
+    assert schedules.get_scheduled_floor([NIGHTLY], _at(5, 2)) == 0
+    # Friday's early hours belong to Thursday's window
+    assert schedules.get_scheduled_floor([NIGHTLY], _at(4, 1)) == 0
+
+
+def test_highest_floor_of_the_active_windows():
+    assert schedules.get_scheduled_floor(
+        [OFFICE_HOURS, dict(OFFICE_HOURS, start="12:00", min_nodes=30)], _at(0, 13)
+    ) == 30
+
+
+def test_times_are_evaluated_in_utc():
+    at = _at(0, 8).astimezone(timezone(timedelta(hours=-5)))
+
+    assert schedules.get_scheduled_floor([OFFICE_HOURS], at) == 20
+
+
+def test_invalid_schedules_are_ignored():
+    invalid_schedules = [
+        {"days": "Someday", "start": "08:00", "end": "18:00", "min_nodes": 5},
+        {"start": "8h", "end": "18:00", "min_nodes": 5},
+        {"start": "08:00", "end": "18:00"},
+    ]
+
+    assert schedules.get_scheduled_floor(invalid_schedules + [OFFICE_HOURS], _at(0, 9)) == 20
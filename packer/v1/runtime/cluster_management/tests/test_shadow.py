@@ -0,0 +1,125 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import pytest
+
+from mwplatforminterfaces.cloud_interface import CloudCapacity
+from mwplatforminterfaces.os_interface import ClusterCapacity
+
+from autoscaling import reconciler
+from autoscaling import shadow
+from autoscaling.shadow import ACTIVE_POLICY, MAX_PROJECTION_INTERVAL_SECONDS
+
+from constants import (
+    ADAPTIVE_IDLE_TIMEOUT_ENABLED,
+    CAPACITY_SCHEDULES,
+    FORECAST_BUCKET_SECONDS,
+    FORECAST_ENABLED,
+    FORECAST_SEASON_BUCKETS,
+    HEADROOM_PERCENT,
+    HEADROOM_WORKERS,
+    IDLE_TIMEOUT_BOOT_DELAY_WEIGHT,
+    MAX_SURGE_NODES,
+    MAX_SURGE_PERCENT,
+    MIN_NODE_LIFETIME_SECONDS,
+    POOL_SPLIT_POLICY,
+    SCALE_IN_CRITERIA,
+    SCALE_IN_ENABLED,
+    SCALE_IN_STABILIZATION_SECONDS,
+    SCALE_OUT_STABILIZATION_SECONDS,
+)
+
+from tests.cluster_views import make_nodes, make_view
+
+# Config of the policy of the views built by make_view
+CONFIG = {
+    POOL_SPLIT_POLICY: "priority",
+    ADAPTIVE_IDLE_TIMEOUT_ENABLED: False,
+    IDLE_TIMEOUT_BOOT_DELAY_WEIGHT: 1.0,
+    SCALE_OUT_STABILIZATION_SECONDS: 0,
+    SCALE_IN_STABILIZATION_SECONDS: 0,
+    MIN_NODE_LIFETIME_SECONDS: 0,
+    SCALE_IN_CRITERIA: ["longest_idle"],
+    FORECAST_ENABLED: False,
+    FORECAST_BUCKET_SECONDS: 900,
+    FORECAST_SEASON_BUCKETS: 96,
+    HEADROOM_WORKERS: 0,
+    HEADROOM_PERCENT: 0.0,
+    CAPACITY_SCHEDULES: [],
+    MAX_SURGE_NODES: 0,
+    MAX_SURGE_PERCENT: 0.0,
+    SCALE_IN_ENABLED: True,
+}
+
+SURGE_CANDIDATE = {"name": "surge", "overrides": {MAX_SURGE_NODES: 1}}
+
+
+def _scale_out_view(**fields):
+    # 20 workers wanted, 8 running: the active policy asks for 5 nodes
+    return make_view(
+        CloudCapacity(2, 0, 10, 2, 4),
+        ClusterCapacity(8, 20, 32),
+        make_nodes({"n1": {"idle": 0}, "n2": {"idle": 0}}),
+        **fields,
+    )
+
+
+def _evaluate(view, candidates, evaluation):
+    return shadow.evaluate(view, reconciler.plan(view), candidates, CONFIG, evaluation)
+
+
+def test_config_matches_the_test_views():
+    view = _scale_out_view()
+
+    assert view._replace(**reconciler.get_policy_settings(CONFIG)) == view
+
+
+def test_candidates_are_planned_on_the_active_view():
+    evaluation = _evaluate(_scale_out_view(), [SURGE_CANDIDATE], {})
+
+    active, surge = evaluation["policies"][ACTIVE_POLICY], evaluation["policies"]["surge"]
+    assert active == {"nodes": 5, "runs": 1, "node_hours": 0.0, "unmet_worker_hours": 0.0}
+    assert surge["nodes"] == 3
+    assert surge["runs"] == 1
+    # The candidate keeps its own demand history
+    assert "demand_history" in surge and "demand_forecast" in surge
+
+
+def test_projections_add_up_across_runs():
+    view = _scale_out_view()
+    evaluation = _evaluate(view, [SURGE_CANDIDATE], {})
+
+    # A stopped program does not count the hours it did not observe
+    view = view._replace(read_at=view.read_at + 2 * MAX_PROJECTION_INTERVAL_SECONDS)
+    evaluation = _evaluate(view, [SURGE_CANDIDATE], evaluation)
+
+    hours = MAX_PROJECTION_INTERVAL_SECONDS / 3600
+    active, surge = evaluation["policies"][ACTIVE_POLICY], evaluation["policies"]["surge"]
+    assert evaluation["last_at"] == view.read_at
+    assert active["runs"] == 2
+    assert active["node_hours"] == pytest.approx(5 * hours)
+    assert active["unmet_worker_hours"] == 0
+    assert surge["node_hours"] == pytest.approx(3 * hours)
+    assert surge["unmet_worker_hours"] == pytest.approx(8 * hours)
+
+
+@pytest.mark.parametrize(
+    "candidate",
+    [
+        {"overrides": {MAX_SURGE_NODES: 1}},
+        {"name": ACTIVE_POLICY, "overrides": {MAX_SURGE_NODES: 1}},
+        {"name": "typo", "overrides": {"max_surge": 1}},
+        {"name": "invalid", "overrides": {MAX_SURGE_NODES: "one"}},
+    ],
+)
+def test_invalid_candidates_are_skipped(candidate):
+    evaluation = _evaluate(_scale_out_view(), [candidate], {})
+
+    assert set(evaluation["policies"]) == {ACTIVE_POLICY}
+
+
+def test_duplicate_candidates_are_skipped():
+    candidates = [SURGE_CANDIDATE, dict(SURGE_CANDIDATE, overrides={})]
+
+    evaluation = _evaluate(_scale_out_view(), candidates, {})
+
+    assert evaluation["policies"]["surge"]["nodes"] == 3
@@ -0,0 +1,63 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from autoscaling import stabilization
+from autoscaling.stabilization import StabilizationSettings
+
+SETTINGS = StabilizationSettings(
+    scale_out_window_seconds=60, scale_in_window_seconds=300, min_node_lifetime_seconds=0
+)
+
+
+def test_get_settings():
+    settings = stabilization.get_settings(
+        {
+            "scale_out_stabilization_seconds": "60",
+            "scale_in_stabilization_seconds": 300,
+            "min_node_lifetime_seconds": 600,
+        }
+    )
+
+    assert settings == StabilizationSettings(60, 300, 600)
+
+
+def test_record_demand_drops_samples_older_than_the_retention():
+    history = [[0, 4], [100, 8], [250, 12]]
+
+    assert stabilization.record_demand(history, 300, 16, 200) == [
+        [100, 8],
+        [250, 12],
+        [300, 16],
+    ]
+    # The history is not modified in place
+    assert history == [[0, 4], [100, 8], [250, 12]]
+
+
+def test_short_peak_does_not_scale_out():
+    history = [[0, 8], [20, 8], [40, 40]]
+
+    assert stabilization.get_stabilized_demand(history, 40, SETTINGS, 8) == 8
+
+
+def test_sustained_peak_scales_out_to_the_lowest_demand_of_the_window():
+    history = [[0, 8], [20, 32], [40, 40], [80, 40]]
+
+    assert stabilization.get_stabilized_demand(history, 80, SETTINGS, 8) == 32
+
+
+def test_short_dip_does_not_scale_in():
+    history = [[0, 40], [200, 40], [280, 4]]
+
+    assert stabilization.get_stabilized_demand(history, 280, SETTINGS, 40) == 40
+
+
+def test_sustained_dip_scales_in_to_the_highest_demand_of_the_window():
+    history = [[0, 40], [100, 16], [200, 8], [420, 4]]
+
+    assert stabilization.get_stabilized_demand(history, 420, SETTINGS, 40) == 8
+
+
+def test_zero_windows_follow_the_demand():
+    settings = StabilizationSettings(0, 0, 0)
+
+    assert stabilization.get_stabilized_demand([[0, 8], [10, 40]], 10, settings, 8) == 40
+    assert stabilization.get_stabilized_demand([[0, 40], [10, 4]], 10, settings, 40) == 4
@@ -0,0 +1,83 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from autoscaling import victim_scoring
+
+from tests.cluster_views import make_nodes
+
+
+def _pick(nodes, names, count, candidates=None):
+    return victim_scoring.pick_victims(
+        candidates or {record.hostname for record in nodes},
+        nodes,
+        victim_scoring.get_criteria(names),
+        count,
+    )
+
+
+def test_longest_idle_first():
+    nodes = make_nodes({"n1": {"idle": 700}, "n2": {"idle": 900}, "n3": {"idle": 800}})
+
+    assert _pick(nodes, ["longest_idle"], 2) == ["n2", "n3"]
+
+
+def test_balance_zones_releases_from_the_largest_zone_first():
+    nodes = make_nodes(
+        {
+            "a1": {"idle": 900, "availability_zone": "a"},
+            "b1": {"idle": 700, "availability_zone": "b"},
+            "b2": {"idle": 800, "availability_zone": "b"},
+            "b3": {"idle": 600, "availability_zone": "b"},
+        }
+    )
+
+    # The zones are rebalanced after each pick, the zones left even are
+    # ranked by the next criterion
+    assert _pick(nodes, ["balance_zones", "longest_idle"], 3) == ["b2", "b1", "a1"]
+
+
+def test_balance_zones_counts_the_nodes_that_are_not_candidates():
+    nodes = make_nodes(
+        {
+            "a1": {"idle": 900, "availability_zone": "a"},
+            "b1": {"idle": 700, "availability_zone": "b"},
+            "b2": {"idle": 0, "availability_zone": "b"},
+        }
+    )
+
+    assert _pick(nodes, ["balance_zones"], 1, {"a1", "b1"}) == ["b1"]
+
+
+def test_purchase_options():
+    nodes = make_nodes(
+        {
+            "od": {"idle": 900, "purchase_option": "on-demand"},
+            "spot": {"idle": 700, "purchase_option": "spot"},
+        }
+    )
+
+    assert _pick(nodes, ["spot_first"], 1) == ["spot"]
+    assert _pick(nodes, ["on_demand_first"], 1) == ["od"]
+
+
+def test_coldest_cache_releases_the_newest_nodes_first():
+    nodes = make_nodes(
+        {"old": {"idle": 900, "uptime": 7200}, "new": {"idle": 700, "uptime": 1200}}
+    )
+
+    assert _pick(nodes, ["coldest_cache"], 1) == ["new"]
+
+
+def test_ties_are_broken_by_hostname():
+    nodes = make_nodes({"n2": {"idle": 600}, "n1": {"idle": 600}})
+
+    assert _pick(nodes, ["longest_idle"], 2) == ["n1", "n2"]
+
+
+def test_unknown_criteria_are_ignored():
+    assert victim_scoring.get_criteria(["unknown", "spot_first"]) == [
+        victim_scoring.spot_first
+    ]
+    assert victim_scoring.get_criteria(["unknown"]) == [
+        victim_scoring.balance_zones,
+        victim_scoring.longest_idle,
+    ]
@@ -0,0 +1,37 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import asyncio
+from typing import Awaitable, Callable, Tuple, TypeVar
+
+CloudState = TypeVar("CloudState")
+ClusterState = TypeVar("ClusterState")
+
+
+def fetch_concurrently(
+    cloud_read: Callable[[], CloudState],
+    cluster_read: Callable[[], Awaitable[ClusterState]],
+) -> Tuple[CloudState, ClusterState]:
+    """Read the cloud platform and the job managers state at the same time.
+
+    The cloud platform read is blocking and runs on a thread, while the job
+    managers read runs as an asynchronous subprocess on the event loop. The
+    duration of the fetch is the duration of the slower read.
+
+    Args:
+        cloud_read (Callable): Function reading the cloud platform state.
+        cluster_read (Callable): Coroutine function reading the job managers
+        state.
+
+    Returns:
+        cloud_state: Result of cloud_read.
+        cluster_state: Result of cluster_read.
+    """
+    loop = asyncio.get_event_loop()
+
+    async def fetch():
+        return await asyncio.gather(
+            loop.run_in_executor(None, cloud_read), cluster_read()
+        )
+
+    cloud_state, cluster_state = loop.run_until_complete(fetch())
+    return cloud_state, cluster_state
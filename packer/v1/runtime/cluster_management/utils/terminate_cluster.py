@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
 from mwplatforminterfaces import CloudInterface
 from mwplatforminterfaces import OSInterface
+from mwplatforminterfaces.constants import DEFAULT_POOL
 
+from autoscaling import drain_journal
 from cluster_management_interface import ClusterManagementProgramInterface
 from constants import (
     STATUS_SUCCESS,
@@ -16,9 +18,11 @@ from constants import (
     MJS_STATUS_LOG_FILE,
     LAST_TERMINATION_POLICY,
     MIN_NODES_PRE_TERMINATION,
+    DRAIN_JOURNAL,
 )
 
 import os
+import time
 
 import logging
 
@@ -62,9 +66,17 @@ def main(
     )
 
     # Try scaling down the cluster to 0 nodes
-    cloud_capacity = cloud_interface.get_cloud_capacity()
-    current_nodes = cloud_capacity.current_nodes
-    minimum_nodes = cloud_capacity.minimum_nodes
+    pools_capacity = cloud_interface.get_pools_capacity()
+    if pools_capacity is None:
+        logger.error(
+            "There was an issue retrieving the capacity of the Auto-Scaling Groups."
+            " Skipping cluster termination."
+        )
+        return STATUS_CLOUD_ISSUE
+
+    current_nodes = sum(capacity.current_nodes for capacity in pools_capacity.values())
+    # Only the minimum of the default pool is saved and restored
+    minimum_nodes = pools_capacity[DEFAULT_POOL].minimum_nodes
 
     if current_nodes:
         if minimum_nodes > 0:
@@ -79,9 +91,11 @@ def main(
                 logger.debug("Failed to set minimum number of nodes to zero.")
                 cloud_issue = True
 
-        # Set desired capacity as zero
+        # Set desired capacity of every worker pool as zero
         logger.info("Setting desired capacity of the cluster to zero.")
-        desired_capacity_set = cloud_interface.set_cloud_capacity(0)
+        desired_capacity_set = cloud_interface.set_pools_capacity(
+            {pool: 0 for pool in pools_capacity}
+        ) == set(pools_capacity)
 
         if not desired_capacity_set:
             logger.debug(
@@ -92,16 +106,61 @@ def main(
         # Stop workers on all nodes and unprotect them
         logger.info("Stopping workers on cluster nodes...")
         worker_nodes = os_interface.get_worker_nodes()
-        if worker_nodes:
-            nodes_stopped = os_interface.stop_workers_on_nodes(worker_nodes)
+        # Instance ids are looked up once for all batches
+        cluster_model = cloud_interface.get_cluster_model() if worker_nodes else None
+        if worker_nodes and cluster_model is None:
+            # Without the instance ids, the nodes can neither be unprotected
+            # nor followed in the drain journal, so their workers are left
+            # running
+            logger.error(
+                "There was an issue retrieving the worker nodes. Skipping cluster termination."
+            )
+            cloud_issue, cluster_issue = True, True
+        elif worker_nodes:
+            # Workers asked to stop by a previous run are given time to stop
+            # before being asked again
+            drains = drain_journal.get_drain_decisions(
+                cluster_management_interface.cluster_management_state[DRAIN_JOURNAL],
+                cluster_model,
+                time.time(),
+            )
+            nodes_to_stop = worker_nodes - drains.in_flight
+            if drains.in_flight & worker_nodes:
+                logger.debug(
+                    f"Workers of {len(drains.in_flight & worker_nodes)} nodes are "
+                    "still stopping"
+                )
+            nodes_stopped, nodes_unprotected = set(), set()
+            # Unprotect each batch of nodes as soon as their workers are
+            # confirmed stopped, so that they are terminated without waiting
+            # for the slower nodes
+            for nodes_batch in os_interface.stop_workers_on_nodes_streaming(
+                nodes_to_stop
+            ):
+                logger.debug(f"Stopped workers on {len(nodes_batch)} nodes, unprotecting them...")
+                nodes_stopped.update(nodes_batch)
+                nodes_unprotected.update(
+                    cloud_interface.set_nodes_protection(
+                        nodes_batch, False, cluster_model
+                    )
+                )
+
+            cluster_management_interface.update_state(
+                {
+                    DRAIN_JOURNAL: drain_journal.record_drain_attempts(
+                        drains.journal,
+                        cluster_model,
+                        nodes_to_stop,
+                        nodes_stopped,
+                        nodes_unprotected,
+                        time.time(),
+                    )
+                }
+            )
+
             if nodes_stopped:
                 logger.debug(f"Stopped workers on {len(nodes_stopped)} nodes")
 
-                logger.info("Unprotecting cluster nodes...")
-                nodes_unprotected = cloud_interface.set_nodes_protection(
-                    nodes_stopped, False
-                )
-
                 if nodes_stopped != nodes_unprotected:
                     failed_nodes = nodes_stopped - nodes_unprotected
                     logger.debug(
@@ -129,6 +188,15 @@ def main(
                 cloud_issue = True
 
     if cluster_issue or cloud_issue:
+        # Keep the drain journal so that the next attempt does not ask the
+        # same workers to stop again
+        if (
+            cluster_management_interface.update_state_file
+            and not cluster_management_interface.update_cluster_management_data_file()
+        ):
+            logger.error("Unable to update cluster management data file. Exiting...")
+            return STATUS_INTERNAL_READ_WRITE_ISSUE
+
         # If something went wrong, skip stopping essential services
         return termination_status(cloud_issue, cluster_issue)
 
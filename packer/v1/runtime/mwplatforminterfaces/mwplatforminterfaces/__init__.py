@@ -1,4 +1,4 @@
-# Copyright 2021-2025 The MathWorks, Inc.
+# Copyright 2021-2026 The MathWorks, Inc.
 
 """mwplatforminterfaces package
 
@@ -15,11 +15,16 @@ Classes:
         interface.
         windows_interface.WindowsInterface: Windows implementation of the os
         interface.
+
+    cluster_model.ClusterModel: Worker nodes records shared by the interfaces,
+    indexed by hostname and by instance id.
+        cluster_model.NodeRecord: Record of a worker node.
 """
 
 import platform
 
 from .aws_interface import AWSInterface as CloudInterface
+from .cluster_model import ClusterModel, NodeRecord
 
 from .logging_config import setup_logger
 
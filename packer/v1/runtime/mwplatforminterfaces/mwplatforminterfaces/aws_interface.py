@@ -3,7 +3,10 @@
 from .cloud_interface import (
     AbstractCloudInterface,
     CloudCapacity,
+    WorkerPool,
+    combine_capacities,
 )
+from .cluster_model import ClusterModel, NodeRecord
 
 from .constants import (
     IMDS_URL,
@@ -11,14 +14,17 @@ from .constants import (
     IDLE_TIMEOUT_DEFAULT,
     CLUSTER_TERMINATION_TAG,
     MW_STATE_TAG,
+    DEFAULT_POOL,
+    WORKER_POOL_TAG,
 )
 
 import boto3
 from botocore.exceptions import ClientError
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import re
 import requests
-from typing import Set
+from typing import Dict, List, Set
 import logging
 
 logger = logging.getLogger("mwplatforminterfaces.aws_interface")
@@ -32,6 +38,8 @@ class AWSInterface(AbstractCloudInterface):
         asg_client (AutoScaling.Client): Auto Scaling group client.
         asg_name (str): Auto Scaling group name (physical resource id).
         workers_per_node (int): Number of MATLAB workers per EC2 instance.
+        pools (Dict[str, WorkerPool]): Worker pools keyed by name. Each pool
+        is an Auto Scaling group.
     """
 
     __session: boto3.Session
@@ -42,16 +50,30 @@ class AWSInterface(AbstractCloudInterface):
 
     _workers_per_node: int
 
+    __pools: Dict[str, WorkerPool]
+    __pools_asg_name: Dict[str, str]
+
     def __init__(
             self,
             use_private_ip_mapping: bool = False,
-            dns_search_suffix: str = None
+            dns_search_suffix: str = None,
+            worker_pools: List[Dict] = None,
         ) -> None:
         """Create AWSInterface object and set all necessary attributes.
 
         Headnode information is retrieved from the instance meta-data url.
         Auto Scaling group is identified through its name in the
-        CloudFormation outputs.
+        CloudFormation outputs. It is the default worker pool.
+
+        Additional worker pools are Auto Scaling groups described by
+        dictionaries such as
+            {"name": "gpu", "asg_name": "my-gpu-asg", "priority": 1,
+             "instance_type": "g5.xlarge", "workers_per_node": 1}
+        "workers_per_node" defaults to "auto", the number of physical cores
+        of the instance type. An entry named "default" sets the priority of
+        the default pool. The headnode can only scale the Auto Scaling groups
+        tagged with WORKER_POOL_TAG set to the name of the cluster stack.
+        Pools whose Auto Scaling group does not exist are ignored.
         """
         try:
             # Retrieve token to query imds (required for imdsv2)
@@ -93,6 +115,17 @@ class AWSInterface(AbstractCloudInterface):
                 stack.parameters, instance_type
             )
 
+            self.__pools = {
+                DEFAULT_POOL: WorkerPool(
+                    DEFAULT_POOL, 0, instance_type, self._workers_per_node
+                )
+            }
+            self.__pools_asg_name = {DEFAULT_POOL: self.__asg_name}
+            for pool_config in worker_pools or []:
+                self.__add_worker_pool(pool_config)
+            if len(self.__pools) > 1:
+                self.__validate_worker_pools(stack.stack_name)
+
             self.__use_private_ip_mapping = use_private_ip_mapping
             self.__dns_suffix = dns_search_suffix
 
@@ -104,26 +137,47 @@ class AWSInterface(AbstractCloudInterface):
         """Get the Amazon EC2 Auto Scaling group capacity info
         as well as the number of workers per node.
 
+        With several worker pools, the numbers of nodes of all the pools are
+        added up and the number of workers per node is the one of the default
+        pool.
+
         Returns:
             info (CloudCapacity): Auto Scaling group limits.
         """
-        asg_data = self._get_asg_description()
-        if asg_data is not None:
-            info = CloudCapacity(
-                desired_nodes=asg_data["DesiredCapacity"],
-                minimum_nodes=asg_data["MinSize"],
-                maximum_nodes=asg_data["MaxSize"],
-                current_nodes=sum(
-                    1
-                    for i in asg_data["Instances"]
-                    if i["HealthStatus"] == "Healthy"
-                    and i["LifecycleState"] in ("Pending", "InService")
-                ),
-                workers_per_node=self._workers_per_node,
-            )
-            return info
+        pools_capacity = self.get_pools_capacity()
+        if pools_capacity is None:
+            return None
 
-        return None
+        return combine_capacities(pools_capacity)
+
+    def get_worker_pools(self) -> List[WorkerPool]:
+        """Get the worker pools of the cluster.
+
+        Returns:
+            pools (List[WorkerPool]): Worker pools, highest priority first.
+        """
+        return sorted(self.__pools.values(), key=lambda p: (-p.priority, p.name))
+
+    def get_pools_capacity(self) -> Dict[str, CloudCapacity]:
+        """Get the capacity info of the Auto Scaling group of every worker
+        pool with a single request.
+
+        Launching nodes are instances that are still pending. Draining nodes
+        are instances being terminated, or in service but no longer
+        protected from scale-in.
+
+        Returns:
+            info (Dict[str, CloudCapacity]): Auto Scaling group limits keyed
+            by pool name, or None if they could not be read.
+        """
+        asgs_data = self._get_asg_descriptions()
+        if asgs_data is None:
+            return None
+
+        return {
+            pool: self.__get_capacity(asg_data, self.__pools[pool].workers_per_node)
+            for pool, asg_data in asgs_data.items()
+        }
 
     def get_idle_timeout_seconds(self) -> int:
         """Get the idle timeout specified on the Auto Scaling group.
@@ -166,38 +220,83 @@ class AWSInterface(AbstractCloudInterface):
         Returns:
             nodes_hostnames (Set[str]): Hostnames of the nodes.
         """
-        asg_data = self._get_asg_description()
-        if asg_data is not None:
-            # More information about instance lifecycle:
-            # https://docs.aws.amazon.com/autoscaling/ec2/userguide/ec2-auto-scaling-lifecycle.html
-            nodes_ids = [
-                i["InstanceId"]
-                for i in asg_data["Instances"]
-                if i["LifecycleState"] == "InService"
-                and i["HealthStatus"] == "Healthy"
-                and i["ProtectedFromScaleIn"]
-            ]
+        nodes_state = self.get_worker_nodes_state(grace_period_seconds)
+        if nodes_state is not None:
+            return set(nodes_state)
 
-            if len(nodes_ids) == 0:
-                return set()
+        return None
 
-            ec2_data = self.__ec2_client.describe_instances(InstanceIds=nodes_ids)
-            now = datetime.now(timezone.utc)
-            host_uptime = {
-                self.__get_hostname(i): now - i["LaunchTime"]
-                for r in ec2_data["Reservations"]
-                for i in r["Instances"]
-            }
+    def get_worker_nodes_state(
+        self, grace_period_seconds: int = 300, cluster_model: ClusterModel = None
+    ) -> Dict[str, str]:
+        """Get the Auto Scaling group state of the worker nodes returned by
+        get_worker_nodes. The state of a node is made of its instance id,
+        lifecycle state and health status.
 
-            nodes_hostnames = {
-                host
-                for host, uptime in host_uptime.items()
-                if uptime.total_seconds() > grace_period_seconds
-            }
+        Returns:
+            nodes_state (Dict[str, str]): Mapping between hostname and state.
+        """
+        if cluster_model is None:
+            cluster_model = self.get_cluster_model()
+            if cluster_model is None:
+                return None
+
+        # More information about instance lifecycle:
+        # https://docs.aws.amazon.com/autoscaling/ec2/userguide/ec2-auto-scaling-lifecycle.html
+        return {
+            record.hostname: record.cloud_state
+            for record in cluster_model
+            if record.lifecycle_state == "InService"
+            and record.health_status == "Healthy"
+            and record.protected
+            and record.uptime_seconds() > grace_period_seconds
+        }
+
+    def get_cluster_model(self) -> ClusterModel:
+        """Get the records of the instances of the Auto Scaling groups of all
+        the worker pools that are not terminated, joining their Auto Scaling
+        group and EC2 descriptions.
 
-            return nodes_hostnames
+        Returns:
+            cluster_model (ClusterModel): Worker nodes records.
+        """
+        asgs_data = self._get_asg_descriptions()
+        if asgs_data is None:
+            return None
+
+        cluster_model = ClusterModel()
+        asg_instances, instances_pool = {}, {}
+        for pool, asg_data in asgs_data.items():
+            for i in asg_data["Instances"]:
+                asg_instances[i["InstanceId"]] = i
+                instances_pool[i["InstanceId"]] = pool
+        if not asg_instances:
+            return cluster_model
+
+        ec2_data = self.__ec2_client.describe_instances(
+            InstanceIds=list(asg_instances)
+        )
+        for r in ec2_data["Reservations"]:
+            for i in r["Instances"]:
+                if i["State"]["Name"] == "terminated":
+                    continue
+
+                asg_instance = asg_instances[i["InstanceId"]]
+                cluster_model.add(
+                    NodeRecord(
+                        hostname=self.__get_hostname(i),
+                        instance_id=i["InstanceId"],
+                        lifecycle_state=asg_instance["LifecycleState"],
+                        health_status=asg_instance["HealthStatus"],
+                        protected=asg_instance["ProtectedFromScaleIn"],
+                        launch_time=i["LaunchTime"],
+                        availability_zone=i["Placement"]["AvailabilityZone"],
+                        purchase_option=i.get("InstanceLifecycle", "on-demand"),
+                        pool=instances_pool[i["InstanceId"]],
+                    )
+                )
 
-        return None
+        return cluster_model
 
     def set_cloud_capacity(self, desired_nodes: int) -> bool:
         """Update the Amazon EC2 Auto Scaling group desired capacity.
@@ -211,9 +310,43 @@ class AWSInterface(AbstractCloudInterface):
             status (bool): Exit status of the process.
             True indicates that it ran successfully.
         """
+        return self.__set_desired_capacity(self.__asg_name, desired_nodes)
+
+    def set_pools_capacity(self, desired_nodes: Dict[str, int]) -> Set[str]:
+        """Update the desired capacity of the Auto Scaling groups of multiple
+        worker pools. The requests are issued concurrently.
+
+        Args:
+            desired_nodes (Dict[str, int]): Desired number of Auto Scaling
+            instances keyed by pool name.
+
+        Returns:
+            pools_success (Set[str]): Names of the pools for which the
+            operation was successful.
+        """
+        if not desired_nodes:
+            return set()
+
+        with ThreadPoolExecutor(max_workers=len(desired_nodes)) as executor:
+            results = dict(
+                zip(
+                    desired_nodes,
+                    executor.map(
+                        lambda pool: self.__set_desired_capacity(
+                            self.__pools_asg_name[pool], desired_nodes[pool]
+                        ),
+                        desired_nodes,
+                    ),
+                )
+            )
+
+        return {pool for pool, success in results.items() if success}
+
+    def __set_desired_capacity(self, asg_name: str, desired_nodes: int) -> bool:
+        """Update the desired capacity of an Auto Scaling group."""
         try:
             self.__asg_client.set_desired_capacity(
-                AutoScalingGroupName=self.__asg_name,
+                AutoScalingGroupName=asg_name,
                 DesiredCapacity=desired_nodes,
                 HonorCooldown=False,
             )
@@ -250,7 +383,9 @@ class AWSInterface(AbstractCloudInterface):
             return False
         return True
 
-    def set_nodes_unhealthy(self, nodes_hostnames: Set[str]) -> bool:
+    def set_nodes_unhealthy(
+        self, nodes_hostnames: Set[str], cluster_model: ClusterModel = None
+    ) -> bool:
         """Indicate to Auto Scaling group that multiple nodes are no
         longer healthy. The Auto Scaling group will terminate the nodes
         shortly.
@@ -259,6 +394,8 @@ class AWSInterface(AbstractCloudInterface):
 
         Args:
             nodes_hostnames (Set[str]): Hostnames of the nodes to mark.
+            cluster_model (ClusterModel): Worker nodes records used to find the
+            nodes. Retrieved from the Auto Scaling group by default.
 
         Returns:
             status (bool): Exit status of the process.
@@ -266,13 +403,13 @@ class AWSInterface(AbstractCloudInterface):
         """
         status = True
 
-        host_to_id = self._get_host_to_id()
+        cluster_model = cluster_model or self.get_cluster_model() or ClusterModel()
         for hostname in nodes_hostnames:
-            if hostname in host_to_id:
-                instance_id = host_to_id[hostname]
+            record = cluster_model.by_host(hostname)
+            if record is not None and record.instance_id is not None:
                 try:
                     self.__asg_client.set_instance_health(
-                        InstanceId=instance_id, HealthStatus="Unhealthy"
+                        InstanceId=record.instance_id, HealthStatus="Unhealthy"
                     )
 
                 except ClientError as e:
@@ -288,7 +425,10 @@ class AWSInterface(AbstractCloudInterface):
         return status
 
     def set_nodes_protection(
-        self, nodes_hostnames: Set[str], protect: bool
+        self,
+        nodes_hostnames: Set[str],
+        protect: bool,
+        cluster_model: ClusterModel = None,
     ) -> Set[str]:
         """Update multiple nodes' protection status. When a node is protected,
         the Auto Scaling group cannot terminate it automatically.
@@ -296,6 +436,8 @@ class AWSInterface(AbstractCloudInterface):
         Args:
             nodes_hostnames (Set[str]): Hostnames of the nodes.
             protect (bool): Protection state to set.
+            cluster_model (ClusterModel): Worker nodes records used to find the
+            nodes. Retrieved from the Auto Scaling group by default.
 
         Returns:
             nodes_success (Set[str]): Hostnames of the nodes for which the
@@ -303,25 +445,33 @@ class AWSInterface(AbstractCloudInterface):
         """
         nodes_success = set()
 
-        host_to_id = self._get_host_to_id()
-        id_to_host = {i: h for h, i in host_to_id.items()}
-        nodes_ids = list(filter(None, map(host_to_id.get, nodes_hostnames)))
+        cluster_model = cluster_model or self.get_cluster_model() or ClusterModel()
+
+        # Instance protection is set on the Auto Scaling group of each pool
+        pools_ids: Dict[str, List[str]] = {}
+        for instance_id in cluster_model.instance_ids(nodes_hostnames):
+            pool = cluster_model.by_id(instance_id).pool
+            pools_ids.setdefault(pool, []).append(instance_id)
 
         AWS_ID_LIMIT = 50
-        for i in range(0, len(nodes_ids), AWS_ID_LIMIT):
-            ids_slice = nodes_ids[i : i + AWS_ID_LIMIT]
-            try:
-                self.__asg_client.set_instance_protection(
-                    AutoScalingGroupName=self.__asg_name,
-                    InstanceIds=ids_slice,
-                    ProtectedFromScaleIn=protect,
-                )
-                nodes_success.update(map(id_to_host.get, ids_slice))
+        for pool, nodes_ids in pools_ids.items():
+            for i in range(0, len(nodes_ids), AWS_ID_LIMIT):
+                ids_slice = nodes_ids[i : i + AWS_ID_LIMIT]
+                try:
+                    self.__asg_client.set_instance_protection(
+                        AutoScalingGroupName=self.__pools_asg_name[pool],
+                        InstanceIds=ids_slice,
+                        ProtectedFromScaleIn=protect,
+                    )
+                    for instance_id in ids_slice:
+                        record = cluster_model.by_id(instance_id)
+                        record.protected = protect
+                        nodes_success.add(record.hostname)
 
-            except ClientError as e:
-                logger.exception(
-                    "An error occurred while setting instance protection: %s", e
-                )
+                except ClientError as e:
+                    logger.exception(
+                        "An error occurred while setting instance protection: %s", e
+                    )
 
         return nodes_success
 
@@ -340,14 +490,16 @@ class AWSInterface(AbstractCloudInterface):
             status(bool): True if Cluster scaled to zero, else, False
         """
         # Get host names of all instances in the ASG
-        host_to_id = self._get_host_to_id()
-        host_names = set(host_to_id.keys())
+        cluster_model = self.get_cluster_model() or ClusterModel()
+        host_names = {record.hostname for record in cluster_model}
 
         if host_names:
             # Remove scale-in protection from all nodes retrieved
             for host in host_names:
                 logger.debug("Detected host to unprotect: %s",host)
-            nodes_unprotected = self.set_nodes_protection(host_names, False)
+            nodes_unprotected = self.set_nodes_protection(
+                host_names, False, cluster_model
+            )
             if nodes_unprotected != host_names:
                 return False
 
@@ -434,28 +586,42 @@ class AWSInterface(AbstractCloudInterface):
 
         return None
 
-    def _get_host_to_id(self) -> dict:
-        """Get a mapping between instances private hostname or IPv4 address and their id.
+    def _get_asg_descriptions(self) -> Dict[str, dict]:
+        """Get the Auto Scaling group description of every worker pool with a
+        single request. Pools whose Auto Scaling group is missing are left
+        out, so that the other pools keep scaling.
 
         Returns:
-            host_to_id (dict): Hostname to instance id dictionary.
+            data (Dict[str, dict]): Auto Scaling group descriptions keyed by
+            pool name, or None if the request failed or the Auto Scaling group
+            of the default pool is missing.
         """
-        host_to_id = {}
+        try:
+            asg_response = self.__asg_client.describe_auto_scaling_groups(
+                AutoScalingGroupNames=list(self.__pools_asg_name.values())
+            )
+            asgs_data = {
+                asg_data["AutoScalingGroupName"]: asg_data
+                for asg_data in asg_response["AutoScalingGroups"]
+            }
 
-        asg_data = self._get_asg_description()
+        except (ClientError, KeyError) as e:
+            logger.exception("An error occurred: %s", e)
+            return None
 
-        if asg_data:
-            nodes_ids = [i["InstanceId"] for i in asg_data["Instances"]]
+        pools_data = {}
+        for pool, asg_name in self.__pools_asg_name.items():
+            if asg_name in asgs_data:
+                pools_data[pool] = asgs_data[asg_name]
+            else:
+                logger.error(
+                    "Auto Scaling group %s of worker pool %s not found", asg_name, pool
+                )
 
-            ec2_data = self.__ec2_client.describe_instances(InstanceIds=nodes_ids)
-            host_to_id = {
-                self.__get_hostname(i): i["InstanceId"]
-                for r in ec2_data["Reservations"]
-                for i in r["Instances"]
-                if i["State"]["Name"] != "terminated"
-            }
+        if DEFAULT_POOL not in pools_data:
+            return None
 
-        return host_to_id
+        return pools_data
 
     def _extract_termination_policy(self) -> str:
         """Extract the termination policy from the headnode tags.
@@ -536,6 +702,36 @@ class AWSInterface(AbstractCloudInterface):
         local_hostname = instance['PrivateDnsName'].split('.')[0]
         return f"{local_hostname}.{self.__dns_suffix}"
 
+    @staticmethod
+    def __get_capacity(asg_data: dict, workers_per_node: int) -> CloudCapacity:
+        """Get the capacity info from an Auto Scaling group description."""
+        return CloudCapacity(
+            desired_nodes=asg_data["DesiredCapacity"],
+            minimum_nodes=asg_data["MinSize"],
+            maximum_nodes=asg_data["MaxSize"],
+            current_nodes=sum(
+                1
+                for i in asg_data["Instances"]
+                if i["HealthStatus"] == "Healthy"
+                and i["LifecycleState"] in ("Pending", "InService")
+            ),
+            workers_per_node=workers_per_node,
+            launching_nodes=sum(
+                1
+                for i in asg_data["Instances"]
+                if i["LifecycleState"].startswith("Pending")
+            ),
+            draining_nodes=sum(
+                1
+                for i in asg_data["Instances"]
+                if i["LifecycleState"].startswith("Terminating")
+                or (
+                    i["LifecycleState"] == "InService"
+                    and not i["ProtectedFromScaleIn"]
+                )
+            ),
+        )
+
     def __get_asg_name(self, outputs) -> str:
         """Get the AutoScalingGroup name from the stack outputs."""
         return get_kv(outputs, "OutputKey", "OutputValue", "ASGName")
@@ -562,7 +758,62 @@ class AWSInterface(AbstractCloudInterface):
         workers_per_node = get_kv(
             parameters, "ParameterKey", "ParameterValue", "NumWorkersPerNode"
         )
+        return self.__resolve_workers_per_node(workers_per_node, instance_type)
+
+    def __add_worker_pool(self, pool_config: Dict) -> None:
+        """Add a worker pool from its configuration. Invalid pools are logged
+        and ignored."""
+        try:
+            name = pool_config["name"]
+            priority = int(pool_config.get("priority", 0))
+            if name == DEFAULT_POOL:
+                self.__pools[name] = self.__pools[name]._replace(priority=priority)
+                return
+
+            instance_type = pool_config.get("instance_type", "")
+            self.__pools[name] = WorkerPool(
+                name,
+                priority,
+                instance_type,
+                self.__resolve_workers_per_node(
+                    pool_config.get("workers_per_node", "auto"), instance_type
+                ),
+            )
+            self.__pools_asg_name[name] = pool_config["asg_name"]
+
+        except (ClientError, KeyError, IndexError, ValueError) as e:
+            logger.error("Ignoring invalid worker pool %s: %s", pool_config, e)
+
+    def __validate_worker_pools(self, stack_name: str) -> None:
+        """Ignore the additional worker pools whose Auto Scaling group does
+        not exist, and warn about the ones the headnode is not allowed to
+        scale."""
+        asgs_data = self._get_asg_descriptions()
+        if asgs_data is None:
+            # Checked again on every read
+            return
+
+        for pool in set(self.__pools) - {DEFAULT_POOL}:
+            if pool not in asgs_data:
+                logger.error("Ignoring worker pool %s", pool)
+                del self.__pools[pool]
+                del self.__pools_asg_name[pool]
+                continue
+
+            tags = {tag["Key"]: tag["Value"] for tag in asgs_data[pool].get("Tags", [])}
+            if tags.get(WORKER_POOL_TAG) != stack_name:
+                logger.warning(
+                    "Auto Scaling group %s of worker pool %s is not tagged with "
+                    "%s=%s, the headnode may not be allowed to scale it",
+                    self.__pools_asg_name[pool],
+                    pool,
+                    WORKER_POOL_TAG,
+                    stack_name,
+                )
 
+    def __resolve_workers_per_node(self, workers_per_node, instance_type: str) -> int:
+        """Get the number of workers per node, looking up the number of
+        physical cores of the instance type if it is "auto"."""
         if workers_per_node == "auto":
             ec2 = self.__session.client("ec2")
             instance_type_info = ec2.describe_instance_types(
@@ -1,7 +1,10 @@
 # Copyright 2021-2026 The MathWorks, Inc.
 
 from abc import ABC, abstractmethod
-from typing import NamedTuple, Set
+from typing import Dict, List, NamedTuple, Set
+
+from .cluster_model import ClusterModel
+from .constants import DEFAULT_POOL
 
 
 class CloudCapacity(NamedTuple):
@@ -12,6 +15,42 @@ class CloudCapacity(NamedTuple):
     maximum_nodes: int
     current_nodes: int
     workers_per_node: int
+    launching_nodes: int = 0
+    draining_nodes: int = 0
+
+
+class WorkerPool(NamedTuple):
+    """Class defining a group of worker nodes sharing an instance type and
+    capacity limits."""
+
+    name: str
+    # Pools with the highest priority are filled first
+    priority: int
+    instance_type: str
+    workers_per_node: int
+
+
+def combine_capacities(pools_capacity: Dict[str, CloudCapacity]) -> CloudCapacity:
+    """Combine the capacity info of the worker pools. The numbers of nodes are
+    added up and the number of workers per node is the one of the default
+    pool, or of any pool if the default pool is missing.
+
+    Args:
+        pools_capacity (Dict[str, CloudCapacity]): Capacity info keyed by pool
+        name.
+
+    Returns:
+        info (CloudCapacity): Combined capacity info.
+    """
+    if len(pools_capacity) == 1:
+        return next(iter(pools_capacity.values()))
+
+    default_capacity = pools_capacity.get(
+        DEFAULT_POOL, next(iter(pools_capacity.values()))
+    )
+    return CloudCapacity(
+        *(sum(values) for values in zip(*pools_capacity.values()))
+    )._replace(workers_per_node=default_capacity.workers_per_node)
 
 
 class AbstractCloudInterface(ABC):
@@ -27,6 +66,25 @@ class AbstractCloudInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_worker_pools(self) -> List[WorkerPool]:
+        """Get the worker pools of the cluster.
+
+        Returns:
+            pools (List[WorkerPool]): Worker pools, highest priority first.
+        """
+        pass
+
+    @abstractmethod
+    def get_pools_capacity(self) -> Dict[str, CloudCapacity]:
+        """Get the capacity info of every worker pool in a single read.
+
+        Returns:
+            info (Dict[str, CloudCapacity]): Cloud-computing limits keyed by
+            pool name, or None if they could not be read.
+        """
+        pass
+
     @abstractmethod
     def get_idle_timeout_seconds(self) -> int:
         """Get the idle timeout specified on the cloud-computing platform.
@@ -38,6 +96,16 @@ class AbstractCloudInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_cluster_model(self) -> ClusterModel:
+        """Get the records of all the worker nodes known to the
+        cloud-computing platform, indexed by hostname and by instance id.
+
+        Returns:
+            cluster_model (ClusterModel): Worker nodes records.
+        """
+        pass
+
     @abstractmethod
     def get_worker_nodes(self, grace_period_seconds: int) -> Set[str]:
         """Get the current worker nodes running on the cloud-computing
@@ -49,6 +117,20 @@ class AbstractCloudInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_worker_nodes_state(
+        self, grace_period_seconds: int, cluster_model: ClusterModel = None
+    ) -> Dict[str, str]:
+        """Get the cloud state of the worker nodes returned by
+        get_worker_nodes. The state of a node changes whenever the
+        cloud-computing platform replaces the instance behind the hostname or
+        changes its lifecycle or health status.
+
+        Returns:
+            nodes_state (Dict[str, str]): Mapping between hostname and state.
+        """
+        pass
+
     @abstractmethod
     def set_cloud_capacity(self, desired_nodes: int) -> bool:
         """Update the cloud-computing platform desired capacity.
@@ -62,6 +144,20 @@ class AbstractCloudInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def set_pools_capacity(self, desired_nodes: Dict[str, int]) -> Set[str]:
+        """Update the desired capacity of multiple worker pools at once.
+
+        Args:
+            desired_nodes (Dict[str, int]): Desired number of worker nodes
+            keyed by pool name.
+
+        Returns:
+            pools_success (Set[str]): Names of the pools for which the
+            operation was successful.
+        """
+        pass
+
     @abstractmethod
     def set_min_nodes(self, nodes: int) -> bool:
         """Update the cloud-computing platform minimum capacity.
@@ -76,13 +172,17 @@ class AbstractCloudInterface(ABC):
         pass
 
     @abstractmethod
-    def set_nodes_unhealthy(self, nodes_hostnames: Set[str]) -> bool:
+    def set_nodes_unhealthy(
+        self, nodes_hostnames: Set[str], cluster_model: ClusterModel = None
+    ) -> bool:
         """Indicate to the cloud-computing platform that multiple nodes are no
         longer healthy. The cloud-computing platform will terminate the nodes
         shortly.
 
         Args:
             nodes_hostnames (Set[str]): Hostnames of the nodes to mark.
+            cluster_model (ClusterModel): Worker nodes records used to find the
+            nodes. Retrieved from the cloud-computing platform by default.
 
         Returns:
             status (bool): Exit status of the process.
@@ -128,7 +228,10 @@ class AbstractCloudInterface(ABC):
 
     @abstractmethod
     def set_nodes_protection(
-        self, nodes_hostnames: Set[str], protect: bool
+        self,
+        nodes_hostnames: Set[str],
+        protect: bool,
+        cluster_model: ClusterModel = None,
     ) -> Set[str]:
         """Update multiple nodes' protection status. When a node is
         protected, the cloud-computing platform cannot terminate it
@@ -137,6 +240,8 @@ class AbstractCloudInterface(ABC):
         Args:
             nodes_hostnames (Set[str]): Hostnames of the nodes.
             protect (bool): Protection state to set.
+            cluster_model (ClusterModel): Worker nodes records used to find the
+            nodes. Retrieved from the cloud-computing platform by default.
 
         Returns:
             nodes_success (Set[str]): Hostnames of the nodes for which the
@@ -0,0 +1,170 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Set
+
+from .constants import DEFAULT_POOL
+
+
+class NodeRecord:
+    """Class joining the cloud platform and job managers information about a
+    worker node.
+
+    Attributes:
+        instance_id (str): Cloud platform id of the node, or None if the node
+        is only known to the job managers.
+        hostname (str): Hostname the workers of the node register with.
+        lifecycle_state (str): Cloud platform lifecycle state.
+        health_status (str): Cloud platform health status.
+        protected (bool): True if the node is protected from scale-in.
+        launch_time (datetime): Time the node was launched at.
+        availability_zone (str): Availability zone the node runs in.
+        purchase_option (str): "spot" or "on-demand".
+        pool (str): Name of the worker pool the node belongs to.
+        registered (bool): True if workers of the node are registered with a
+        job manager.
+        workers (int): Number of workers registered from the node.
+        seconds_idle (int): Minimum idle duration of the node's workers.
+    """
+
+    __slots__ = (
+        "instance_id",
+        "hostname",
+        "lifecycle_state",
+        "health_status",
+        "protected",
+        "launch_time",
+        "availability_zone",
+        "purchase_option",
+        "pool",
+        "registered",
+        "workers",
+        "seconds_idle",
+    )
+
+    def __init__(
+        self,
+        hostname: str,
+        instance_id: str = None,
+        lifecycle_state: str = None,
+        health_status: str = None,
+        protected: bool = False,
+        launch_time: datetime = None,
+        availability_zone: str = None,
+        purchase_option: str = None,
+        pool: str = DEFAULT_POOL,
+    ) -> None:
+        self.instance_id = instance_id
+        self.hostname = hostname
+        self.lifecycle_state = lifecycle_state
+        self.health_status = health_status
+        self.protected = protected
+        self.launch_time = launch_time
+        self.availability_zone = availability_zone
+        self.purchase_option = purchase_option
+        self.pool = pool
+        self.registered = False
+        self.workers = 0
+        self.seconds_idle = None
+
+    @property
+    def cloud_state(self) -> str:
+        """Return the cloud state of the node, made of its instance id,
+        lifecycle state and health status."""
+        return "/".join((self.instance_id, self.lifecycle_state, self.health_status))
+
+    def uptime_seconds(self, now: datetime = None) -> float:
+        """Return the number of seconds since the node was launched."""
+        if self.launch_time is None:
+            return 0
+
+        return ((now or datetime.now(timezone.utc)) - self.launch_time).total_seconds()
+
+    def __repr__(self) -> str:
+        return "NodeRecord({})".format(
+            ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        )
+
+
+class ClusterModel:
+    """Class holding the records of the worker nodes, indexed by hostname and
+    by instance id."""
+
+    __slots__ = ("_by_host", "_by_id")
+
+    def __init__(self) -> None:
+        self._by_host: Dict[str, NodeRecord] = {}
+        self._by_id: Dict[str, NodeRecord] = {}
+
+    def __iter__(self) -> Iterator[NodeRecord]:
+        return iter(self._by_host.values())
+
+    def __len__(self) -> int:
+        return len(self._by_host)
+
+    def __contains__(self, hostname: str) -> bool:
+        return hostname in self._by_host
+
+    def add(self, record: NodeRecord) -> NodeRecord:
+        """Add a node record to the model.
+
+        Args:
+            record (NodeRecord): Record to add.
+
+        Returns:
+            record (NodeRecord): The record added.
+        """
+        self._by_host[record.hostname] = record
+        if record.instance_id is not None:
+            self._by_id[record.instance_id] = record
+        return record
+
+    def by_host(self, hostname: str) -> NodeRecord:
+        """Return the record of a node from its hostname, or None."""
+        return self._by_host.get(hostname)
+
+    def by_id(self, instance_id: str) -> NodeRecord:
+        """Return the record of a node from its instance id, or None."""
+        return self._by_id.get(instance_id)
+
+    def in_pool(self, pool: str) -> "ClusterModel":
+        """Return a model holding the records of the nodes of a worker pool.
+        The records are shared with this model."""
+        cluster_model = ClusterModel()
+        for record in self:
+            if record.pool == pool:
+                cluster_model.add(record)
+        return cluster_model
+
+    def instance_ids(self, hostnames: Set[str]) -> List[str]:
+        """Return the instance ids of the known nodes among hostnames."""
+        return [
+            self._by_host[host].instance_id
+            for host in hostnames
+            if host in self._by_host and self._by_host[host].instance_id
+        ]
+
+    def record_workers(
+        self, nodes_workers: Dict[str, int], nodes_seconds_idle: Dict[str, int]
+    ) -> None:
+        """Record the workers registered with the job managers on their node.
+        Nodes unknown to the cloud platform get a record without instance id.
+
+        Args:
+            nodes_workers (Dict[str, int]): Number of registered workers of
+            each node.
+            nodes_seconds_idle (Dict[str, int]): Number of seconds each node
+            has been idle for.
+        """
+        for host, workers in nodes_workers.items():
+            record = self._by_host.get(host)
+            if record is None:
+                record = self.add(NodeRecord(host))
+            record.registered = True
+            record.workers = workers
+            record.seconds_idle = nodes_seconds_idle.get(host)
+
+    def registered_nodes(self) -> Dict[str, int]:
+        """Return the idle duration of the nodes registered with a job
+        manager, keyed by hostname."""
+        return {r.hostname: r.seconds_idle for r in self if r.registered}
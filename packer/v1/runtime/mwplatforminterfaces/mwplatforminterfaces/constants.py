@@ -10,6 +10,13 @@ IDLE_TIMEOUT_TAG = "mwWorkerIdleTimeoutMinutes"
 # Default value for the IDLE_TIMEOUT_TAG tag
 IDLE_TIMEOUT_DEFAULT = 10
 
+# Name of the worker pool of the Auto Scaling group in the stack outputs
+DEFAULT_POOL = "default"
+
+# Tag of the Auto Scaling groups of additional worker pools, set to the name of
+# the cluster stack. The headnode role can only scale the groups with this tag.
+WORKER_POOL_TAG = "mwWorkerPoolOf"
+
 # Tag for checking the shutdown mode for the cluster
 CLUSTER_TERMINATION_TAG = "mw-autoshutdown"
 
@@ -20,3 +27,15 @@ MW_STATE_TAG = "mw-state"
 MATLAB_ROOT="/usr/local/matlab"
 MNT_ROOT="/mnt/matlab"
 MATLAB_ROOT_WIN="C:\\Program Files\\MATLAB"
+
+# UDP port on which the headnode listens for worker node heartbeats
+WORKER_HEARTBEAT_PORT = 27340
+
+# Seconds between two heartbeats sent by a worker node
+WORKER_HEARTBEAT_INTERVAL = 15
+
+# Seconds after which a worker node heartbeat is considered stale
+WORKER_HEARTBEAT_MAX_AGE = 45
+
+# File where the headnode listener publishes the latest heartbeat of each worker node
+WORKER_HEARTBEATS_FILE = "/var/run/mathworks/worker_heartbeats.json"
@@ -1,4 +1,4 @@
-# Copyright 2021-2025 The MathWorks, Inc.
+# Copyright 2021-2026 The MathWorks, Inc.
 
 from .os_interface import AbstractOSInterface
 import logging
@@ -49,6 +49,10 @@ class LinuxInterface(AbstractOSInterface):
         """Get the path of the resize executable"""
         return self._get_parallel_bin_root() / "resize"
 
+    def _get_startworker_executable(self) -> Path:
+        """Get the path of the startworker executable"""
+        return self._get_parallel_bin_root() / "startworker"
+
     def _get_stopworker_executable(self) -> Path:
         """Get the path of the stopworker executable"""
         return self._get_parallel_bin_root() / "stopworker"
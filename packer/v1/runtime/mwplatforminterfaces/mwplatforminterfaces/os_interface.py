@@ -5,9 +5,16 @@ import asyncio
 import json
 from pathlib import Path
 import subprocess
-from typing import Dict, NamedTuple, Set
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Set
 import logging
 
+from .cluster_model import ClusterModel
+from .constants import (
+    WORKER_HEARTBEAT_MAX_AGE,
+    WORKER_HEARTBEATS_FILE,
+)
+
 logger = logging.getLogger("mwplatforminterfaces.os_interface")
 
 # Limit the number of concurrent calls to MJS
@@ -16,9 +23,40 @@ MJS_SEM = asyncio.Semaphore(20)
 # Seconds to wait for stopworker execution
 STOPWORKER_TIMEOUT = 25
 
+# Seconds to wait for further stopworker completions before confirming a
+# batch of stopped nodes when streaming
+STOPWORKER_BATCH_WINDOW = 2
+
+# Shortest interval between two resize status calls confirming that the
+# workers of stopped nodes unregistered, while other nodes are still stopping
+STOPWORKER_CONFIRM_INTERVAL = 10
+
 # Seconds to wait for nodestatus execution
 NODESTATUS_TIMEOUT = 15
 
+# Seconds during which a nodestatus result is reused if the node's cloud state
+# has not changed
+NODESTATUS_CACHE_TTL = 180
+
+# Seconds to wait before probing again a host that timed out. The delay is
+# doubled after each consecutive timeout, up to NODESTATUS_BACKOFF_MAX.
+NODESTATUS_BACKOFF_BASE = 60
+NODESTATUS_BACKOFF_MAX = 900
+
+# Worker group status recorded when nodestatus timed out on a host
+WORKERGROUP_UNREACHABLE = "Unreachable"
+
+# Seconds to wait for the workers of a node to be restarted in place
+WORKER_RECOVERY_TIMEOUT = 60
+
+# Seconds given to restarted workers to register with the job manager before
+# the node is considered for replacement
+WORKER_RECOVERY_SETTLE = 180
+
+# Seconds during which a node that already went through an in-place recovery
+# is replaced rather than recovered again
+WORKER_RECOVERY_COOLDOWN = 1800
+
 
 class ClusterCapacity(NamedTuple):
     """Class defining the cluster capacity information."""
@@ -28,92 +66,412 @@ class ClusterCapacity(NamedTuple):
     maximum_workers: int
 
 
+class ClusterState(NamedTuple):
+    """Class defining the state of the cluster read from a single resize
+    status call."""
+
+    capacity: ClusterCapacity
+    job_managers_capacity: Dict[str, ClusterCapacity]
+    nodes_seconds_idle: Dict[str, int]
+    nodes_workers: Dict[str, int]
+
+
 class AbstractOSInterface(ABC):
     """Class to interact with the MATLAB Job Scheduler"""
 
-    def __init__(self) -> None:
-        """Create OSInterface object."""
-        pass
+    def __init__(
+        self,
+        nodestatus_cache: Dict = None,
+        worker_recovery: Dict = None,
+        jobmanager_host: str = None,
+    ) -> None:
+        """Create OSInterface object.
+
+        Args:
+            nodestatus_cache (Dict): Worker group statuses probed in previous
+            runs, as returned by the nodestatus_cache property. Defaults to an
+            empty cache.
+            worker_recovery (Dict): In-place worker recoveries performed in
+            previous runs, as returned by the worker_recovery property.
+            jobmanager_host (str): Hostname of the job manager as seen by the
+            worker nodes. In-place worker recovery is disabled if not set.
+        """
+        self._nodestatus_cache = dict(nodestatus_cache or {})
+        self._nodestatus_cache_updated = False
+
+        self._worker_recovery = {
+            "nodes": {},
+            "stats": {
+                "attempted": 0,
+                "recovered": 0,
+                "escalated": 0,
+                "recovery_seconds": 0,
+            },
+        }
+        for key, value in (worker_recovery or {}).items():
+            self._worker_recovery[key].update(value)
+        self._worker_recovery_updated = False
+        self._jobmanager_host = jobmanager_host
+
+    @property
+    def nodestatus_cache(self) -> Dict:
+        """Return the worker group statuses probed on remote hosts, keyed by
+        hostname. The dictionary is JSON serializable so that it can be
+        persisted between runs."""
+        return self._nodestatus_cache
+
+    @property
+    def nodestatus_cache_updated(self) -> bool:
+        """Return True if the nodestatus cache changed since its creation."""
+        return self._nodestatus_cache_updated
+
+    @property
+    def worker_recovery(self) -> Dict:
+        """Return the in-place worker recoveries attempted per hostname, along
+        with cumulative statistics. The dictionary is JSON serializable so
+        that it can be persisted between runs."""
+        return self._worker_recovery
+
+    @property
+    def worker_recovery_updated(self) -> bool:
+        """Return True if the worker recovery records changed since their
+        creation."""
+        return self._worker_recovery_updated
 
     def get_cluster_capacity(self) -> ClusterCapacity:
-        """Get the job manager's desired and maximum
-        number of workers.
+        """Get the desired and maximum number of workers of the job managers
+        running on the headnode.
+
+        The current and desired numbers of workers are summed over all job
+        managers. As every job manager may use the whole cluster, the maximum
+        number of workers is the smallest maximum among the job managers.
 
         Returns:
-            info (ClusterCapacity): Job manager's worker limits.
+            info (ClusterCapacity): Job managers' worker limits.
         """
-        worker_os = self._get_worker_os()
-        data = self._get_resize_status_output()
-        if data:
-            try:
-                info = ClusterCapacity(
-                    current_workers=len(data["workers"]),
-                    desired_workers=data["desiredWorkers"][worker_os],
-                    maximum_workers=data["maxWorkers"][worker_os],
-                )
-                return info
+        return self._combine_capacities(self.get_job_managers_capacity())
 
-            except KeyError:
-                logger.error("Key error when accessing %s", {data})
+    def get_job_managers_capacity(self) -> Dict[str, ClusterCapacity]:
+        """Get the current, desired and maximum number of workers of each job
+        manager running on the headnode.
 
-        return None
+        Returns:
+            capacities (Dict[str, ClusterCapacity]): Worker limits keyed by
+            job manager name.
+        """
+        return self._parse_job_managers_capacity(self._get_resize_status_outputs())
 
     def get_nodes_idle_time_seconds(self) -> Dict[str, int]:
         """Get the idle duration of nodes in the cluster in seconds. A node's
         idle duration is the minimum idle duration of the workers running on
-        it.
+        it, whichever job manager they are registered with.
 
         Returns:
             seconds_idle (Dict[str, int]): Number of seconds each node has been
             idle for.
         """
-        seconds_idle = {}
+        return self._parse_nodes_idle_time(self._get_resize_status_outputs())
 
-        data = self._get_resize_status_output()
-        if data is not None:
-            for worker in data["workers"]:
-                host = worker["host"]
-                idle_time = worker["secondsIdle"]
-                if host not in seconds_idle:
-                    seconds_idle[host] = idle_time
-                else:
-                    seconds_idle[host] = min(seconds_idle[host], idle_time)
+    def get_cluster_state(self, cluster_model: ClusterModel = None) -> ClusterState:
+        """Get the combined capacity of the job managers and the idle duration
+        of every registered node from a single resize status call.
 
-        return seconds_idle
+        Args:
+            cluster_model (ClusterModel): Worker nodes records in which to
+            record the registered workers, if any.
+
+        Returns:
+            state (ClusterState): Cluster capacity and idle durations, or None
+            if the job managers could not be queried.
+        """
+        state = self._parse_cluster_state(self._get_resize_status_outputs())
+        if state is not None and cluster_model is not None:
+            cluster_model.record_workers(state.nodes_workers, state.nodes_seconds_idle)
+
+        return state
+
+    async def get_cluster_state_async(self) -> ClusterState:
+        """Get the cluster state as get_cluster_state does, running resize
+        status as an asynchronous subprocess so that other reads can proceed
+        meanwhile.
+
+        Returns:
+            state (ClusterState): Cluster capacity and idle durations, or None
+            if the job managers could not be queried.
+        """
+        return self._parse_cluster_state(
+            await self._get_resize_status_outputs_async()
+        )
 
-    def get_suspended_nodes(self, nodes_hostnames: Set[str]) -> Set[str]:
+    def get_suspended_nodes(
+        self,
+        nodes_hostnames: Set[str],
+        nodes_state: Dict[str, str] = None,
+        registered_nodes: Set[str] = None,
+    ) -> Set[str]:
         """Get the nodes that are suspended. A node is suspended if workers
         have stopped running.
 
+        Hosts that sent a recent heartbeat to the headnode are not probed.
+        The worker group status of other hosts is only probed again once its
+        cached result is older than NODESTATUS_CACHE_TTL or once the cloud
+        state of the node changed. Hosts that keep timing out are probed with
+        an exponential backoff.
+
         Args:
             nodes_hostnames (Set[str]): Hostnames of the nodes.
+            nodes_state (Dict[str, str]): Cloud state of each node, as
+            returned by the cloud interface. Cached statuses of a node are
+            discarded when its state changes.
+            registered_nodes (Set[str]): Hostnames of the nodes registered
+            with a job manager, as read by get_cluster_state. Read from the
+            job managers if None.
 
         Returns:
             bad_nodes_hostnames (Set[str]): Hostnames of the nodes in a bad
             state.
         """
-        good_nodes = self.get_worker_nodes()
-        workergroup_status = self._get_workergroups_statuses(
-            nodes_hostnames - good_nodes
+        nodes_state = nodes_state or {}
+        if registered_nodes is None:
+            registered_nodes = self.get_worker_nodes()
+        candidates = nodes_hostnames - registered_nodes
+
+        # Hosts with a recent heartbeat report their own worker group status
+        heartbeats = self.get_worker_heartbeats()
+        workergroup_status = {
+            host: heartbeats[host]["workergroup"]
+            for host in candidates
+            if host in heartbeats
+        }
+        candidates -= set(workergroup_status)
+
+        # Forget hosts that are now registered or no longer running
+        for host in set(self._nodestatus_cache) - candidates:
+            del self._nodestatus_cache[host]
+            self._nodestatus_cache_updated = True
+
+        now = time.time()
+        hosts_to_probe = set()
+        for host in candidates:
+            entry = self._nodestatus_cache.get(host)
+            if self._is_nodestatus_cache_valid(entry, nodes_state.get(host), now):
+                workergroup_status[host] = entry["status"]
+            else:
+                hosts_to_probe.add(host)
+
+        logger.debug(
+            "Worker group status known for %d hosts, probing %d hosts",
+            len(workergroup_status),
+            len(hosts_to_probe),
         )
 
+        if hosts_to_probe:
+            probed_status = self._get_workergroups_statuses(hosts_to_probe)
+            for host, status in probed_status.items():
+                self._update_nodestatus_cache(
+                    host, status, nodes_state.get(host), now
+                )
+            workergroup_status.update(probed_status)
+
         bad_nodes = {
             host for host, status in workergroup_status.items() if status == "Suspended"
         }
 
         return bad_nodes
 
+    def recover_workers_on_nodes(
+        self,
+        nodes_state: Dict[str, str],
+        workers_per_node: int,
+        job_managers_capacity: Dict[str, ClusterCapacity] = None,
+    ) -> Set[str]:
+        """Try to restart the workers of multiple remote hosts in place
+        instead of replacing the nodes.
+
+        A node is recovered at most once per cloud state within
+        WORKER_RECOVERY_COOLDOWN seconds. Nodes whose restart succeeded are
+        given WORKER_RECOVERY_SETTLE seconds to register with the job manager.
+        Nodes that cannot be restarted, or that are still unhealthy after
+        settling, are left out of the returned set so that the caller can
+        replace them.
+
+        Args:
+            nodes_state (Dict[str, str]): Cloud state of the unhealthy nodes,
+            keyed by hostname.
+            workers_per_node (int): Number of workers to start on each node.
+            job_managers_capacity (Dict[str, ClusterCapacity]): Worker limits
+            keyed by job manager name, as read by get_cluster_state. Read
+            from the job managers if None.
+
+        Returns:
+            nodes_recovering (Set[str]): Hostnames of the nodes that are
+            being recovered in place.
+        """
+        if not self._jobmanager_host:
+            logger.debug("Job manager host unknown, skipping in-place recovery.")
+            return set()
+
+        now = time.time()
+        records = self._worker_recovery["nodes"]
+        stats = self._worker_recovery["stats"]
+
+        nodes_recovering, hosts_to_restart = set(), []
+        for host, node_state in nodes_state.items():
+            record = records.get(host)
+            if record and record["state"] == node_state:
+                settling = (
+                    record["succeeded"]
+                    and record["recovered_in"] is None
+                    and now - record["started_at"] < WORKER_RECOVERY_SETTLE
+                )
+                if settling:
+                    nodes_recovering.add(host)
+            else:
+                hosts_to_restart.append(host)
+
+        if hosts_to_restart:
+            # Restarted workers join the job manager with the largest unmet demand
+            capacities = job_managers_capacity
+            if capacities is None:
+                capacities = self.get_job_managers_capacity()
+            jobmanager = None
+            if capacities:
+                jobmanager = max(
+                    capacities,
+                    key=lambda name: capacities[name].desired_workers
+                    - capacities[name].current_workers,
+                )
+            if jobmanager:
+                tasks = [
+                    self._restart_workers_on_node(host, jobmanager, workers_per_node)
+                    for host in hosts_to_restart
+                ]
+                results = asyncio.get_event_loop().run_until_complete(
+                    asyncio.gather(*tasks)
+                )
+            else:
+                logger.debug("Job manager name unknown, skipping in-place recovery.")
+                results = [False] * len(hosts_to_restart)
+
+            for host, succeeded in zip(hosts_to_restart, results):
+                records[host] = {
+                    "state": nodes_state[host],
+                    "started_at": now,
+                    "succeeded": succeeded,
+                    "recovered_in": None,
+                    "escalated": False,
+                }
+                if succeeded:
+                    nodes_recovering.add(host)
+            stats["attempted"] += len(hosts_to_restart)
+            self._worker_recovery_updated = True
+
+        # Count each recovery escalated to replacement only once
+        for host in set(nodes_state) - nodes_recovering:
+            if not records[host]["escalated"]:
+                records[host]["escalated"] = True
+                stats["escalated"] += 1
+                self._worker_recovery_updated = True
+
+        return nodes_recovering
+
+    def track_worker_recoveries(self, registered_nodes: Set[str]) -> None:
+        """Record the time it took for nodes recovered in place to register
+        with the job manager again, and forget recoveries older than
+        WORKER_RECOVERY_COOLDOWN.
+
+        Args:
+            registered_nodes (Set[str]): Hostnames of the nodes currently
+            registered with the job manager.
+        """
+        now = time.time()
+        records = self._worker_recovery["nodes"]
+        stats = self._worker_recovery["stats"]
+
+        for host, record in list(records.items()):
+            if (
+                record["succeeded"]
+                and record["recovered_in"] is None
+                and host in registered_nodes
+            ):
+                record["recovered_in"] = int(now - record["started_at"])
+                stats["recovered"] += 1
+                stats["recovery_seconds"] += record["recovered_in"]
+                self._worker_recovery_updated = True
+                logger.info(
+                    "Workers on %s recovered in place after %ss",
+                    host, record["recovered_in"]
+                )
+
+            if now - record["started_at"] > WORKER_RECOVERY_COOLDOWN:
+                del records[host]
+                self._worker_recovery_updated = True
+
+    def get_worker_heartbeats(self) -> Dict[str, Dict]:
+        """Get the latest heartbeat received from each worker node, as
+        published by the headnode listener. Heartbeats older than
+        WORKER_HEARTBEAT_MAX_AGE seconds are ignored.
+
+        Returns:
+            heartbeats (Dict[str, Dict]): Mapping between hostname and
+            heartbeat.
+        """
+        try:
+            with open(WORKER_HEARTBEATS_FILE, "r", encoding="utf-8") as file:
+                heartbeats = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug("Unable to read worker heartbeats: %s", e)
+            return {}
+
+        now = time.time()
+        return {
+            host: heartbeat
+            for host, heartbeat in heartbeats.items()
+            if now - heartbeat["received_at"] < WORKER_HEARTBEAT_MAX_AGE
+        }
+
+    def get_local_workergroup_status(self) -> str:
+        """Get the status of the worker group running on this host.
+
+        Returns:
+            status (str): Worker group status (Not running, Running, Suspended)
+            or None if MJS is not running.
+        """
+        nodestatus_executable = self._get_nodestatus_executable()
+        args = ["-json"]
+        result = subprocess.run(
+            [nodestatus_executable, *args], capture_output=True, text=True
+        )
+
+        if result.returncode != 0:
+            logger.debug(
+                "Command nodestatus failed. Stdout: %s, Stderr: %s",
+                result.stdout.strip(),
+                result.stderr.strip(),
+            )
+            return None
+
+        try:
+            return json.loads(result.stdout)["workerGroup"]["status"]
+        except (json.JSONDecodeError, KeyError):
+            logger.debug("Error parsing nodestatus output data.")
+
+        return None
+
     def get_worker_nodes(self) -> Set[str]:
-        """Get the current worker nodes registered in the cluster.
+        """Get the current worker nodes registered with any job manager in
+        the cluster.
 
         Returns:
             nodes_hostnames (Set[str]): Hostnames of the nodes.
         """
-        data = self._get_resize_status_output()
-        if data:
-            return {worker["host"] for worker in data["workers"]}
-
-        return set()
+        return {
+            worker["host"]
+            for data in self._get_resize_status_outputs() or []
+            for worker in data["workers"]
+        }
 
     def is_mjs_running(self) -> bool:
         """Check if MJS is running or not.
@@ -151,10 +509,11 @@ class AbstractOSInterface(ABC):
 
         try:
             data = json.loads(result.stdout)
-            # Check if there is at least one job manager and get its status
-            if data.get("jobManagers") and len(data["jobManagers"]) > 0:
-                job_manager_status = data["jobManagers"][0].get("status", "").lower()
-                return job_manager_status == "running"
+            # Check if at least one job manager is running
+            return any(
+                job_manager.get("status", "").lower() == "running"
+                for job_manager in data.get("jobManagers") or []
+            )
         except json.JSONDecodeError:
             logger.debug("Error parsing nodestatus output data.")
 
@@ -177,29 +536,34 @@ class AbstractOSInterface(ABC):
         return True
 
     def stop_job_manager(self) -> bool:
-        """Stop the associated job manager.
+        """Stop all the job managers running on the headnode.
         Returns:
             status (bool): Exit status of the process.
             True indicates that it ran successfully.
         """
         stop_jobmanager_executable = self._get_stopjobmanager_executable()
+        status = True
         if self.is_jobmanager_running():
-            data = self._get_resize_status_output()
-            if data:
+            for data in self._get_resize_status_outputs() or []:
                 jobmanager = data["name"]
                 args = ["-name", jobmanager, "-cleanPreserveJobs"]
                 result = subprocess.run(
                     [stop_jobmanager_executable, *args], capture_output=True, text=True
                 )
                 if result.returncode != 0:
-                    return False
-        return True
+                    logger.debug("Failed to stop job manager %s", jobmanager)
+                    status = False
+        return status
 
-    def set_cluster_capacity(self, maximum_workers: int) -> bool:
-        """Update the job manager's maximum number of workers.
+    def set_cluster_capacity(
+        self, maximum_workers: int, job_managers: Iterable[str] = None
+    ) -> bool:
+        """Update the maximum number of workers of every job manager.
 
         Args:
             maximum_workers (int): Maximum number of workers.
+            job_managers (Iterable[str]): Names of the job managers, as read
+            by get_cluster_state. Read from the job managers if None.
 
         Returns:
             status (bool): Exit status of the process.
@@ -207,18 +571,31 @@ class AbstractOSInterface(ABC):
         """
         maxworkers_flag = self._get_maxworkers_flag()
 
-        executable = self._get_resize_executable()
-        args = ["update", maxworkers_flag, str(maximum_workers)]
+        if job_managers is None:
+            job_managers = [
+                data["name"] for data in self._get_resize_status_outputs() or []
+            ]
 
-        result = subprocess.run([executable, *args], capture_output=True)
-        if result.returncode != 0:
-            logger.debug(
-                "Command resizestatus failed. Stdout: %s, Stderr: %s",
-                result.stdout.strip(),
-                result.stderr.strip(),
-            )
+        executable = self._get_resize_executable()
+        status = True
+        for jobmanager in job_managers:
+            args = [
+                "update",
+                "-jobmanager", jobmanager,
+                maxworkers_flag, str(maximum_workers),
+            ]
+
+            result = subprocess.run([executable, *args], capture_output=True)
+            if result.returncode != 0:
+                logger.debug(
+                    "Command resize update failed for job manager %s. Stdout: %s, Stderr: %s",
+                    jobmanager,
+                    result.stdout.strip(),
+                    result.stderr.strip(),
+                )
+                status = False
 
-        return result.returncode == 0
+        return status
 
     def stop_workers_on_nodes(self, nodes_hostnames: Set[str]) -> Set[str]:
         """Asynchronously stop the workers on multiple remote hosts.
@@ -244,6 +621,71 @@ class AbstractOSInterface(ABC):
         }
         return nodes_stopped
 
+    def stop_workers_on_nodes_streaming(
+        self, nodes_hostnames: Set[str]
+    ) -> Iterator[Set[str]]:
+        """Asynchronously stop the workers on multiple remote hosts and yield
+        the nodes in small batches as soon as their workers are confirmed to
+        be stopped. Completions arriving within STOPWORKER_BATCH_WINDOW
+        seconds of each other are confirmed together, so a slow node does not
+        hold back the others. While nodes are still stopping, the job
+        managers are asked which workers are registered at most once every
+        STOPWORKER_CONFIRM_INTERVAL seconds.
+
+        Args:
+            nodes_hostnames (Set[str]):  Hostnames of the nodes.
+
+        Yields:
+            nodes_stopped (Set[str]): Hostnames of nodes that were stopped
+            since the previous batch.
+        """
+        loop = asyncio.get_event_loop()
+        tasks = {
+            loop.create_task(self._stop_workers_on_node(host)): host
+            for host in nodes_hostnames
+        }
+        pending = set(tasks)
+        hosts_stopped, confirm_at = set(), 0.0
+
+        try:
+            while pending or hosts_stopped:
+                if pending:
+                    # Stopped hosts wait for the next confirmation at most
+                    timeout = None
+                    if hosts_stopped:
+                        timeout = max(confirm_at - time.monotonic(), 0)
+                    done, pending = loop.run_until_complete(
+                        asyncio.wait(
+                            pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                        )
+                    )
+                    if done and pending:
+                        more_done, pending = loop.run_until_complete(
+                            asyncio.wait(pending, timeout=STOPWORKER_BATCH_WINDOW)
+                        )
+                        done |= more_done
+                    hosts_stopped |= {tasks[task] for task in done if task.result()}
+
+                if not hosts_stopped or (pending and time.monotonic() < confirm_at):
+                    continue
+
+                # Make sure the workers actually stopped.
+                current_hosts = self.get_worker_nodes()
+                confirm_at = time.monotonic() + STOPWORKER_CONFIRM_INTERVAL
+                nodes_stopped = hosts_stopped - current_hosts
+                hosts_stopped = set()
+                if nodes_stopped:
+                    yield nodes_stopped
+
+        finally:
+            # The caller stopped iterating early, do not leave tasks behind
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+
     def stop_workers_locally(self) -> bool:
         """Stops the workers running on the host.
         Returns:
@@ -304,16 +746,125 @@ class AbstractOSInterface(ABC):
         binaries."""
         return self._get_matlabroot() / "toolbox" / "parallel" / "bin"
 
+    def _combine_capacities(
+        self, capacities: Dict[str, ClusterCapacity]
+    ) -> ClusterCapacity:
+        """Combine the capacities of the job managers into the capacity of
+        the cluster.
+
+        Args:
+            capacities (Dict[str, ClusterCapacity]): Worker limits keyed by
+            job manager name.
+
+        Returns:
+            info (ClusterCapacity): Combined worker limits, or None if there
+            are none.
+        """
+        if capacities:
+            logger.debug("Job managers capacities: %s", capacities)
+            info = ClusterCapacity(
+                current_workers=sum(c.current_workers for c in capacities.values()),
+                desired_workers=sum(c.desired_workers for c in capacities.values()),
+                maximum_workers=min(c.maximum_workers for c in capacities.values()),
+            )
+            return info
+
+        return None
+
+    def _parse_cluster_state(self, job_managers: List[Dict]) -> ClusterState:
+        """Extract the cluster state from the resize status output.
+
+        Args:
+            job_managers (List[Dict]): resize status output of each job manager.
+
+        Returns:
+            state (ClusterState): Cluster capacity and idle durations, or None
+            if there is no capacity.
+        """
+        job_managers_capacity = self._parse_job_managers_capacity(job_managers)
+        capacity = self._combine_capacities(job_managers_capacity)
+        if capacity is None:
+            return None
+
+        nodes_workers = {}
+        for data in job_managers:
+            for worker in data["workers"]:
+                nodes_workers[worker["host"]] = nodes_workers.get(worker["host"], 0) + 1
+
+        return ClusterState(
+            capacity=capacity,
+            job_managers_capacity=job_managers_capacity,
+            nodes_seconds_idle=self._parse_nodes_idle_time(job_managers),
+            nodes_workers=nodes_workers,
+        )
+
+    def _parse_job_managers_capacity(
+        self, job_managers: List[Dict]
+    ) -> Dict[str, ClusterCapacity]:
+        """Extract the worker limits of each job manager from the resize
+        status output.
+
+        Args:
+            job_managers (List[Dict]): resize status output of each job manager.
+
+        Returns:
+            capacities (Dict[str, ClusterCapacity]): Worker limits keyed by
+            job manager name.
+        """
+        worker_os = self._get_worker_os()
+        if job_managers:
+            try:
+                capacities = {
+                    data["name"]: ClusterCapacity(
+                        current_workers=len(data["workers"]),
+                        desired_workers=data["desiredWorkers"][worker_os],
+                        maximum_workers=data["maxWorkers"][worker_os],
+                    )
+                    for data in job_managers
+                }
+                return capacities
+
+            except KeyError:
+                logger.error("Key error when accessing %s", job_managers)
+
+        return None
+
+    def _parse_nodes_idle_time(self, job_managers: List[Dict]) -> Dict[str, int]:
+        """Extract the idle duration of each node from the resize status
+        output.
+
+        Args:
+            job_managers (List[Dict]): resize status output of each job manager.
+
+        Returns:
+            seconds_idle (Dict[str, int]): Number of seconds each node has been
+            idle for.
+        """
+        seconds_idle = {}
+
+        for data in job_managers or []:
+            for worker in data["workers"]:
+                host = worker["host"]
+                idle_time = worker["secondsIdle"]
+                if host not in seconds_idle:
+                    seconds_idle[host] = idle_time
+                else:
+                    seconds_idle[host] = min(seconds_idle[host], idle_time)
+
+        return seconds_idle
+
     @abstractmethod
     def _get_resize_executable(self) -> Path:
         """Get the path of the resize executable"""
         pass
 
-    def _get_resize_status_output(self) -> Dict:
-        """Get the job manager's resize status output.
+    def _get_resize_status_outputs(self) -> List[Dict]:
+        """Get the resize status output of every job manager, parsed in a
+        single call.
 
         Returns:
-            data (Dict): resize status output.
+            data (List[Dict]): resize status output of each job manager, or
+            None if the command failed.
         """
         executable = self._get_resize_executable()
         args = ["status"]
@@ -321,8 +872,7 @@ class AbstractOSInterface(ABC):
         result = subprocess.run([executable, *args], capture_output=True)
         if result.returncode == 0:
             output = json.loads(result.stdout)
-            if output["jobManagers"]:
-                return output["jobManagers"].pop()
+            return output["jobManagers"]
 
         else:
             logger.debug(
@@ -333,11 +883,49 @@ class AbstractOSInterface(ABC):
 
         return None
 
+    async def _get_resize_status_outputs_async(self) -> List[Dict]:
+        """Get the resize status output of every job manager, running the
+        command as an asynchronous subprocess.
+
+        Returns:
+            data (List[Dict]): resize status output of each job manager, or
+            None if the command failed.
+        """
+        executable = self._get_resize_executable()
+        args = ["status"]
+
+        async with MJS_SEM:
+            proc = await asyncio.create_subprocess_exec(
+                executable,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate()
+
+        if proc.returncode == 0:
+            output = json.loads(stdout)
+            return output["jobManagers"]
+
+        else:
+            logger.debug(
+                "Command resizestatus failed. Stdout: %s, Stderr: %s",
+                stdout.decode().strip(),
+                stderr.decode().strip(),
+            )
+
+        return None
+
     @abstractmethod
     def _get_stopworker_executable(self) -> Path:
         """Get the path of the stopworker executable"""
         pass
 
+    @abstractmethod
+    def _get_startworker_executable(self) -> Path:
+        """Get the path of the startworker executable"""
+        pass
+
     @abstractmethod
     def _get_worker_os(self) -> str:
         """Get the worker operating system to look for in the resize status
@@ -367,6 +955,70 @@ class AbstractOSInterface(ABC):
 
         return statuses
 
+    def _is_nodestatus_cache_valid(
+        self, entry: Dict, node_state: str, now: float
+    ) -> bool:
+        """Check if a cached worker group status can be reused.
+
+        Args:
+            entry (Dict): Cache entry of the host, if any.
+            node_state (str): Current cloud state of the node.
+            now (float): Current time in seconds since the epoch.
+
+        Returns:
+            valid (bool): True if the host does not need to be probed.
+        """
+        if not entry or entry["state"] != node_state:
+            return False
+
+        if entry["timeouts"]:
+            return now < entry["retry_at"]
+
+        return now - entry["probed_at"] < NODESTATUS_CACHE_TTL
+
+    def _update_nodestatus_cache(
+        self, hostname: str, status: str, node_state: str, now: float
+    ) -> None:
+        """Record the result of a nodestatus probe.
+
+        Args:
+            hostname (str): Probed host.
+            status (str): Worker group status returned by the probe.
+            node_state (str): Cloud state of the node when it was probed.
+            now (float): Time of the probe in seconds since the epoch.
+        """
+        # A failed probe says nothing about the node, it is probed again on
+        # the next run
+        if status is None:
+            if self._nodestatus_cache.pop(hostname, None) is not None:
+                self._nodestatus_cache_updated = True
+            return
+
+        timeouts = 0
+        retry_at = now
+        if status == WORKERGROUP_UNREACHABLE:
+            entry = self._nodestatus_cache.get(hostname)
+            if entry and entry["state"] == node_state:
+                timeouts = entry["timeouts"]
+            timeouts += 1
+            backoff = min(
+                NODESTATUS_BACKOFF_BASE * 2 ** (timeouts - 1), NODESTATUS_BACKOFF_MAX
+            )
+            retry_at = now + backoff
+            logger.debug(
+                "Host %s timed out %d time(s) in a row, next probe in %ss",
+                hostname, timeouts, backoff
+            )
+
+        self._nodestatus_cache[hostname] = {
+            "status": status,
+            "state": node_state,
+            "probed_at": now,
+            "timeouts": timeouts,
+            "retry_at": retry_at,
+        }
+        self._nodestatus_cache_updated = True
+
     async def _get_workergroup_status(self, hostname: str) -> str:
         """Get the worker group status on a remote host.
 
@@ -374,7 +1026,9 @@ class AbstractOSInterface(ABC):
             hostname (str): Hostname to probe.
 
         Returns:
-            status (str): Worker group status (Not running, Running, Suspended)
+            status (str): Worker group status (Not running, Running, Suspended),
+            WORKERGROUP_UNREACHABLE if the command timed out or None if it
+            failed.
         """
         executable = self._get_nodestatus_executable()
         args = ["-json", "-remotehost", hostname]
@@ -408,9 +1062,73 @@ class AbstractOSInterface(ABC):
                     "Command %s %s timed-out after %ss.",
                     executable, args, NODESTATUS_TIMEOUT
                 )
+                return WORKERGROUP_UNREACHABLE
 
         return None
 
+    async def _restart_workers_on_node(
+        self, node_hostname: str, jobmanager: str, num_workers: int
+    ) -> bool:
+        """Stops the workers running on a node and starts new ones, within
+        WORKER_RECOVERY_TIMEOUT seconds.
+
+        Args:
+            node_hostname (str): Hostname of the node.
+            jobmanager (str): Name of the job manager the workers register with.
+            num_workers (int): Number of workers to start.
+
+        Returns:
+            status (bool): Exit status of the process.
+            True indicates that it ran successfully.
+        """
+        commands = [
+            (
+                self._get_stopworker_executable(),
+                ["-all", "-remotehost", node_hostname],
+            ),
+            (
+                self._get_startworker_executable(),
+                [
+                    "-jobmanagerhost", self._jobmanager_host,
+                    "-jobmanager", jobmanager,
+                    "-remotehost", node_hostname,
+                    "-num", str(num_workers),
+                ],
+            ),
+        ]
+        deadline = time.monotonic() + WORKER_RECOVERY_TIMEOUT
+
+        async with MJS_SEM:
+            for executable, args in commands:
+                proc = await asyncio.create_subprocess_exec(
+                    executable,
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(
+                        proc.communicate(), max(deadline - time.monotonic(), 0)
+                    )
+                    if proc.returncode != 0:
+                        logger.debug(
+                            "Worker recovery failed for host %s. Stdout: %s, Stderr: %s",
+                            node_hostname,
+                            stdout.decode().strip(),
+                            stderr.decode().strip(),
+                        )
+                        return False
+
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    logger.debug(
+                        "Worker recovery for host %s timed-out after %ss.",
+                        node_hostname, WORKER_RECOVERY_TIMEOUT
+                    )
+                    return False
+
+        return True
+
     async def _stop_workers_on_node(self, node_hostname: str) -> bool:
         """Stops the workers running on a node.
 
@@ -1,4 +1,4 @@
-# Copyright 2022-2025 The MathWorks, Inc.
+# Copyright 2022-2026 The MathWorks, Inc.
 
 from .os_interface import AbstractOSInterface
 
@@ -31,6 +31,10 @@ class WindowsInterface(AbstractOSInterface):
         """Get the path of the resize executable"""
         return self._get_parallel_bin_root() / "resize.bat"
 
+    def _get_startworker_executable(self) -> Path:
+        """Get the path of the startworker executable"""
+        return self._get_parallel_bin_root() / "startworker.bat"
+
     def _get_stopworker_executable(self) -> Path:
         """Get the path of the stopworker executable"""
         return self._get_parallel_bin_root() / "stopworker.bat"
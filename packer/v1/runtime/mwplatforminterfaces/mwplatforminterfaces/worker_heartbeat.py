@@ -0,0 +1,90 @@
+# Copyright 2026 The MathWorks, Inc.
+
+"""Encoding of the heartbeats that worker nodes push to the headnode.
+
+A heartbeat is a compact JSON document sent in a single UDP datagram. When a
+shared secret is available, the document is signed with HMAC-SHA256 so that
+the headnode only accepts heartbeats from nodes of the cluster.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+from typing import Dict
+
+logger = logging.getLogger("mwplatforminterfaces.worker_heartbeat")
+
+
+def read_secret(secret_file: str) -> bytes:
+    """Read the shared secret used to sign heartbeats.
+
+    Args:
+        secret_file (str): Path of the MJS shared secret file.
+
+    Returns:
+        secret (bytes): Content of the file, or None if it cannot be read.
+    """
+    if not secret_file:
+        return None
+
+    try:
+        with open(secret_file, "rb") as file:
+            return file.read()
+    except OSError as e:
+        logger.debug("Unable to read secret file %s: %s", secret_file, e)
+
+    return None
+
+
+def encode_heartbeat(heartbeat: Dict, secret: bytes = None) -> bytes:
+    """Serialize and sign a heartbeat.
+
+    Args:
+        heartbeat (Dict): Heartbeat content.
+        secret (bytes): Shared secret used to sign the heartbeat.
+
+    Returns:
+        datagram (bytes): Encoded heartbeat.
+    """
+    payload = json.dumps(heartbeat, separators=(",", ":"), sort_keys=True)
+    message = {"heartbeat": payload}
+    if secret:
+        message["signature"] = _sign(payload, secret)
+
+    return json.dumps(message, separators=(",", ":")).encode()
+
+
+def decode_heartbeat(datagram: bytes, secret: bytes = None) -> Dict:
+    """Deserialize a heartbeat and verify its signature.
+
+    Args:
+        datagram (bytes): Encoded heartbeat.
+        secret (bytes): Shared secret used to verify the heartbeat.
+
+    Returns:
+        heartbeat (Dict): Heartbeat content, or None if the datagram is
+        invalid or its signature does not match.
+    """
+    try:
+        message = json.loads(datagram)
+        payload = message["heartbeat"]
+        if secret and not hmac.compare_digest(
+            message.get("signature", ""), _sign(payload, secret)
+        ):
+            logger.debug("Discarding heartbeat with an invalid signature.")
+            return None
+
+        heartbeat = json.loads(payload)
+        if isinstance(heartbeat, dict) and heartbeat.get("host"):
+            return heartbeat
+
+    except (ValueError, KeyError, TypeError):
+        logger.debug("Discarding malformed heartbeat.")
+
+    return None
+
+
+def _sign(payload: str, secret: bytes) -> str:
+    """Compute the signature of a heartbeat payload."""
+    return hmac.new(secret, payload.encode(), hashlib.sha256).hexdigest()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+
+from mwplatforminterfaces import CloudInterface
+from mwplatforminterfaces import OSInterface
+from mwplatforminterfaces.constants import (
+    WORKER_HEARTBEAT_PORT,
+    WORKER_HEARTBEAT_INTERVAL,
+)
+from mwplatforminterfaces.worker_heartbeat import encode_heartbeat, read_secret
+
+from datetime import datetime
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+STATUS_SUCCESS = 0
+STATUS_FAILED = 1
+
+# Seconds between two queries of the local worker group status. Querying
+# nodestatus starts a JVM, so it is done less often than sending heartbeats.
+WORKERGROUP_POLL_INTERVAL = 60
+
+
+def main() -> int:
+    """Push heartbeats describing this worker node to the headnode listener.
+
+    Each heartbeat carries the worker group status, whether MJS is running,
+    the system load and whether the Spot Instance is marked for removal.
+
+    The following environment variables are required:
+        HEADNODE_LOCAL_IP: Private IP address of the headnode.
+        WORKER_HOSTNAME: Hostname of this node as registered with MJS.
+        SECRET_FILE: MJS shared secret file used to sign the heartbeats.
+
+    Returns:
+        status (int): Status code of program.
+                        0: Successful
+                        1: Faced an issue
+    """
+    try:
+        headnode_address = (os.environ["HEADNODE_LOCAL_IP"], WORKER_HEARTBEAT_PORT)
+        hostname = os.environ["WORKER_HOSTNAME"]
+    except KeyError as e:
+        print(f"Missing environment variable {e}.")
+        return STATUS_FAILED
+
+    secret = read_secret(os.environ.get("SECRET_FILE"))
+    if secret is None:
+        print("Shared secret not available, heartbeats will not be signed.")
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    os_interface = OSInterface()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    print(f"Sending heartbeats for {hostname} to {headnode_address[0]}:{headnode_address[1]} ...")
+    workergroup_status, last_poll = None, None
+    while not stop_event.is_set():
+        now = time.monotonic()
+        if last_poll is None or now - last_poll >= WORKERGROUP_POLL_INTERVAL:
+            workergroup_status = os_interface.get_local_workergroup_status()
+            last_poll = now
+
+        heartbeat = {
+            "host": hostname,
+            "sent_at": time.time(),
+            "workergroup": workergroup_status,
+            "mjs_running": workergroup_status is not None,
+            "load": round(os.getloadavg()[0], 2),
+            "spot_interruption": CloudInterface.is_spot_instance_marked_for_removal(),
+        }
+        try:
+            sock.sendto(encode_heartbeat(heartbeat, secret), headnode_address)
+        except OSError as e:
+            print(f"Failed to send heartbeat: {e}")
+
+        stop_event.wait(WORKER_HEARTBEAT_INTERVAL)
+
+    sock.close()
+    return STATUS_SUCCESS
+
+
+if __name__ == "__main__":
+    # Create logger
+    logger = logging.getLogger("mw.worker_status_agent")
+    log_file = "/var/log/mathworks/worker_status_agent.log"
+    log_handler = RotatingFileHandler(log_file, maxBytes=1e6, backupCount=5)
+    log_handler.terminator = ""
+    logger.addHandler(log_handler)
+    logger.setLevel(logging.INFO)
+    sys.stdout.write, sys.stderr.write = logger.info, logger.warning
+
+    print(f"## Starting: {datetime.now():%Y-%m-%d %H:%M:%S}")
+    status = main()
+    print(f"## Finished: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+
+    sys.exit(status)
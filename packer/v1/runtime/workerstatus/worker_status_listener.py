@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The MathWorks, Inc.
+
+from mwplatforminterfaces.constants import (
+    WORKER_HEARTBEAT_PORT,
+    WORKER_HEARTBEAT_MAX_AGE,
+    WORKER_HEARTBEATS_FILE,
+)
+from mwplatforminterfaces.worker_heartbeat import decode_heartbeat, read_secret
+
+from datetime import datetime
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+import signal
+import socket
+import sys
+import time
+
+STATUS_SUCCESS = 0
+STATUS_FAILED = 1
+
+# Seconds between two publications of the heartbeat table
+PUBLISH_INTERVAL = 5
+
+# Heartbeats older than this many seconds are removed from the table
+HEARTBEAT_RETENTION = 4 * WORKER_HEARTBEAT_MAX_AGE
+
+
+def main() -> int:
+    """Receive the heartbeats pushed by worker nodes and publish the latest
+    heartbeat of each node to WORKER_HEARTBEATS_FILE.
+
+    The heartbeat table is kept in memory and written atomically every
+    PUBLISH_INTERVAL seconds, so that the cluster management program can
+    read it without probing each worker node.
+
+    The SECRET_FILE environment variable points to the MJS shared secret
+    file used to verify the heartbeats.
+
+    Returns:
+        status (int): Status code of program.
+                        0: Successful
+                        1: Faced an issue
+    """
+    secret = read_secret(os.environ.get("SECRET_FILE"))
+    if secret is None:
+        print("Shared secret not available, heartbeats will not be verified.")
+
+    running = True
+
+    def stop(signum, frame):
+        nonlocal running
+        running = False
+
+    signal.signal(signal.SIGTERM, stop)
+
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(("", WORKER_HEARTBEAT_PORT))
+        sock.settimeout(1)
+    except OSError as e:
+        print(f"Failed to listen on port {WORKER_HEARTBEAT_PORT}: {e}")
+        return STATUS_FAILED
+
+    print(f"Listening for worker heartbeats on port {WORKER_HEARTBEAT_PORT} ...")
+    heartbeats, last_publish = {}, time.monotonic()
+    while running:
+        try:
+            datagram, _ = sock.recvfrom(4096)
+            heartbeat = decode_heartbeat(datagram, secret)
+            if heartbeat is not None:
+                heartbeat["received_at"] = time.time()
+                heartbeats[heartbeat["host"]] = heartbeat
+        except socket.timeout:
+            pass
+        except OSError as e:
+            print(f"Failed to receive heartbeat: {e}")
+
+        if time.monotonic() - last_publish >= PUBLISH_INTERVAL:
+            now = time.time()
+            heartbeats = {
+                host: heartbeat
+                for host, heartbeat in heartbeats.items()
+                if now - heartbeat["received_at"] < HEARTBEAT_RETENTION
+            }
+            publish_heartbeats(heartbeats)
+            last_publish = time.monotonic()
+
+    sock.close()
+    return STATUS_SUCCESS
+
+
+def publish_heartbeats(heartbeats: dict) -> None:
+    """Atomically replace the published heartbeat table."""
+    tmp_file = f"{WORKER_HEARTBEATS_FILE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(WORKER_HEARTBEATS_FILE), exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as file:
+            json.dump(heartbeats, file, separators=(",", ":"))
+        os.replace(tmp_file, WORKER_HEARTBEATS_FILE)
+    except OSError as e:
+        print(f"Failed to publish heartbeats: {e}")
+
+
+if __name__ == "__main__":
+    # Create logger
+    logger = logging.getLogger("mw.worker_status_listener")
+    log_file = "/var/log/mathworks/worker_status_listener.log"
+    log_handler = RotatingFileHandler(log_file, maxBytes=1e6, backupCount=5)
+    log_handler.terminator = ""
+    logger.addHandler(log_handler)
+    logger.setLevel(logging.INFO)
+    sys.stdout.write, sys.stderr.write = logger.info, logger.warning
+
+    print(f"## Starting: {datetime.now():%Y-%m-%d %H:%M:%S}")
+    status = main()
+    print(f"## Finished: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+
+    sys.exit(status)
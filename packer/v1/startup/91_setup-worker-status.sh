@@ -0,0 +1,27 @@
+#!/usr/bin/env bash
+
+# Copyright 2026 The MathWorks, Inc.
+
+PS4='+ [\d \t] '
+set -x
+
+# Worker nodes push their status to a listener on the headnode, which lets the
+# cluster management program avoid probing each worker node remotely.
+WORKER_STATUS_ENV_FILE=/opt/mathworks/workerstatus/workerstatus.env
+
+echo "SECRET_FILE=${SECRET_FILE}" > "${WORKER_STATUS_ENV_FILE}"
+
+if [[ "${NODE_TYPE}" == 'HEADNODE' ]]; then
+    echo "Enabling worker status listener service ..."
+
+    systemctl enable workerstatuslistener.service
+    systemctl start workerstatuslistener.service
+else
+    echo "Enabling worker status agent service ..."
+
+    echo "HEADNODE_LOCAL_IP=${HEADNODE_LOCAL_IP}" >> "${WORKER_STATUS_ENV_FILE}"
+    echo "WORKER_HOSTNAME=${INTERNAL_HOSTNAME}" >> "${WORKER_STATUS_ENV_FILE}"
+
+    systemctl enable workerstatusagent.service
+    systemctl start workerstatusagent.service
+fi
@@ -29,6 +29,8 @@ if [[ ${NODE_TYPE} == 'HEADNODE' ]]; then
        --arg policy "$termination_policy" \
        --arg mjs_status_log_file "${MJS_STATUS_LOG_FILE}" \
        --arg dns_search_suffix "${DNS_SEARCH_SUFFIX}" \
+       --arg jobmanager_host "${EXTERNAL_HOSTNAME}" \
+       --arg license_server "${MLM_LICENSE_FILE}" \
        --argjson auto_termination_flag $auto_termination_flag \
        --argjson use_private_ip_mapping $use_private_ip_mapping \
        '.config.initial_desired_capacity=$desired_cap |
@@ -37,6 +39,9 @@ if [[ ${NODE_TYPE} == 'HEADNODE' ]]; then
         .config.mjs_status_log_file=$mjs_status_log_file |
         .config.autotermination_enabled=$auto_termination_flag |
         .config.dns_search_suffix=$dns_search_suffix |
+        .config.jobmanager_host=$jobmanager_host |
+        .config.license_server=$license_server |
+        .config.license_source=(if $license_server != "" then "lmstat" else .config.license_source end) |
         .config.use_private_ip_mapping=$use_private_ip_mapping' \
        ${CLUSTER_MANAGEMENT_DATA_FILE} > tmp.$$.json && mv tmp.$$.json ${CLUSTER_MANAGEMENT_DATA_FILE}
 
@@ -56,6 +61,12 @@ if [[ ${NODE_TYPE} == 'HEADNODE' ]]; then
        '.config.autoscaling_enabled=$flag' \
        ${CLUSTER_MANAGEMENT_DATA_FILE} > temp.json && mv temp.json ${CLUSTER_MANAGEMENT_DATA_FILE}
 
-    systemctl enable clustermanagement.timer
-    systemctl start clustermanagement.timer
+    # Run the cluster management program either continuously or every minute
+    if [[ $(jq -r '.config.daemon_mode_enabled' ${CLUSTER_MANAGEMENT_DATA_FILE}) == 'true' ]]; then
+        systemctl enable clustermanagement-daemon.service
+        systemctl start clustermanagement-daemon.service
+    else
+        systemctl enable clustermanagement.timer
+        systemctl start clustermanagement.timer
+    fi
 fi
\ No newline at end of file